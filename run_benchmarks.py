@@ -0,0 +1,52 @@
+import argparse
+import sys
+
+from src.card_duel.benchmarks import (
+    DEFAULT_SAMPLES,
+    DEFAULT_TOLERANCE,
+    compare,
+    default_benchmarks,
+    format_report,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Engine hot path benchmarks")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--filter", default=None,
+                        help="run only benchmarks whose name contains this text")
+    parser.add_argument("--no-alloc", action="store_true",
+                        help="skip the (slow) tracemalloc allocation pass")
+    parser.add_argument("--baseline", default=None,
+                        help="compare against this baseline JSON file")
+    parser.add_argument("--save", default=None,
+                        help="write the results as a new baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative slowdown before flagging a regression")
+    args = parser.parse_args()
+
+    results = run_benchmarks(default_benchmarks(),
+                             samples=args.samples,
+                             measure_allocations=not args.no_alloc,
+                             name_filter=args.filter)
+    comparisons = []
+    if args.baseline:
+        comparisons = compare(results, load_baseline(args.baseline), args.tolerance)
+    print(format_report(results, comparisons))
+
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"Baseline saved to {args.save}")
+
+    regressions = [comparison.name for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"Regressions: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
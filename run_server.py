@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+
+from src.card_duel.bots import RandomBot, GreedyBot
+from src.card_duel.catalog_loader import load_catalog
+from src.card_duel.server.match_server import DEFAULT_ACTION_TIMEOUT, MatchServer
+from src.card_duel.static_decks import make_static_decks
+
+
+BOTS = {
+    "random": RandomBot,
+    "greedy": GreedyBot,
+}
+
+
+def make_deck_factory(args: argparse.Namespace):
+    if not args.catalog:
+        return make_static_decks
+    catalog = load_catalog(args.catalog, cache_path=args.catalog_cache)
+    names = args.decks or catalog.deck_names()[:2]
+    if len(names) != 2:
+        raise ValueError("The catalog needs two decks (or pass --decks)")
+    deck_a, deck_b = names
+    return lambda: (catalog.deck(deck_a), catalog.deck(deck_b))
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = MatchServer(deck_factory=make_deck_factory(args),
+                         bot_factory=BOTS[args.bot],
+                         action_timeout=args.action_timeout,
+                         seed=args.seed)
+    if args.unix:
+        listener = await server.start_unix(args.unix)
+        print(f"Listening on {args.unix}")
+    else:
+        listener = await server.start_tcp(args.host, args.port)
+        host, port = listener.sockets[0].getsockname()[:2]
+        print(f"Listening on {host}:{port}")
+
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Asyncio match server (JSON lines)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None, help="Unix socket path instead of TCP")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="random")
+    parser.add_argument("--action-timeout", type=float, default=DEFAULT_ACTION_TIMEOUT)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--catalog", nargs="+", default=None,
+                        help="card/deck files (.json/.csv) instead of the static decks")
+    parser.add_argument("--catalog-cache", default=None,
+                        help="binary cache file reused while the catalog files are unchanged")
+    parser.add_argument("--decks", nargs=2, default=None, metavar=("DECK_A", "DECK_B"),
+                        help="deck names from the catalog (default: first two)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import time
+
+from src.card_duel.bots import RandomBot, GreedyBot
+from src.card_duel.mcts import MCTSBot
+from src.card_duel.simulation import simulate_matches
+from src.card_duel.static_decks import make_static_decks
+
+
+BOTS = {
+    "random": RandomBot,
+    "greedy": GreedyBot,
+    "mcts": MCTSBot,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless bot vs bot simulation")
+    parser.add_argument("--matches", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--bot", choices=sorted(BOTS), default="random",
+                        help="mcts sees the opponent's hand (perfect information)")
+    parser.add_argument("--bulk-shuffle", action="store_true",
+                        help="generate deck permutations in bulk (NumPy)")
+    args = parser.parse_args()
+
+    deck1, deck2 = make_static_decks()
+    # obie strony stołu, żeby wyrównać przewagę rozpoczynającego
+    deck_pairs = [(deck1, deck2), (deck2, deck1)]
+
+    started = time.perf_counter()
+    result = simulate_matches(deck_pairs,
+                              bot_factory=BOTS[args.bot],
+                              seed=args.seed,
+                              n_matches=args.matches,
+                              workers=args.workers,
+                              chunk_size=args.chunk_size,
+                              bulk_shuffle=args.bulk_shuffle)
+    elapsed = time.perf_counter() - started
+
+    print(f"Matches: {result.matches} in {elapsed:.2f}s "
+          f"({result.matches / max(elapsed, 1e-9):.0f}/s)")
+    print(f"Draws: {result.draws}")
+    print(f"Rounds played: {result.rounds_played}")
+    for deck in (deck1, deck2):
+        print(f"{deck.name}: win rate {result.win_rate(deck.name):.3f}, "
+              f"avg final power {result.average_final_power(deck.name):.1f}")
+
+
+if __name__ == "__main__":
+    main()
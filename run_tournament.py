@@ -0,0 +1,80 @@
+import argparse
+import time
+
+from src.card_duel.bots import GreedyBot, RandomBot
+from src.card_duel.catalog_loader import load_catalog
+from src.card_duel.mcts import MCTSBot
+from src.card_duel.static_decks import get_static_catalog
+from src.card_duel.tournament import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_GAMES_PER_PAIRING,
+    MODES,
+    ROUND_ROBIN,
+    Entrant,
+    Tournament,
+    format_table,
+)
+
+
+BOTS = {
+    "random": RandomBot,
+    "greedy": GreedyBot,
+    "mcts": MCTSBot,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deck/bot tournament with Elo and Glicko ratings")
+    parser.add_argument("--catalog", nargs="+", default=None,
+                        help="card/deck files (.json/.csv); default: the static decks")
+    parser.add_argument("--catalog-cache", default=None)
+    parser.add_argument("--decks", nargs="+", default=None,
+                        help="deck names to enter (default: every deck in the catalog)")
+    parser.add_argument("--bots", nargs="+", choices=sorted(BOTS), default=["random"],
+                        help="each deck plays once with each of these bots "
+                             "(mcts sees the opponent's hand)")
+    parser.add_argument("--mode", choices=MODES, default=ROUND_ROBIN)
+    parser.add_argument("--rounds", type=int, default=None, help="Swiss rounds")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES_PER_PAIRING,
+                        help="games per pairing")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--results", default=None,
+                        help="stream finished chunks to this JSON lines file")
+    parser.add_argument("--report-every", type=int, default=0,
+                        help="print the standings every N finished chunks")
+    args = parser.parse_args()
+
+    if args.catalog:
+        catalog = load_catalog(args.catalog, cache_path=args.catalog_cache)
+    else:
+        catalog = get_static_catalog()
+    entrants = [Entrant(f"{deck_name}/{bot}", catalog.deck(deck_name), BOTS[bot])
+                for deck_name in (args.decks or catalog.deck_names())
+                for bot in args.bots]
+
+    tournament = Tournament(entrants,
+                            games_per_pairing=args.games,
+                            mode=args.mode,
+                            rounds=args.rounds,
+                            seed=args.seed,
+                            workers=args.workers,
+                            chunk_size=args.chunk_size,
+                            results_path=args.results)
+
+    started = time.perf_counter()
+    games = 0
+    for chunk in tournament.results():
+        games += chunk.games
+        if args.report_every and tournament.chunks_done % args.report_every == 0:
+            print(f"\n{games} games, {time.perf_counter() - started:.1f}s")
+            print(format_table(tournament.table()))
+    elapsed = time.perf_counter() - started
+
+    print(f"\nGames: {games} in {elapsed:.2f}s ({games / max(elapsed, 1e-9):.0f}/s)")
+    print(format_table(tournament.table()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+from typing import NamedTuple, Optional, Tuple
+
+from src.card_duel.card import RowAffinity
+
+
+PLAY = "play"
+PASS = "pass"
+
+
+class Action(NamedTuple):
+    """Akcja aktywnego gracza: PLAY (karta z ręki do rzędu) albo PASS."""
+    kind: str
+    card_index: Optional[int] = None
+    row_affinity: Optional[RowAffinity] = None
+
+
+def play_action(card_index: int, row_affinity: RowAffinity) -> Action:
+    return Action(PLAY, card_index, row_affinity)
+
+
+PASS_ACTION = Action(PASS)
+
+
+ROW_LANES = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+_ROWS_BY_AFFINITY = {affinity: (affinity,) for affinity in ROW_LANES}
+_ROWS_BY_AFFINITY[RowAffinity.ANY] = ROW_LANES
+
+
+def rows_for_affinity(affinity: RowAffinity) -> Tuple[RowAffinity, ...]:
+    """Rzędy, do których wolno zagrać kartę (ANY – każdy rząd)."""
+    return _ROWS_BY_AFFINITY[affinity]
@@ -0,0 +1,343 @@
+import numpy as np
+from typing import List, Sequence
+
+from src.card_duel.card import RowAffinity
+from src.card_duel.catalog import CardCatalog
+from src.card_duel.game import Game
+
+
+ROW_LANES = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+ROW_INDEX = {affinity: idx for idx, affinity in enumerate(ROW_LANES)}
+_LANE_AFFINITY = np.array([affinity.value for affinity in ROW_LANES], np.int8)
+NO_PLAYER = -1
+N_PLAYERS = 2
+
+
+class BatchGame:
+    """
+    N dwuosobowych gier trzymanych w tablicach NumPy o stałym kształcie.
+
+    Gracz to indeks 0/1 (kolejność Game.player_order), rzędy to indeksy
+    0/1/2 (MELEE, RANGED, SIEGE). Akcje play_card/pass_turn dotyczą zawsze
+    aktywnego gracza danej gry i są wykonywane naraz dla wszystkich gier
+    z maski. Semantyka odpowiada 1:1 klasom Game/Player/Board/Rules,
+    więc serialize_game(i) daje ten sam słownik co Game.serialize().
+    """
+
+    def __init__(self,
+                 n_games: int,
+                 player_ids: Sequence[int] = (1, 2),
+                 hand_capacity: int = 32,
+                 deck_capacity: int = 64,
+                 row_capacity: int = 32,
+                 rounds_to_win: int = 2) -> None:
+
+        if n_games <= 0:
+            raise ValueError("BatchGame requires at least one game")
+        if len(player_ids) != N_PLAYERS:
+            raise ValueError("Current implementation supports "
+                             "exactly 2 players")
+
+        shape_players = (n_games, N_PLAYERS)
+
+        self.n_games = n_games
+        self.player_ids: List[List[int]] = [list(player_ids)
+                                            for _ in range(n_games)]
+        self.deck_names: List[List[str]] = [["", ""] for _ in range(n_games)]
+        self.catalog = CardCatalog()
+
+        self.hand_ids = np.zeros(shape_players + (hand_capacity,), np.int64)
+        self.hand_power = np.zeros(shape_players + (hand_capacity,), np.int64)
+        self.hand_affinity = np.zeros(shape_players + (hand_capacity,), np.int8)
+        self.hand_count = np.zeros(shape_players, np.int32)
+
+        self.deck_ids = np.zeros(shape_players + (deck_capacity,), np.int64)
+        self.deck_power = np.zeros(shape_players + (deck_capacity,), np.int64)
+        self.deck_affinity = np.zeros(shape_players + (deck_capacity,), np.int8)
+        self.deck_count = np.zeros(shape_players, np.int32)
+
+        self.row_ids = np.zeros(shape_players + (len(ROW_LANES), row_capacity),
+                                np.int64)
+        self.row_count = np.zeros(shape_players + (len(ROW_LANES),), np.int32)
+        self.row_power = np.zeros(shape_players + (len(ROW_LANES),), np.int64)
+
+        self.has_passed = np.zeros(shape_players, bool)
+        self.rounds_won = np.zeros(shape_players, np.int32)
+        self.rounds_to_win = np.full(n_games, rounds_to_win, np.int32)
+
+        self.active = np.full(n_games, NO_PLAYER, np.int8)
+        self.starting = np.zeros(n_games, np.int8)
+        self.current_round = np.zeros(n_games, np.int32)
+        self.round_active = np.zeros(n_games, bool)
+
+    # --- wczytywanie / zapis --------------------------------------------------
+
+    @classmethod
+    def from_games(cls, games: Sequence[Game]) -> "BatchGame":
+        """Buduje batch z istniejących obiektów Game (stan 1:1)."""
+        if not games:
+            raise ValueError("BatchGame requires at least one game")
+
+        hand_capacity = 1
+        deck_capacity = 1
+        for game in games:
+            if len(game.player_order) != N_PLAYERS:
+                raise ValueError("Current implementation supports "
+                                 "exactly 2 players")
+            for player in game.players.values():
+                on_board = sum(len(row) for row in
+                               game.board.rows_by_player[player.id].values())
+                total = len(player.hand) + len(player.deck) + on_board
+                hand_capacity = max(hand_capacity, total)
+                deck_capacity = max(deck_capacity, len(player.deck))
+
+        batch = cls(len(games),
+                    hand_capacity=hand_capacity,
+                    deck_capacity=deck_capacity,
+                    row_capacity=hand_capacity)
+
+        for g, game in enumerate(games):
+            batch._load_game(g, game)
+        return batch
+
+    def _load_game(self, g: int, game: Game) -> None:
+        self.player_ids[g] = list(game.player_order)
+        self.rounds_to_win[g] = game.rules.rounds_to_win
+
+        for p, player_id in enumerate(game.player_order):
+            player = game.players[player_id]
+            self.deck_names[g][p] = player.deck.name
+
+            for slot, card in enumerate(player.hand):
+                card = self.catalog.register(card)
+                self.hand_ids[g, p, slot] = card.id
+                self.hand_power[g, p, slot] = card.base_power
+                self.hand_affinity[g, p, slot] = card.row_affinity.value
+            self.hand_count[g, p] = len(player.hand)
+
+            for slot, card in enumerate(player.deck.cards):
+                card = self.catalog.register(card)
+                self.deck_ids[g, p, slot] = card.id
+                self.deck_power[g, p, slot] = card.base_power
+                self.deck_affinity[g, p, slot] = card.row_affinity.value
+            self.deck_count[g, p] = len(player.deck)
+
+            for r, affinity in enumerate(ROW_LANES):
+                row = game.board.get_row(player_id, affinity)
+                for slot, card in enumerate(row.cards):
+                    card = self.catalog.register(card)
+                    self.row_ids[g, p, r, slot] = card.id
+                self.row_count[g, p, r] = len(row)
+                self.row_power[g, p, r] = row.total_power()
+
+            self.has_passed[g, p] = player.has_passed
+            self.rounds_won[g, p] = player.rounds_won
+
+        order = game.player_order
+        self.active[g] = (NO_PLAYER if game.active_player_id is None
+                          else order.index(game.active_player_id))
+        self.starting[g] = order.index(game.starting_player_id)
+        self.current_round[g] = game.current_round
+        self.round_active[g] = game.is_round_active
+
+    def serialize_game(self, g: int) -> dict:
+        """Słownik w formacie Game.serialize() dla gry o indeksie g."""
+        player_ids = self.player_ids[g]
+        card = self.catalog.get
+
+        players = []
+        rows = {}
+        for p, player_id in enumerate(player_ids):
+            hand = [card(int(card_id)).serialize()
+                    for card_id in self.hand_ids[g, p, :self.hand_count[g, p]]]
+            players.append({
+                "id": player_id,
+                "deck": self.deck_names[g][p],
+                "hand": hand,
+                "rounds_won": int(self.rounds_won[g, p]),
+                "has_passed": bool(self.has_passed[g, p]),
+            })
+            rows[player_id] = {
+                affinity.name: [
+                    card(int(card_id)).serialize()
+                    for card_id in self.row_ids[g, p, r, :self.row_count[g, p, r]]
+                ]
+                for r, affinity in enumerate(ROW_LANES)
+            }
+
+        active = int(self.active[g])
+        return {
+            "players": players,
+            "board": {"player_ids": list(player_ids), "rows": rows},
+            "rules": {"rounds_to_win": int(self.rounds_to_win[g])},
+            "current_round": int(self.current_round[g]),
+            "active_player_id": None if active == NO_PLAYER else player_ids[active],
+            "starting_player_id": player_ids[int(self.starting[g])],
+            "is_round_active": bool(self.round_active[g]),
+        }
+
+    # --- przebieg meczu -------------------------------------------------------
+
+    def _games(self, mask) -> np.ndarray:
+        if mask is None:
+            return np.arange(self.n_games)
+        return np.flatnonzero(np.asarray(mask, bool))
+
+    def _clear_rows(self, g: np.ndarray) -> None:
+        self.row_count[g] = 0
+        self.row_power[g] = 0
+
+    def start_match(self, mask=None) -> None:
+        g = self._games(mask)
+        self.current_round[g] = 0
+        self.round_active[g] = False
+        self._clear_rows(g)
+        self.active[g] = 0
+        self.starting[g] = 0
+        self.has_passed[g] = False
+        self.rounds_won[g] = 0
+
+    def start_round(self, mask=None) -> None:
+        g = self._games(mask)
+        self.current_round[g] += 1
+        self.round_active[g] = True
+        self.has_passed[g] = False
+
+        alternate = g[self.current_round[g] > 1]
+        self.starting[alternate] = 1 - self.starting[alternate]
+
+        self.active[g] = self.starting[g]
+        self._clear_rows(g)
+
+    def draw(self, n: int, mask=None) -> None:
+        """Odpowiednik Player.draw_from_deck(n) dla obu graczy."""
+        if n < 0:
+            raise ValueError
+        g_all = self._games(mask)
+        hand_capacity = self.hand_ids.shape[2]
+        # sprawdzenie przed jakąkolwiek zmianą – błąd nie zostawia
+        # częściowo dobranych kart w żadnej grze
+        drawn = np.minimum(n, self.deck_count[g_all])
+        if (self.hand_count[g_all] + drawn > hand_capacity).any():
+            raise ValueError("Hand capacity exceeded")
+
+        for _ in range(n):
+            for p in range(N_PLAYERS):
+                g = g_all[self.deck_count[g_all, p] > 0]
+                if g.size == 0:
+                    continue
+
+                top = self.deck_count[g, p] - 1
+                slot = self.hand_count[g, p]
+                self.hand_ids[g, p, slot] = self.deck_ids[g, p, top]
+                self.hand_power[g, p, slot] = self.deck_power[g, p, top]
+                self.hand_affinity[g, p, slot] = self.deck_affinity[g, p, top]
+                self.hand_count[g, p] += 1
+                self.deck_count[g, p] -= 1
+
+    def play_card(self, card_index, row_index, mask=None) -> None:
+        """
+        Aktywny gracz w każdej grze z maski gra kartę hand[card_index]
+        do rzędu row_index zgodnego z jej row_affinity. Przy błędnej akcji w którejkolwiek grze rzuca
+        ValueError i nie zmienia stanu żadnej gry.
+        """
+        g = self._games(mask)
+        card_index = np.broadcast_to(np.asarray(card_index, np.int64),
+                                     (self.n_games,))[g]
+        row_index = np.broadcast_to(np.asarray(row_index, np.int64),
+                                    (self.n_games,))[g]
+        a = self.active[g].astype(np.int64)
+        a_safe = np.maximum(a, 0)
+
+        count = self.hand_count[g, a_safe]
+        # ujemny indeks działa jak dla listy w Player.play_card
+        card_index = np.where(card_index < 0, card_index + count, card_index)
+
+        invalid = ((a == NO_PLAYER)
+                   | self.has_passed[g, a_safe]
+                   | ~self.round_active[g]
+                   | (card_index < 0) | (card_index >= count)
+                   | (row_index < 0) | (row_index >= len(ROW_LANES)))
+        if invalid.any():
+            raise ValueError(f"Invalid play in games {g[invalid][:10].tolist()}")
+        # jak Game.play_card: karta tylko do swojego rzędu (ANY – każdy)
+        affinity = self.hand_affinity[g, a, card_index]
+        wrong_row = ((affinity != RowAffinity.ANY.value)
+                     & (affinity != _LANE_AFFINITY[row_index]))
+        if wrong_row.any():
+            raise ValueError(f"Card played to wrong row in games "
+                             f"{g[wrong_row][:10].tolist()}")
+
+        row_slot = self.row_count[g, a, row_index]
+        if (row_slot >= self.row_ids.shape[3]).any():
+            raise ValueError("Row capacity exceeded")
+
+        card_ids = self.hand_ids[g, a, card_index]
+        powers = self.hand_power[g, a, card_index]
+
+        self._remove_from_hand(g, a, card_index)
+
+        self.row_ids[g, a, row_index, row_slot] = card_ids
+        self.row_count[g, a, row_index] += 1
+        self.row_power[g, a, row_index] += powers
+
+        self._finish_turn(g, a)
+
+    def _remove_from_hand(self, g: np.ndarray, a: np.ndarray,
+                          position: np.ndarray) -> None:
+        # jak Hand.remove_at: karty za position przesuwają się o jedno w lewo
+        columns = np.arange(self.hand_ids.shape[2] - 1)
+        source = columns[None, :] + (columns[None, :] >= position[:, None])
+        for array in (self.hand_ids, self.hand_power, self.hand_affinity):
+            array[g, a, :-1] = np.take_along_axis(array[g, a], source, axis=1)
+        self.hand_count[g, a] -= 1
+
+    def pass_turn(self, mask=None) -> None:
+        g = self._games(mask)
+        a = self.active[g].astype(np.int64)
+
+        invalid = (a == NO_PLAYER) | ~self.round_active[g]
+        if invalid.any():
+            raise ValueError(f"Invalid pass in games {g[invalid][:10].tolist()}")
+
+        self.has_passed[g, a] = True
+        self._finish_turn(g, a)
+
+    def _finish_turn(self, g: np.ndarray, a: np.ndarray) -> None:
+        over = self.has_passed[g].all(axis=1)
+        self.end_round(g[over])
+        # jak Game.next_player_id: spasowany przeciwnik jest pomijany
+        opponent_passed = self.has_passed[g, 1 - a]
+        following = np.where(opponent_passed, a, 1 - a)
+        self.active[g[~over]] = following[~over]
+
+    def end_round(self, games: np.ndarray) -> None:
+        g = np.asarray(games, np.int64)
+        winner = self.get_round_winner_index()[g]
+        won = winner != NO_PLAYER
+        self.rounds_won[g[won], winner[won]] += 1
+        self.round_active[g] = False
+        self.active[g] = NO_PLAYER
+
+    # --- odpowiedniki Rules ---------------------------------------------------
+
+    def total_power(self) -> np.ndarray:
+        """Moc na planszy, kształt (n_games, 2)."""
+        return self.row_power.sum(axis=2)
+
+    def is_round_over(self) -> np.ndarray:
+        return self.has_passed.all(axis=1)
+
+    def get_round_winner_index(self) -> np.ndarray:
+        """Indeks zwycięzcy rundy (0/1) albo NO_PLAYER przy remisie."""
+        totals = self.total_power()
+        return np.where(totals[:, 0] > totals[:, 1], 0,
+                        np.where(totals[:, 1] > totals[:, 0], 1, NO_PLAYER))
+
+    def is_match_over(self) -> np.ndarray:
+        return (self.rounds_won >= self.rounds_to_win[:, None]).any(axis=1)
+
+    def get_match_winner_index(self) -> np.ndarray:
+        qualified = self.rounds_won >= self.rounds_to_win[:, None]
+        single = qualified.sum(axis=1) == 1
+        return np.where(single, qualified.argmax(axis=1), NO_PLAYER)
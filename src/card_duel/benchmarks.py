@@ -0,0 +1,335 @@
+import gc
+import itertools
+import json
+import platform
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+from src.card_duel.board import Board
+from src.card_duel.bots import GreedyBot, RandomBot
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.deck import Deck
+from src.card_duel.game import Game
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+from src.card_duel.simulation import run_single_match
+
+
+DECK_SIZES = (10, 40, 200)
+ROW_SIZES = (1, 10, 50)
+DEFAULT_SAMPLES = 200
+MIN_SAMPLES = 5
+# alokacje mierzymy osobno (tracemalloc mocno spowalnia) na kilku próbkach
+ALLOC_SAMPLES = 10
+# spadek ops/s o więcej niż 15% względem bazy = regresja
+DEFAULT_TOLERANCE = 0.15
+# drobne wahania alokacji (np. wewnętrzne bufory) nie są regresją
+ALLOC_SLACK_BYTES = 256
+BASELINE_VERSION = 1
+
+AFFINITIES = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+
+# setup() buduje świeży stan (poza pomiarem) i zwraca operację do zmierzenia
+Setup = Callable[[], Callable[[], object]]
+
+
+class Benchmark:
+    """
+    Przypadek benchmarku. Jedna próbka = setup() + zmierzone wywołanie
+    operacji, która wykonuje inner operacji (tanie operacje w pętli,
+    żeby narzut pomiaru nie dominował). cost > 1 zmniejsza liczbę próbek
+    dla drogich przypadków (całe mecze).
+    """
+
+    def __init__(self, name: str, setup: Setup, inner: int = 1, cost: int = 1) -> None:
+        self.name = name
+        self.setup = setup
+        self.inner = inner
+        self.cost = cost
+
+
+class BenchmarkResult:
+    def __init__(self,
+                 name: str,
+                 ops: int,
+                 total_ns: int,
+                 median_ns: float,
+                 alloc_bytes: Optional[float] = None) -> None:
+        self.name = name
+        self.ops = ops
+        self.total_ns = total_ns
+        # mediana czasu jednej operacji
+        self.median_ns = median_ns
+        # średni szczyt pamięci zaalokowanej przez jedną operację (None = nie mierzono)
+        self.alloc_bytes = alloc_bytes
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops * 1e9 / self.total_ns if self.total_ns else 0.0
+
+    def serialize(self) -> dict:
+        return {
+            "ops": self.ops,
+            "ops_per_sec": self.ops_per_sec,
+            "median_ns": self.median_ns,
+            "alloc_bytes": self.alloc_bytes,
+        }
+
+
+class Comparison:
+    """Wynik względem bazy: ratio > 1 = szybciej niż w bazie."""
+
+    def __init__(self, name: str, baseline: dict, result: BenchmarkResult,
+                 tolerance: float) -> None:
+        self.name = name
+        self.baseline_ops_per_sec: float = baseline["ops_per_sec"]
+        self.ops_per_sec = result.ops_per_sec
+        self.ratio = (self.ops_per_sec / self.baseline_ops_per_sec
+                      if self.baseline_ops_per_sec else float("inf"))
+        self.slower = self.ratio < 1.0 - tolerance
+        base_alloc = baseline.get("alloc_bytes")
+        self.more_allocations = (result.alloc_bytes is not None and base_alloc is not None
+                                 and result.alloc_bytes > base_alloc * (1.0 + tolerance)
+                                 + ALLOC_SLACK_BYTES)
+
+    @property
+    def regressed(self) -> bool:
+        return self.slower or self.more_allocations
+
+
+# --- przypadki ---
+
+def make_cards(n: int, first_id: int = 1) -> List[Card]:
+    return [Card(card_id, f"Card {card_id}", 1 + card_id % 10,
+                 AFFINITIES[card_id % 3], set())
+            for card_id in range(first_id, first_id + n)]
+
+
+def make_board(row_size: int) -> Board:
+    """Plansza dwóch graczy z row_size kartami w każdym rzędzie."""
+    board = Board([1, 2])
+    for player_id in (1, 2):
+        for row_index, affinity in enumerate(AFFINITIES):
+            first_id = (player_id * 3 + row_index) * 1000
+            for card in make_cards(row_size, first_id):
+                board.place_card(player_id, card, affinity)
+    return board
+
+
+def make_game(row_size: int) -> Game:
+    players = [Player(player_id, Deck(f"Deck {player_id}", make_cards(10)))
+               for player_id in (1, 2)]
+    game = Game(players, make_board(row_size), Rules(rounds_to_win=2))
+    for player in players:
+        player.draw_from_deck(5)
+    return game
+
+
+def _deck_shuffle(deck_size: int) -> Setup:
+    deck = Deck("Bench", make_cards(deck_size), rng=0)
+    return lambda: deck.shuffle
+
+
+def _deck_draw_many(deck_size: int) -> Setup:
+    cards = make_cards(deck_size)
+
+    def setup():
+        deck = Deck("Bench", cards)
+        return lambda: deck.draw_many(deck_size)
+    return setup
+
+
+def _player_play_card(hand_size: int) -> Setup:
+    cards = make_cards(hand_size)
+
+    def setup():
+        player = Player(1, Deck("Bench", cards))
+        player.draw_from_deck(hand_size)
+        return lambda: [player.play_card(0) for _ in range(hand_size)]
+    return setup
+
+
+def _board_place_card(row_size: int) -> Setup:
+    cards = make_cards(row_size, 90000)
+
+    def setup():
+        board = make_board(row_size)
+        place = board.place_card
+        return lambda: [place(1, card, card.row_affinity) for card in cards]
+    return setup
+
+
+def _board_get_total_power(row_size: int, inner: int) -> Setup:
+    board = make_board(row_size)
+
+    def op():
+        for _ in range(inner):
+            board.get_total_power(1)
+            board.get_total_power(2)
+    return lambda: op
+
+
+def _rules_round_winner(row_size: int, inner: int) -> Setup:
+    board = make_board(row_size)
+    players = [Player(player_id, Deck("Bench", [])) for player_id in (1, 2)]
+    rules = Rules()
+
+    def op():
+        for _ in range(inner):
+            rules.get_round_winner_id(board, players)
+    return lambda: op
+
+
+def _game_serialize(row_size: int) -> Setup:
+    game = make_game(row_size)
+    return lambda: game.serialize
+
+
+def _match(deck_size: int, bot_factory) -> Setup:
+    deck_a = Deck("A", make_cards(deck_size))
+    deck_b = Deck("B", make_cards(deck_size, 10000))
+    # kolejne próbki to kolejne seedy – ten sam zestaw meczów w każdym uruchomieniu
+    seeds = itertools.count()
+
+    def setup():
+        seed = next(seeds)
+        return lambda: run_single_match(deck_a, deck_b, bot_factory, seed)
+    return setup
+
+
+def default_benchmarks(deck_sizes: Sequence[int] = DECK_SIZES,
+                       row_sizes: Sequence[int] = ROW_SIZES) -> List[Benchmark]:
+    """Przypadki dla gorących ścieżek silnika; świeże przy każdym wywołaniu."""
+    inner = 100
+    benchmarks = []
+    for size in deck_sizes:
+        benchmarks += [
+            Benchmark(f"deck.shuffle[deck={size}]", _deck_shuffle(size)),
+            Benchmark(f"deck.draw_many[deck={size}]", _deck_draw_many(size), inner=size),
+            Benchmark(f"player.play_card[hand={size}]", _player_play_card(size), inner=size),
+        ]
+    for size in row_sizes:
+        benchmarks += [
+            Benchmark(f"board.place_card[row={size}]", _board_place_card(size), inner=size),
+            Benchmark(f"board.get_total_power[row={size}]",
+                      _board_get_total_power(size, inner), inner=2 * inner),
+            Benchmark(f"rules.get_round_winner_id[row={size}]",
+                      _rules_round_winner(size, inner), inner=inner),
+            Benchmark(f"game.serialize[row={size}]", _game_serialize(size)),
+        ]
+    for size in deck_sizes:
+        benchmarks += [
+            Benchmark(f"match.random[deck={size}]", _match(size, RandomBot), cost=10),
+            Benchmark(f"match.greedy[deck={size}]", _match(size, GreedyBot), cost=10),
+        ]
+    return benchmarks
+
+
+# --- uruchamianie ---
+
+def _measure_allocations(benchmark: Benchmark, samples: int) -> float:
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(samples):
+            op = benchmark.setup()
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            op()
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        if started:
+            tracemalloc.stop()
+    return total / (samples * benchmark.inner)
+
+
+def run_benchmark(benchmark: Benchmark,
+                  samples: int = DEFAULT_SAMPLES,
+                  measure_allocations: bool = True) -> BenchmarkResult:
+    samples = max(MIN_SAMPLES, samples // benchmark.cost)
+    clock = time.perf_counter_ns
+    # rozgrzewka (leniwe rng, cache)
+    benchmark.setup()()
+
+    times = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            op = benchmark.setup()
+            start = clock()
+            op()
+            times.append(clock() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    times.sort()
+    middle = len(times) // 2
+    median = times[middle] if len(times) % 2 else (times[middle - 1] + times[middle]) / 2
+    alloc_bytes = None
+    if measure_allocations:
+        alloc_bytes = _measure_allocations(benchmark, min(samples, ALLOC_SAMPLES))
+    return BenchmarkResult(benchmark.name, samples * benchmark.inner, sum(times),
+                           median / benchmark.inner, alloc_bytes)
+
+
+def run_benchmarks(benchmarks: Sequence[Benchmark],
+                   samples: int = DEFAULT_SAMPLES,
+                   measure_allocations: bool = True,
+                   name_filter: Optional[str] = None) -> List[BenchmarkResult]:
+    return [run_benchmark(benchmark, samples, measure_allocations)
+            for benchmark in benchmarks
+            if name_filter is None or name_filter in benchmark.name]
+
+
+# --- baza porównawcza ---
+
+def save_baseline(path: str, results: Sequence[BenchmarkResult]) -> None:
+    data = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "results": {result.name: result.serialize() for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version={data.get('version')}")
+    return data["results"]
+
+
+def compare(results: Sequence[BenchmarkResult],
+            baseline: Dict[str, dict],
+            tolerance: float = DEFAULT_TOLERANCE) -> List[Comparison]:
+    """Porównania dla przypadków obecnych w bazie (nowe są pomijane)."""
+    return [Comparison(result.name, baseline[result.name], result, tolerance)
+            for result in results if result.name in baseline]
+
+
+def format_report(results: Sequence[BenchmarkResult],
+                  comparisons: Sequence[Comparison] = ()) -> str:
+    by_name = {comparison.name: comparison for comparison in comparisons}
+    width = max([len(result.name) for result in results] + [9])
+    lines = [f"{'benchmark':<{width}}  {'ops/s':>12}  {'median':>10}  {'alloc B/op':>10}"
+             + ("  vs baseline" if comparisons else "")]
+    for result in results:
+        alloc = "-" if result.alloc_bytes is None else f"{result.alloc_bytes:.0f}"
+        line = (f"{result.name:<{width}}  {result.ops_per_sec:>12,.0f}  "
+                f"{result.median_ns:>8.0f}ns  {alloc:>10}")
+        comparison = by_name.get(result.name)
+        if comparison is not None:
+            line += f"  {comparison.ratio:>5.2f}x"
+            if comparison.slower:
+                line += "  SLOWER"
+            if comparison.more_allocations:
+                line += "  MORE ALLOCATIONS"
+        lines.append(line)
+    return "\n".join(lines)
@@ -1,23 +1,40 @@
-from typing import List, Dict
+from functools import partial
+from typing import List, Dict, Optional, Set
 from src.card_duel.card import RowAffinity, Card
+from src.card_duel.modifiers import Modifier
 from src.card_duel.row import Row
 
 
 class Board:
-    def __init__(self, player_ids: List[int]):
+    def __init__(self, player_ids: List[int], debug: bool = False):
         self.player_ids = player_ids
         self.rows_by_player: Dict[int, Dict[RowAffinity, Row]] = {}
+        # suma mocy gracza aktualizowana przez rzędy przy każdej zmianie
+        self.power_by_player: Dict[int, int] = {}
+        # gracze, których suma czeka na przeliczenie (zmiana modyfikatora)
+        self._stale: Set[int] = set()
+        self.debug: bool = debug
 
         ROW_LANES = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
 
         for player_id in self.player_ids:
             player_rows: Dict[RowAffinity, Row] = {}
+            self.power_by_player[player_id] = 0
 
             for affinity in ROW_LANES:
-                player_rows[affinity] = Row(name=affinity)
+                player_rows[affinity] = Row(
+                    name=affinity,
+                    on_power_change=partial(self._on_row_power_change,
+                                            player_id),
+                    debug=debug,
+                    on_invalidate=partial(self._stale.add, player_id),
+                )
 
             self.rows_by_player[player_id] = player_rows
 
+    def _on_row_power_change(self, player_id: int, delta: int) -> None:
+        self.power_by_player[player_id] += delta
+
     def get_row(self, player_id: int, row_affinity: RowAffinity) -> Row:
         row = self.rows_by_player[player_id][row_affinity]
         return row
@@ -30,16 +47,49 @@ class Board:
         row = self.get_row(player_id, row_affinity)
         row.add_card(card)
 
+    def add_modifier(self,
+                     player_id: int,
+                     row_affinity: RowAffinity,
+                     modifier: Modifier,
+                     card: Optional[Card] = None) -> None:
+        self.get_row(player_id, row_affinity).add_modifier(modifier, card)
+
+    def remove_modifier(self,
+                        player_id: int,
+                        row_affinity: RowAffinity,
+                        modifier: Modifier,
+                        card: Optional[Card] = None) -> None:
+        self.get_row(player_id, row_affinity).remove_modifier(modifier, card)
+
     def get_row_power(self, player_id: int, row_affinity: RowAffinity) -> int:
         row = self.get_row(player_id, row_affinity)
         return row.total_power()
 
     def get_total_power(self, player_id: int) -> int:
-        total_power = 0
+        if player_id in self._stale:
+            self._refresh_power(player_id)
+        if self.debug:
+            self.check_power_cache(player_id)
+        return self.power_by_player[player_id]
+
+    def _refresh_power(self, player_id: int) -> None:
+        # przelicza tylko unieważnione rzędy, pozostałe zwracają cache
+        self._stale.discard(player_id)
+        self.power_by_player[player_id] = sum(
+            row.total_power() for row in self.rows_by_player[player_id].values())
+
+    def check_power_cache(self, player_id: int) -> None:
+        if player_id in self._stale:
+            self._refresh_power(player_id)
+        expected = 0
         for row in self.rows_by_player[player_id].values():
-            total_power += row.total_power()
-        return total_power
-# sum(row.total_power() for row in self.rows_by_player[player_id].values())
+            row.check_power_cache()
+            expected += row.recompute_power()
+        if expected != self.power_by_player[player_id]:
+            raise RuntimeError(f"Board power cache out of sync for player "
+                               f"{player_id}: cached="
+                               f"{self.power_by_player[player_id]}, "
+                               f"actual={expected}")
 
     def clear(self) -> None:
         for player_id in self.rows_by_player:
@@ -59,7 +109,17 @@ class Board:
 
             rows_serialized[player_id] = player_rows
 
-        return {
+        board_dict = {
             "player_ids": list(self.player_ids),
             "rows": rows_serialized,
         }
+        modifiers = {
+            player_id: {affinity.name: row.serialize_modifiers()
+                        for affinity, row in rows_by_affinity.items()
+                        if row.has_modifiers()}
+            for player_id, rows_by_affinity in self.rows_by_player.items()
+        }
+        modifiers = {player_id: rows for player_id, rows in modifiers.items() if rows}
+        if modifiers:
+            board_dict["modifiers"] = modifiers
+        return board_dict
@@ -0,0 +1,103 @@
+import random
+from typing import Dict, Optional
+
+from src.card_duel.game import Game
+from src.card_duel.player import Player
+from src.card_duel.card import Card, RowAffinity
+
+
+def row_for_card(card: Optional[Card]) -> RowAffinity:
+    """Rząd, do którego bot zagrywa kartę (ANY -> MELEE)."""
+    if card is None or card.row_affinity is RowAffinity.ANY:
+        return RowAffinity.MELEE
+    return card.row_affinity
+
+
+class RandomBot:
+    """
+    Bot z losową polityką – odpowiednik InputHandlerCLI bez input().
+    Gra losową kartę z ręki, z prawdopodobieństwem pass_probability pasuje.
+    """
+
+    def __init__(self,
+                 seed: int | None = None,
+                 pass_probability: float = 0.1) -> None:
+        self.rng = random.Random(seed)
+        self.pass_probability = pass_probability
+        self._chosen_card: Optional[Card] = None
+
+    def choose_action(self, game: Game, player: Player) -> str:
+        if player.hand_size() == 0:
+            return "pass"
+        if self.rng.random() < self.pass_probability:
+            return "pass"
+        return "play"
+
+    def choose_card_index(self, game: Game, player: Player) -> int:
+        if player.hand_size() == 0:
+            raise ValueError("No cards in hand to play.")
+
+        card_index = self.rng.randrange(player.hand_size())
+        self._chosen_card = player.hand[card_index]
+        return card_index
+
+    def choose_row_affinity(self, game: Game, player: Player) -> RowAffinity:
+        return row_for_card(self._chosen_card)
+
+
+class GreedyBot:
+    """
+    Bot zachłanny:
+    - zawsze gra najsilniejszą kartę z ręki,
+    - pasuje, gdy przeciwnik spasował, a on sam prowadzi na planszy.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        # seed tylko dla zgodności z RandomBot – polityka jest deterministyczna
+        self.seed = seed
+        self._chosen_card: Optional[Card] = None
+
+    def choose_action(self, game: Game, player: Player) -> str:
+        if player.hand_size() == 0:
+            return "pass"
+
+        # wszyscy przeciwnicy spasowali, a nasza drużyna prowadzi – pas
+        opponent_ids = game.get_opponent_ids(player.id)
+        if all(game.players[pid].has_passed for pid in opponent_ids):
+            my_power = game.get_team_power(player.id)
+            opponent_power = max(game.get_team_power(pid) for pid in opponent_ids)
+            if my_power > opponent_power:
+                return "pass"
+        return "play"
+
+    def choose_card_index(self, game: Game, player: Player) -> int:
+        if player.hand_size() == 0:
+            raise ValueError("No cards in hand to play.")
+
+        # najsilniejsza karta (przy remisie pierwsza) z indeksu ręki
+        card_index = player.hand.strongest()
+        self._chosen_card = player.hand[card_index]
+        return card_index
+
+    def choose_row_affinity(self, game: Game, player: Player) -> RowAffinity:
+        return row_for_card(self._chosen_card)
+
+
+class SeatedBots:
+    """
+    Osobny bot dla każdego gracza (np. turniej różnych botów):
+    GameController ma jeden input handler, a ten przekazuje decyzję
+    botowi siedzącemu na miejscu danego gracza.
+    """
+
+    def __init__(self, bots: Dict[int, object]) -> None:
+        self.bots = bots
+
+    def choose_action(self, game: Game, player: Player) -> str:
+        return self.bots[player.id].choose_action(game, player)
+
+    def choose_card_index(self, game: Game, player: Player) -> int:
+        return self.bots[player.id].choose_card_index(game, player)
+
+    def choose_row_affinity(self, game: Game, player: Player) -> RowAffinity:
+        return self.bots[player.id].choose_row_affinity(game, player)
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List, Optional
+from typing import Iterable, Optional
 
 
 class RowAffinity(Enum):
@@ -10,25 +10,41 @@ class RowAffinity(Enum):
 
 
 class Card:
+    # Karta to niemutowalna definicja (flyweight) – talie, ręce i rzędy
+    # trzymają referencje do tej samej instancji (zob. CardCatalog).
+    __slots__ = ("id", "name", "base_power", "row_affinity", "tags")
+
     def __init__(self,
                  id: int,
                  name: str,
                  base_power: int,
                  row_affinity: RowAffinity,
-                 tags: Optional[List[str]]):
+                 tags: Optional[Iterable[str]]):
+
+        set_attr = object.__setattr__
+        set_attr(self, "id", id)
+        set_attr(self, "name", name)
+        set_attr(self, "base_power", base_power)
+        set_attr(self, "row_affinity", row_affinity)  # RowAffinity(Enum)
+        # krotka – tagi współdzielonej definicji też nie mogą się zmienić
+        set_attr(self, "tags", tuple(tags) if tags is not None else ())
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Card is immutable, cannot set '{key}'")
 
-        self.id = id
-        self.name = name
-        self.base_power = base_power
-        self.row_affinity: RowAffinity = row_affinity  # RowAffinity(Enum)
-        self.tags: Optional[List[str]] = list(tags) if tags is not None else []
+    def __delattr__(self, key):
+        raise AttributeError(f"Card is immutable, cannot delete '{key}'")
+
+    def __reduce__(self):
+        return (Card, (self.id, self.name, self.base_power,
+                       self.row_affinity, self.tags))
 
     def __repr__(self):
         return (f'Card(id= {self.id}, '
                 f'name= {self.name}, '
                 f'base_power= {self.base_power}, '
                 f'row_affinity= {self.row_affinity.name}, '
-                f'tags= {self.tags})')
+                f'tags= {list(self.tags)})')
 
     def __eq__(self, other):
         if isinstance(other, Card):
@@ -45,7 +61,7 @@ class Card:
                     "name": str(self.name),
                     "base_power": int(self.base_power),
                     "row_affinity": self.row_affinity.name,
-                    "tags": [str(t) for t in (self.tags or [])]
+                    "tags": [str(t) for t in self.tags]
                     }
         return card_dict
 
@@ -54,18 +70,58 @@ class Card:
                      f'| Row: {self.row_affinity.name}')
         return card_repr
 
-    def to_dict(self):
-        pass
+    def to_dict(self) -> dict:
+        return self.serialize()
 
     @classmethod
-    def from_dict(cls, data):
-        pass
+    def from_dict(cls, data: dict, catalog=None) -> "Card":
+        """
+        Odtwarza kartę ze słownika (format serialize()).
+        Jeśli podano CardCatalog, zwraca jego współdzieloną instancję.
+        """
+        card_id = int(data["id"])
+        if catalog is not None and card_id in catalog:
+            return catalog.get(card_id)
+
+        card = cls(card_id,
+                   str(data["name"]),
+                   int(data["base_power"]),
+                   RowAffinity[data["row_affinity"]],
+                   data.get("tags") or [])
+        if catalog is not None:
+            return catalog.register(card)
+        return card
+
+    def clone(self) -> "Card":
+        # definicja jest niemutowalna – kopia byłaby tylko duplikatem
+        return self
 
-    def clone(self):
-        pass
+    def same_definition(self, other: "Card") -> bool:
+        return (self.id == other.id
+                and self.name == other.name
+                and self.base_power == other.base_power
+                and self.row_affinity is other.row_affinity
+                and self.tags == other.tags)
 
     def on_play(self, game, owner, row):
-        pass
+        # efekty z tagów karty rozwiązuje EffectBus gry (zob. effects.py)
+        effects = getattr(game, "effects", None)
+        if effects is not None:
+            effects.card_played(self, owner, row)
 
-    def validate(self):
-        pass
+    def validate(self) -> None:
+        """Sprawdza definicję (np. wczytaną z pliku); ValueError przy błędzie."""
+        if not isinstance(self.id, int) or isinstance(self.id, bool) or self.id <= 0:
+            raise ValueError(f"Card id must be a positive int, got {self.id!r}")
+        if not isinstance(self.name, str) or not self.name.strip():
+            raise ValueError(f"Card id={self.id} has an empty name")
+        if (not isinstance(self.base_power, int) or isinstance(self.base_power, bool)
+                or self.base_power < 0):
+            raise ValueError(f"Card id={self.id} has invalid base_power={self.base_power!r}")
+        if not isinstance(self.row_affinity, RowAffinity):
+            raise ValueError(f"Card id={self.id} has invalid row_affinity={self.row_affinity!r}")
+        for tag in self.tags:
+            if not isinstance(tag, str) or not tag.strip():
+                raise ValueError(f"Card id={self.id} has invalid tag={tag!r}")
+        if len(set(self.tags)) != len(self.tags):
+            raise ValueError(f"Card id={self.id} has duplicate tags {self.tags}")
@@ -0,0 +1,103 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.deck import Deck
+
+
+class CardCatalog:
+    """
+    Jedna współdzielona definicja Card na każde id.
+    Talie budowane przez katalog trzymają referencje do tych samych obiektów,
+    więc tysiące równoległych gier nie duplikują kart.
+    Katalog może też trzymać nazwane listy talii (define_deck / deck).
+    """
+
+    def __init__(self, cards: Optional[Iterable[Card]] = None) -> None:
+        self._cards: Dict[int, Card] = {}
+        # nazwa talii -> (id kart, meta)
+        self._decks: Dict[str, Tuple[List[int], Optional[Dict]]] = {}
+        for card in cards or []:
+            self.register(card)
+
+    def register(self, card: Card) -> Card:
+        """Dodaje kartę; dla znanego id zwraca istniejącą instancję."""
+        existing = self._cards.get(card.id)
+        if existing is None:
+            self._cards[card.id] = card
+            return card
+        if not existing.same_definition(card):
+            raise ValueError(f"Conflicting definition for card id={card.id}")
+        return existing
+
+    def define(self,
+               card_id: int,
+               name: str,
+               base_power: int,
+               row_affinity: RowAffinity,
+               tags: Optional[List[str]] = None) -> Card:
+        return self.register(Card(card_id, name, base_power, row_affinity, tags))
+
+    def get(self, card_id: int) -> Card:
+        try:
+            return self._cards[card_id]
+        except KeyError:
+            raise ValueError(f"Unknown card id={card_id}")
+
+    def build_deck(self,
+                   name: str,
+                   card_ids: Iterable[int],
+                   meta: Optional[Dict] = None) -> Deck:
+        return Deck(name, [self.get(card_id) for card_id in card_ids], meta)
+
+    # --- talie ---
+
+    def define_deck(self,
+                    name: str,
+                    card_ids: Iterable[int],
+                    meta: Optional[Dict] = None) -> None:
+        card_ids = list(card_ids)
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"Invalid deck name={name!r}")
+        if name in self._decks:
+            raise ValueError(f"Duplicate deck name={name!r}")
+        unknown = [card_id for card_id in card_ids if card_id not in self._cards]
+        if unknown:
+            raise ValueError(f"Deck {name!r} uses unknown card ids {unknown}")
+        self._decks[name] = (card_ids, meta)
+
+    def deck(self, name: str) -> Deck:
+        """Nowa talia (świeża lista kart) o nazwie z define_deck."""
+        try:
+            card_ids, meta = self._decks[name]
+        except KeyError:
+            raise ValueError(f"Unknown deck name={name!r}")
+        return self.build_deck(name, card_ids, meta)
+
+    def deck_names(self) -> List[str]:
+        return list(self._decks)
+
+    def __contains__(self, card_id: int) -> bool:
+        return card_id in self._cards
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self) -> Iterator[Card]:
+        return iter(self._cards.values())
+
+    def serialize(self) -> dict:
+        catalog_dict = {"cards": [card.serialize() for card in self._cards.values()]}
+        if self._decks:
+            catalog_dict["decks"] = [{"name": name, "cards": list(card_ids), "meta": meta}
+                                     for name, (card_ids, meta) in self._decks.items()]
+        return catalog_dict
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CardCatalog":
+        catalog = cls()
+        for card_data in data.get("cards", []):
+            Card.from_dict(card_data, catalog)
+        for deck_data in data.get("decks", []):
+            catalog.define_deck(deck_data["name"], deck_data["cards"], deck_data.get("meta"))
+        return catalog
+
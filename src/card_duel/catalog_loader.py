@@ -0,0 +1,192 @@
+import csv
+import json
+import marshal
+import os
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.catalog import CardCatalog
+
+
+# Pliki katalogu:
+# - JSON: {"cards": [...], "decks": [...]} – karty w formacie Card.serialize(),
+#   talie jako {"name": ..., "cards": [id, ...], "meta": {...}}; obie listy opcjonalne,
+# - CSV z kartami: kolumny id,name,base_power,row_affinity[,tags] (tagi rozdzielone ";"),
+# - CSV z taliami: kolumny deck,card_id[,count] – jeden wiersz na kartę (lub count kopii).
+TAG_SEPARATOR = ";"
+CARD_COLUMNS = ("id", "name", "base_power", "row_affinity")
+DECK_COLUMNS = ("deck", "card_id")
+
+CACHE_MAGIC = b"CDCAT"
+CACHE_VERSION = 1
+
+# surowe rekordy (to samo trafia do cache): karta i talia
+CardRecord = Tuple[int, str, int, str, Tuple[str, ...]]
+DeckRecord = Tuple[str, Tuple[int, ...], Optional[dict]]
+Records = Tuple[List[CardRecord], List[DeckRecord]]
+
+
+def _read_json(path: str) -> Records:
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a JSON object with 'cards' and/or 'decks'")
+    cards = []
+    for index, card in enumerate(data.get("cards", [])):
+        try:
+            cards.append((card["id"], card["name"], card["base_power"],
+                          card["row_affinity"], tuple(card.get("tags") or ())))
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"{path}: cards[{index}]: missing or invalid field {error}")
+    decks = []
+    for index, deck in enumerate(data.get("decks", [])):
+        try:
+            decks.append((deck["name"], tuple(deck["cards"]), deck.get("meta")))
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"{path}: decks[{index}]: missing or invalid field {error}")
+    return cards, decks
+
+
+def _read_csv(path: str) -> Records:
+    with open(path, encoding="utf-8", newline="") as file:
+        reader = csv.DictReader(file)
+        columns = set(reader.fieldnames or ())
+        if columns.issuperset(CARD_COLUMNS):
+            return _card_rows(path, reader), []
+        if columns.issuperset(DECK_COLUMNS):
+            return [], _deck_rows(path, reader)
+    raise ValueError(f"{path}: CSV needs columns {CARD_COLUMNS} or {DECK_COLUMNS}")
+
+
+def _card_rows(path: str, reader: csv.DictReader) -> List[CardRecord]:
+    cards = []
+    for row in reader:
+        try:
+            tags = tuple(tag.strip() for tag in (row.get("tags") or "").split(TAG_SEPARATOR)
+                         if tag.strip())
+            cards.append((int(row["id"]), row["name"].strip(), int(row["base_power"]),
+                          row["row_affinity"].strip().upper(), tags))
+        except (ValueError, TypeError, AttributeError) as error:
+            raise ValueError(f"{path}:{reader.line_num}: {error}")
+    return cards
+
+
+def _deck_rows(path: str, reader: csv.DictReader) -> List[DeckRecord]:
+    decks = {}
+    for row in reader:
+        try:
+            # pusta kolumna count to jedna kopia; 0 i ujemne to błąd pliku
+            count_text = (row.get("count") or "").strip()
+            count = int(count_text) if count_text else 1
+            if count < 1:
+                raise ValueError(f"count must be at least 1, got {count}")
+            card_id = int(row["card_id"])
+            name = row["deck"].strip()
+        except (ValueError, TypeError, AttributeError) as error:
+            raise ValueError(f"{path}:{reader.line_num}: {error}")
+        decks.setdefault(name, []).extend([card_id] * count)
+    return [(name, tuple(card_ids), None) for name, card_ids in decks.items()]
+
+
+def read_catalog_file(path: str) -> Records:
+    """Surowe rekordy kart i talii z jednego pliku (.json albo .csv)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        return _read_json(path)
+    if extension == ".csv":
+        return _read_csv(path)
+    raise ValueError(f"Unsupported catalog file {path!r}, expected .json or .csv")
+
+
+def build_catalog(cards: Sequence[CardRecord],
+                  decks: Sequence[DeckRecord],
+                  validate: bool = True) -> CardCatalog:
+    catalog = CardCatalog()
+    for card_id, name, base_power, affinity, tags in cards:
+        try:
+            row_affinity = RowAffinity[affinity]
+        except (KeyError, TypeError):
+            raise ValueError(f"Card id={card_id} has invalid row_affinity={affinity!r}")
+        card = Card(card_id, name, base_power, row_affinity, tags)
+        if validate:
+            card.validate()
+        catalog.register(card)
+    for name, card_ids, meta in decks:
+        catalog.define_deck(name, card_ids, meta)
+    return catalog
+
+
+# --- binarny cache ---
+
+def _fingerprint(paths: Sequence[str]) -> tuple:
+    """Jak w .pyc: rozmiar i mtime plików źródłowych plus wersje formatu."""
+    files = []
+    for path in paths:
+        stat = os.stat(path)
+        files.append((os.path.abspath(path), stat.st_size, stat.st_mtime_ns))
+    return (CACHE_VERSION, tuple(sys.version_info[:2]), tuple(files))
+
+
+def _read_cache(cache_path: str, fingerprint: tuple) -> Optional[Records]:
+    try:
+        with open(cache_path, "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+    if not data.startswith(CACHE_MAGIC):
+        return None
+    try:
+        stored, cards, decks = marshal.loads(data[len(CACHE_MAGIC):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if stored != fingerprint:
+        return None
+    return cards, decks
+
+
+def _write_cache(cache_path: str, fingerprint: tuple, cards: List[CardRecord],
+                 decks: List[DeckRecord]) -> None:
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(CACHE_MAGIC)
+            file.write(marshal.dumps((fingerprint, cards, decks)))
+        # podmiana atomowa – równolegle startujące procesy nie widzą połowy pliku
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # cache jest tylko przyspieszeniem (np. katalog tylko do odczytu)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def load_catalog(paths: Sequence[str], cache_path: Optional[str] = None) -> CardCatalog:
+    """
+    Wczytuje karty i talie z plików JSON/CSV (w podanej kolejności) i je
+    waliduje. Z cache_path zapisuje sprawdzone rekordy w binarnym cache
+    (marshal) i przy kolejnym starcie, jeśli pliki się nie zmieniły,
+    pomija parsowanie i walidację.
+    """
+    paths = list(paths)
+    fingerprint = _fingerprint(paths) if cache_path is not None else None
+    if cache_path is not None:
+        cached = _read_cache(cache_path, fingerprint)
+        if cached is not None:
+            return build_catalog(*cached, validate=False)
+
+    cards: List[CardRecord] = []
+    decks: List[DeckRecord] = []
+    for path in paths:
+        file_cards, file_decks = read_catalog_file(path)
+        cards += file_cards
+        decks += file_decks
+    catalog = build_catalog(cards, decks)
+
+    if cache_path is not None:
+        # do cache trafiają rekordy już bez duplikatów (po register)
+        unique_cards = [(card.id, card.name, card.base_power, card.row_affinity.name,
+                         card.tags) for card in catalog]
+        _write_cache(cache_path, fingerprint, unique_cards, decks)
+    return catalog
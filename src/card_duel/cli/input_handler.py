@@ -1,11 +1,16 @@
+from typing import Optional
+
 from src.card_duel.game import Game
 from src.card_duel.player import Player
-from src.card_duel.card import RowAffinity
+from src.card_duel.card import Card, RowAffinity
 
 
 class InputHandlerCLI:
     """Odpowiada wyłącznie za zbieranie decyzji od gracza (input())."""
 
+    def __init__(self) -> None:
+        self._chosen_card: Optional[Card] = None
+
     def choose_action(self, game: Game, player: Player) -> str:
         """
         Zwraca 'play' albo 'pass'.
@@ -34,14 +39,18 @@ class InputHandlerCLI:
                 continue
 
             if 0 <= card_index < player.hand_size():
+                self._chosen_card = player.hand[card_index]
                 return card_index
 
             print(f"Index out of range. Choose 0..{player.hand_size() - 1}.")
 
     def choose_row_affinity(self, game: Game, player: Player) -> RowAffinity:
         """
-        Na razie uproszczenie: wszystkie karty gramy w MELEE.
-        Interfejs zostawiamy gotowy na przyszłość.
+        Karta trafia do swojego rzędu (Game.play_card nie przyjmie innego);
+        na razie uproszczenie: karty ANY gramy w MELEE.
         """
-        # Możesz kiedyś zrobić input z wyborem MELEE/RANGED/SIEGE.
-        return RowAffinity.MELEE
+        # Możesz kiedyś zrobić input z wyborem MELEE/RANGED/SIEGE dla kart ANY.
+        card = self._chosen_card
+        if card is None or card.row_affinity is RowAffinity.ANY:
+            return RowAffinity.MELEE
+        return card.row_affinity
@@ -1,30 +1,108 @@
+import sys
+from typing import Dict, List, Optional, TextIO
+
 from src.card_duel.game import Game
 from src.card_duel.player import Player
 from src.card_duel.card import RowAffinity
 
 
+# Tryby wyjścia RendererCLI:
+MODE_PLAIN = "plain"  # tekst jak dotąd, ale każde render_* to jeden zapis do strumienia
+MODE_DIFF = "diff"    # stała "ramka" od góry terminala, przepisywane tylko zmienione linie (ANSI)
+MODE_QUIET = "quiet"  # nic nie rysuje (boty, symulacje, logi)
+MODES = (MODE_PLAIN, MODE_DIFF, MODE_QUIET)
+
+# Kolejność sekcji ramki w trybie diff
+SECTIONS = ("state", "board", "message", "turn", "hand")
+
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_LINE_END = "\x1b[K"
+CLEAR_SCREEN_END = "\x1b[J"
+
+
+def _move_to(line: int) -> str:
+    """Kursor na początek linii (numeracja od 0)."""
+    return f"\x1b[{line + 1};1H"
+
+
 class RendererCLI:
     """Odpowiada wyłącznie za wypisywanie stanu gry w konsoli."""
 
-    def render_game_state(self, game: Game) -> None:
-        print("\n=== GAME STATE ===")
-        for pid, player in game.players.items():
-            print(f"Player {pid}:")
-            print(f"  Rounds won: {player.rounds_won}")
-            print(f"  Hand size: {player.hand_size()}")
-            print(f"  Has passed: {player.has_passed}")
-            total_power = game.board.get_total_power(pid)
-            print(f"  Board power: {total_power}")
-        print("==================\n")
-        self.render_board(game)
+    ROW_ORDER = [RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE]
+    ROW_NAMES = {
+        RowAffinity.MELEE: "MELEE ",
+        RowAffinity.RANGED: "RANGED",
+        RowAffinity.SIEGE: "SIEGE ",
+    }
+
+    def __init__(self, mode: str = MODE_PLAIN, stream: Optional[TextIO] = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown render mode={mode!r}, expected one of {MODES}")
+        self.mode = mode
+        # None = bieżące sys.stdout (sprawdzane przy każdym zapisie)
+        self.stream = stream
+        self.enabled: bool = mode != MODE_QUIET
+        # tryb diff: zawartość sekcji i linie, które aktualnie są na ekranie
+        self._sections: Dict[str, List[str]] = {name: [] for name in SECTIONS}
+        self._screen: Optional[List[str]] = None
+        # liczba zapisów do strumienia (jeden na klatkę)
+        self.writes: int = 0
+
+    # --- wyjście ---
+
+    def _write(self, text: str) -> None:
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(text)
+        stream.flush()
+        self.writes += 1
+
+    def _emit(self, section: str, lines: List[str]) -> None:
+        """Jedna klatka: w trybie plain dopisuje linie, w diff podmienia sekcję."""
+        if self.mode == MODE_PLAIN:
+            self._write("\n".join(lines) + "\n")
+            return
+        self._sections[section] = lines
+        frame = [line for name in SECTIONS for line in self._sections[name]]
+        self._write(self._diff(frame))
+        self._screen = frame
 
-    def render_board(self, game: Game) -> None:
+    def _diff(self, frame: List[str]) -> str:
         """
-        Wyświetla aktualny układ kart na planszy:
-        - dla każdego gracza:
-          - całkowita moc na planszy,
-          - dla każdego rzędu: lista mocy kart i suma rzędu.
+        Sekwencja ANSI przepisująca tylko linie różne od tego, co jest na
+        ekranie; na końcu kursor pod ramką i czyszczenie reszty ekranu
+        (tam trafiają prompty InputHandlerCLI). Zakłada, że linie mieszczą
+        się w szerokości terminala.
         """
+        if self._screen is None:
+            parts = [CLEAR_SCREEN]
+            screen: List[str] = []
+        else:
+            parts = []
+            screen = self._screen
+        for index, line in enumerate(frame):
+            if index >= len(screen) or screen[index] != line:
+                parts.append(f"{_move_to(index)}{line}{CLEAR_LINE_END}")
+        parts.append(_move_to(len(frame)) + CLEAR_SCREEN_END)
+        return "".join(parts)
+
+    def invalidate(self) -> None:
+        """Następna klatka w trybie diff wyczyści ekran i narysuje wszystko."""
+        self._screen = None
+
+    # --- składanie linii ---
+
+    def _game_state_lines(self, game: Game) -> List[str]:
+        lines = ["", "=== GAME STATE ==="]
+        for pid, player in game.players.items():
+            lines.append(f"Player {pid}:")
+            lines.append(f"  Rounds won: {player.rounds_won}")
+            lines.append(f"  Hand size: {player.hand_size()}")
+            lines.append(f"  Has passed: {player.has_passed}")
+            lines.append(f"  Board power: {game.board.get_total_power(pid)}")
+        lines += ["==================", ""]
+        return lines
+
+    def _board_lines(self, game: Game) -> List[str]:
         board = game.board
 
         # Kolejność graczy: przeciwnik u góry, my na dole (jeśli są dwaj)
@@ -34,23 +112,14 @@ class RendererCLI:
         else:
             ordered_ids = player_ids
 
-        row_order = [RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE]
-        row_names = {
-            RowAffinity.MELEE: "MELEE ",
-            RowAffinity.RANGED: "RANGED",
-            RowAffinity.SIEGE: "SIEGE ",
-        }
-
-        print("============== BOARD ==============")
+        lines = ["============== BOARD =============="]
         for pid in ordered_ids:
-            player = game.players[pid]
-            total_power = board.get_total_power(pid)
-            print(f"Player {pid} (total: {total_power})")
+            lines.append(f"Player {pid} (total: {board.get_total_power(pid)})")
 
-            for affinity in row_order:
+            for affinity in self.ROW_ORDER:
                 row = board.get_row(pid, affinity)
-                powers = [card.base_power for card in row.cards]
-                row_total = sum(powers) if powers else 0
+                # efektywna siła (po pogodzie, rogu i buffach)
+                powers = [row.card_power(card) for card in row.cards]
 
                 # prosta reprezentacja: [ 5 7 3 ]
                 if powers:
@@ -59,45 +128,89 @@ class RendererCLI:
                 else:
                     row_repr = "[    ]"
 
-                print(f"  {row_names[affinity]}: {row_repr} = {row_total}")
-            print()  # pusta linia między graczami
+                lines.append(f"  {self.ROW_NAMES[affinity]}: {row_repr} = {row.total_power()}")
+            lines.append("")  # pusta linia między graczami
 
-        print("===================================\n")
+        lines += ["===================================", ""]
+        return lines
 
+    def _hand_lines(self, player: Player) -> List[str]:
+        lines = ["", f"Player {player.id} hand:"]
+        if not player.hand:
+            lines.append("  (no cards in hand)")
+            return lines
+        for idx, card in enumerate(player.hand):
+            lines.append(f"  [{idx}] {card.name} (power={card.base_power}, "
+                         f"row={card.row_affinity.name})")
+        lines.append("")
+        return lines
+
+    def _round_end_lines(self, game: Game) -> List[str]:
+        lines = ["", "=== ROUND OVER ==="]
+        for pid in game.players.keys():
+            lines.append(f"Player {pid} total power: {game.board.get_total_power(pid)}")
+        for pid, player in game.players.items():
+            lines.append(f"Rounds won P{pid}: {player.rounds_won}")
+        return lines
 
+    def _match_result_lines(self, game: Game) -> List[str]:
+        if not game.is_match_over():
+            return ["Match ended without reaching required rounds_to_win."]
+        winner_id = game.get_match_winner_id()
+        if winner_id is not None:
+            return [f"Winner: Player {winner_id}"]
+        return ["Match over, but no winner (draw)."]
+
+    # --- API renderera ---
+
+    def render_game_state(self, game: Game) -> None:
+        if not self.enabled:
+            return
+        if self.mode == MODE_PLAIN:
+            # stan i plansza w jednym zapisie
+            self._emit("state", self._game_state_lines(game) + self._board_lines(game))
+            return
+        self._sections["state"] = self._game_state_lines(game)
+        self._emit("board", self._board_lines(game))
+
+    def render_board(self, game: Game) -> None:
+        """
+        Wyświetla aktualny układ kart na planszy:
+        - dla każdego gracza:
+          - całkowita moc na planszy,
+          - dla każdego rzędu: lista mocy kart i suma rzędu.
+        """
+        if self.enabled:
+            self._emit("board", self._board_lines(game))
 
     def render_player_turn_header(self, player: Player) -> None:
-        print(f"--- Player {player.id}'s turn ---")
+        if self.enabled:
+            self._emit("turn", [f"--- Player {player.id}'s turn ---"])
 
     def render_player_hand(self, player: Player) -> None:
-        print(f"\nPlayer {player.id} hand:")
-        if not player.hand:
-            print("  (no cards in hand)")
-            return
-        for idx, card in enumerate(player.hand):
-            print(f"  [{idx}] {card.name} (power={card.base_power}, row={card.row_affinity.name})")
-        print()
+        if self.enabled:
+            self._emit("hand", self._hand_lines(player))
 
     def render_round_start(self, round_number: int) -> None:
-        print(f"\n=== START ROUND {round_number} ===")
+        if self.enabled:
+            self._emit("message", ["", f"=== START ROUND {round_number} ==="])
 
     def render_round_end(self, game: Game) -> None:
-        board = game.board
-        print("\n=== ROUND OVER ===")
-        for pid in game.players.keys():
-            total_power = board.get_total_power(pid)
-            print(f"Player {pid} total power: {total_power}")
-        for pid, player in game.players.items():
-            print(f"Rounds won P{pid}: {player.rounds_won}")
+        if self.enabled:
+            self._emit("message", self._round_end_lines(game))
 
     def render_match_result(self, game: Game) -> None:
-        print("\n=== MATCH RESULT ===")
-        self.render_game_state(game)
-        if game.is_match_over():
-            winner_id = game.get_match_winner_id()
-            if winner_id is not None:
-                print(f"Winner: Player {winner_id}")
-            else:
-                print("Match over, but no winner (draw).")
-        else:
-            print("Match ended without reaching required rounds_to_win.")
+        if not self.enabled:
+            return
+        if self.mode == MODE_PLAIN:
+            self._emit("message", ["", "=== MATCH RESULT ==="]
+                       + self._game_state_lines(game)
+                       + self._board_lines(game)
+                       + self._match_result_lines(game))
+            return
+        # koniec meczu: tura i ręka nie są już aktualne
+        self._sections["turn"] = []
+        self._sections["hand"] = []
+        self._sections["state"] = self._game_state_lines(game)
+        self._sections["board"] = self._board_lines(game)
+        self._emit("message", ["", "=== MATCH RESULT ==="] + self._match_result_lines(game))
@@ -1,13 +1,27 @@
 from src.card_duel.game import Game
-from src.card_duel.cli.input_handler import InputHandlerCLI
-from src.card_duel.cli.renderer_cli import RendererCLI
-from src.card_duel.card import RowAffinity
+from src.card_duel.event_log import MatchLogWriter
+from src.card_duel.timing import PhaseTimer, phases
+from src.card_duel.player import Player
+from typing import TYPE_CHECKING, Generator, Optional, Tuple
+
+if TYPE_CHECKING:
+    # tylko adnotacje – frontendy ładuje frontends.create_frontend
+    from src.card_duel.cli.input_handler import InputHandlerCLI
+    from src.card_duel.cli.renderer_cli import RendererCLI
 
 
 INITIAL_HAND_SIZE = 10
 CARDS_BETWEEN_ROUNDS = 2
 MAX_ROUNDS = 3
 
+# fazy mierzone przez PhaseTimer (zob. GameController.timer)
+INPUT_PHASES = phases("input", ("choose_action", "choose_card_index", "choose_row_affinity"))
+RENDER_PHASES = phases("render", ("render_round_start", "render_game_state",
+                                  "render_player_turn_header", "render_player_hand",
+                                  "render_round_end", "render_match_result"))
+ENGINE_PHASES = phases("engine", ("start_match", "start_round", "play_card", "pass_turn"))
+RULES_PHASES = phases("rules", ("is_round_over", "is_match_over"))
+
 
 class GameController:
     """
@@ -16,18 +30,26 @@ class GameController:
     - pętla rund,
     - pętla tur,
     - dobieranie kart wg zasad Gwinta.
-    Nie używa print/input bezpośrednio – deleguje do RendererCLI / InputHandlerCLI.
+    Nie używa print/input bezpośrednio – deleguje do renderera i input handlera
+    wybranego frontendu (RendererCLI / InputHandlerCLI, zob. frontends.py).
     """
 
     def __init__(
         self,
         game: Game,
-        input_handler: InputHandlerCLI,
-        renderer: RendererCLI,
+        input_handler: "InputHandlerCLI",
+        renderer: "RendererCLI",
+        event_log: Optional[MatchLogWriter] = None,
+        timer: Optional[PhaseTimer] = None,
     ) -> None:
         self.game = game
         self.input = input_handler
         self.renderer = renderer
+        # opcjonalny binarny log zdarzeń meczu (zob. event_log.replay_log)
+        self.event_log = event_log
+        # opcjonalny pomiar faz; run_match zeruje go na start meczu,
+        # bez timera pętla woła obiekty bezpośrednio (zero narzutu)
+        self.timer = timer
 
     def _initial_draw(self) -> None:
         """
@@ -55,27 +77,84 @@ class GameController:
         - po rundzie dobiera karty,
         - kończy, gdy Rules.is_match_over() lub po 3 rundach.
         """
-        self.game.start_match()
+        if self.event_log is not None:
+            self.event_log.begin_match(self.game)
+            try:
+                self._run_match()
+            except BaseException:
+                self.event_log.abort_match()
+                raise
+            self.event_log.end_match()
+        else:
+            self._run_match()
+
+    def _run_match(self) -> None:
+        timer = self.timer
+        if timer is None:
+            self._match_loop(self.game, self.renderer, self.input)
+            return
+        # z timerem pętla dostaje obiekty zastępcze mierzące wybrane metody;
+        # renderer i input nadal dostają prawdziwy obiekt Game
+        timer.reset()
+        with timer.span("match"):
+            self._match_loop(*self._timed_engine_and_renderer(timer),
+                             timer.wrap(self.input, INPUT_PHASES))
+
+    def _timed_engine_and_renderer(self, timer: PhaseTimer) -> tuple:
+        return (timer.wrap(self.game, {**ENGINE_PHASES, **RULES_PHASES}),
+                timer.wrap(self.renderer, RENDER_PHASES))
+
+    def _match_loop(self, engine, renderer, input_handler) -> None:
+        steps = self._match_steps(engine, renderer)
+        request = next(steps, None)
+        while request is not None:
+            name, player = request
+            try:
+                decision = getattr(input_handler, name)(self.game, player)
+            except Exception as error:
+                request = self._resume(steps, error=error)
+            else:
+                request = self._resume(steps, decision)
+
+    @staticmethod
+    def _resume(steps: Generator, decision=None, error: Optional[Exception] = None):
+        """Oddaje decyzję (albo wyjątek input handlera) do _match_steps; None = koniec meczu."""
+        try:
+            if error is not None:
+                return steps.throw(error)
+            return steps.send(decision)
+        except StopIteration:
+            return None
+
+    def _match_steps(self, engine, renderer) -> Generator[Tuple[str, Player], object, None]:
+        """
+        Przebieg meczu jako generator – jedna pętla dla _match_loop
+        i AsyncGameController. Decyzję gracza zleca yield (nazwa metody
+        input handlera, gracz); pętla odsyła wynik przez send(),
+        a wyjątek handlera przez throw().
+        """
+        game = self.game
+        engine.start_match()
         self._initial_draw()
 
-        while not self.game.is_match_over() and self.game.current_round < MAX_ROUNDS:
+        while not engine.is_match_over() and game.current_round < MAX_ROUNDS:
             # start nowej rundy
-            self.game.start_round()
-            self.renderer.render_round_start(self.game.current_round)
+            engine.start_round()
+            renderer.render_round_start(game.current_round)
 
             # pętla tur w ramach rundy
-            while not self.game.is_round_over():
-                active_id = self.game.get_active_player_id()
+            while not engine.is_round_over():
+                active_id = game.get_active_player_id()
                 if active_id is None:
                     # sytuacja awaryjna – nie powinno się zdarzyć przy poprawnym Game
                     break
 
-                active_player = self.game.players[active_id]
+                active_player = game.players[active_id]
 
                 # CLI
-                self.renderer.render_game_state(self.game)
-                self.renderer.render_player_turn_header(active_player)
-                self.renderer.render_player_hand(active_player)
+                renderer.render_game_state(game)
+                renderer.render_player_turn_header(active_player)
+                renderer.render_player_hand(active_player)
 
                 #PYGAME
                 #self.renderer.render_player_turn_header(active_player)
@@ -83,29 +162,29 @@ class GameController:
                 #self.renderer.render_game_state(self.game)
 
 
-                action = self.input.choose_action(self.game, active_player)
+                action = yield "choose_action", active_player
 
                 if action == "play":
                     # jeśli gracz nie ma kart – musi pasować
                     if active_player.hand_size() == 0:
                         try:
-                            self.game.pass_turn(active_id)
+                            engine.pass_turn(active_id)
                         except Exception:
                             # wyjątków nie obsługujemy tutaj szczegółowo – to logika Game/Rules
                             break
                         continue
 
                     try:
-                        card_index = self.input.choose_card_index(self.game, active_player)
-                        row_affinity = self.input.choose_row_affinity(self.game, active_player)
-                        self.game.play_card(active_id, card_index, row_affinity)
+                        card_index = yield "choose_card_index", active_player
+                        row_affinity = yield "choose_row_affinity", active_player
+                        engine.play_card(active_id, card_index, row_affinity)
                     except Exception:
                         # błąd logiki/akcji – w prostym CLI po prostu przerywamy turę
                         continue
 
                 elif action == "pass":
                     try:
-                        self.game.pass_turn(active_id)
+                        engine.pass_turn(active_id)
                     except Exception:
                         # błąd logiki – przerywamy pętlę dla bezpieczeństwa
                         break
@@ -115,13 +194,13 @@ class GameController:
                     continue
 
             # koniec rundy
-            self.renderer.render_round_end(self.game)
+            renderer.render_round_end(game)
 
-            if self.game.is_match_over() or self.game.current_round >= MAX_ROUNDS:
+            if engine.is_match_over() or game.current_round >= MAX_ROUNDS:
                 break
 
             # dobieranie kart między rundami wg zasad Gwinta
             self._draw_between_rounds()
 
         # koniec meczu – wynik końcowy
-        self.renderer.render_match_result(self.game)
+        renderer.render_match_result(game)
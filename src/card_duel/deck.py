@@ -1,21 +1,47 @@
 import random
 from .card import Card
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Sequence
 
 
 class Deck:
     def __init__(self,
                  name: str,
                  cards: List[Card],
-                 meta: Optional[Dict] = None):
+                 meta: Optional[Dict] = None,
+                 rng: random.Random | int | None = None):
 
         self.name: str = name
         self.cards: List[Card] = list(cards)
         self.original_cards: List[Card] = list(cards)
         self.meta: Optional[Dict] = meta
+        # własny strumień losowy talii (seed albo gotowy random.Random);
+        # bez globalnego random – powtarzalne rozdania i brak współdzielenia
+        self._rng: random.Random | int | None = rng
 
-    def shuffle(self) -> None:
-        random.shuffle(self.cards)
+    @property
+    def rng(self) -> random.Random:
+        # tworzony leniwie – seedowanie z os.urandom jest drogie, a większość
+        # talii (np. odtworzonych ze snapshotu) nigdy nie jest tasowana
+        if not isinstance(self._rng, random.Random):
+            self._rng = random.Random(self._rng)
+        return self._rng
+
+    def shuffle(self, permutation: Optional[Sequence[int]] = None) -> None:
+        """
+        Tasuje talię własnym rng albo podaną permutacją
+        (np. wygenerowaną hurtowo przez shuffling.bulk_permutations).
+        """
+        if permutation is None:
+            self.rng.shuffle(self.cards)
+            return
+
+        if len(permutation) != len(self.cards):
+            raise ValueError("Permutation size does not match deck size")
+        # każda pozycja dokładnie raz – bez duplikatów i indeksów spoza talii
+        if sorted(permutation) != list(range(len(self.cards))):
+            raise ValueError("Permutation is not a permutation of deck positions")
+        cards = self.cards
+        self.cards = [cards[i] for i in permutation]
 
     def draw_one(self) -> Card | None:
         if len(self.cards) > 0:
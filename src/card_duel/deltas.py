@@ -0,0 +1,187 @@
+import struct
+from typing import TYPE_CHECKING, Iterable, Iterator, List
+
+from src.card_duel.card import RowAffinity
+
+if TYPE_CHECKING:
+    from src.card_duel.catalog import CardCatalog
+    from src.card_duel.game import Game
+
+
+# Delta to krotka (opcode, *pola). Game wysyła je do delta_sink po każdej
+# zmianie stanu; DeltaPatcher odtwarza z nich stan po stronie klienta.
+OP_MATCH_START = 0   # ()
+OP_ROUND_START = 1   # (runda, id rozpoczynającego)
+OP_DRAW = 2          # (id gracza, id karty)
+OP_PLAY = 3          # (id gracza, pozycja w ręce, id karty, RowAffinity.value)
+OP_PASS = 4          # (id gracza,)
+OP_TURN = 5          # (id aktywnego gracza,)
+OP_ROUND_END = 6     # (id zwycięzcy albo None,)
+OP_SNAPSHOT = 7      # (bajty Game.to_snapshot(),) – pełna resynchronizacja
+OP_MATCH_END = 8     # () – znacznik końca meczu w logu zdarzeń
+OP_REMOVE = 9        # (id gracza, RowAffinity.value, id karty) – karta zniszczona przez efekt
+OP_MODIFIER = 10     # (id gracza, RowAffinity.value, id karty albo NO_CARD, rodzaj, wartość, +1/-1)
+
+NO_CARD = -1         # OP_MODIFIER dla całego rzędu
+
+_FORMATS = {
+    OP_MATCH_START: struct.Struct("<B"),
+    OP_ROUND_START: struct.Struct("<BHi"),
+    OP_DRAW: struct.Struct("<Bii"),
+    OP_PLAY: struct.Struct("<BiHiB"),
+    OP_PASS: struct.Struct("<Bi"),
+    OP_TURN: struct.Struct("<Bi"),
+    OP_ROUND_END: struct.Struct("<BBi"),
+    OP_SNAPSHOT: struct.Struct("<BI"),
+    OP_MATCH_END: struct.Struct("<B"),
+    OP_REMOVE: struct.Struct("<BiBi"),
+    OP_MODIFIER: struct.Struct("<BiBiBib"),
+}
+
+
+class DeltaStreamTruncated(ValueError):
+    """Ostatni rekord strumienia jest niepełny (np. zapis przerwany awarią)."""
+
+
+def encode_delta(delta: tuple) -> bytes:
+    op = delta[0]
+    fmt = _FORMATS[op]
+    if op == OP_ROUND_END:
+        winner_id = delta[1]
+        return fmt.pack(op, winner_id is not None,
+                        0 if winner_id is None else winner_id)
+    if op == OP_SNAPSHOT:
+        return fmt.pack(op, len(delta[1])) + delta[1]
+    try:
+        return fmt.pack(*delta)
+    except struct.error:
+        raise ValueError(f"Delta field out of range: {delta!r}")
+
+
+def encode_deltas(deltas: Iterable[tuple]) -> bytes:
+    """Pakuje delty do postaci binarnej (kilka bajtów na akcję)."""
+    return b"".join(encode_delta(delta) for delta in deltas)
+
+
+def iter_deltas(data, offset: int = 0) -> Iterator[tuple]:
+    """Dekoduje delty strumieniowo (działa też na memoryview/mmap)."""
+    view = memoryview(data)
+    end = len(view)
+    try:
+        while offset < end:
+            op = view[offset]
+            fmt = _FORMATS.get(op)
+            if fmt is None:
+                raise ValueError(f"Unknown delta opcode={op}")
+            fields = fmt.unpack_from(view, offset)
+            offset += fmt.size
+
+            if op == OP_ROUND_END:
+                has_winner, winner_id = fields[1:]
+                yield (op, winner_id if has_winner else None)
+            elif op == OP_SNAPSHOT:
+                size = fields[1]
+                payload = bytes(view[offset:offset + size])
+                if len(payload) != size:
+                    raise DeltaStreamTruncated("Delta stream truncated")
+                offset += size
+                yield (op, payload)
+            else:
+                yield fields
+    except struct.error:
+        raise DeltaStreamTruncated("Delta stream truncated")
+    finally:
+        # wyjątek trzyma ramkę generatora – bez release mmap nie da się zamknąć
+        view.release()
+
+
+def decode_deltas(data: bytes) -> List[tuple]:
+    return list(iter_deltas(data))
+
+
+def apply_modifier_delta(game: "Game", catalog: "CardCatalog", delta: tuple) -> None:
+    _, player_id, row_value, card_id, kind, amount, change = delta
+    card = None if card_id == NO_CARD else catalog.get(card_id)
+    row = game.board.get_row(player_id, RowAffinity(row_value))
+    if change > 0:
+        row.add_modifier((kind, amount), card)
+    else:
+        row.remove_modifier((kind, amount), card)
+
+
+class DeltaPatcher:
+    """
+    Klient: trzyma lokalną kopię Game (np. z Game.from_snapshot)
+    i nanosi na nią delty, bez ponownego wczytywania całego stanu.
+    """
+
+    def __init__(self, game: "Game", catalog: "CardCatalog") -> None:
+        self.game = game
+        self.catalog = catalog
+
+    def apply_all(self, deltas: Iterable[tuple]) -> None:
+        for delta in deltas:
+            self.apply(delta)
+
+    def apply(self, delta: tuple) -> None:
+        op = delta[0]
+        game = self.game
+
+        if op == OP_PLAY:
+            _, player_id, position, card_id, row_value = delta
+            card = game.players[player_id].play_card(position)
+            if card.id != card_id:
+                raise ValueError(f"Delta out of sync: expected card {card_id}, "
+                                 f"found {card.id}")
+            game.board.place_card(player_id, card, RowAffinity(row_value))
+        elif op == OP_REMOVE:
+            _, player_id, row_value, card_id = delta
+            row = game.board.get_row(player_id, RowAffinity(row_value))
+            card = self.catalog.get(card_id)
+            if card not in row.cards:
+                raise ValueError(f"Delta out of sync: card {card_id} "
+                                 f"not in row {row.name.name}")
+            row.remove_card(card)
+        elif op == OP_MODIFIER:
+            apply_modifier_delta(game, self.catalog, delta)
+        elif op == OP_TURN:
+            game.active_player_id = delta[1]
+        elif op == OP_PASS:
+            game.players[delta[1]].has_passed = True
+            game.rebuild_turn_order()
+        elif op == OP_DRAW:
+            _, player_id, card_id = delta
+            player = game.players[player_id]
+            card = self.catalog.get(card_id)
+            deck_cards = player.deck.cards
+            if deck_cards and deck_cards[-1].id == card_id:
+                deck_cards.pop()
+            elif card in deck_cards:
+                deck_cards.remove(card)
+            player.return_card(player.hand_size(), card)
+        elif op == OP_ROUND_END:
+            winner_id = delta[1]
+            if winner_id is not None:
+                for pid in game.get_team_ids(winner_id):
+                    game.players[pid].increment_rounds_won()
+            game.last_round_winner_id = winner_id
+            game.is_round_active = False
+            game.active_player_id = None
+        elif op == OP_ROUND_START:
+            _, round_number, starting_id = delta
+            game.current_round = round_number
+            game.is_round_active = True
+            for player in game.players.values():
+                player.reset_for_new_round()
+            game.rebuild_turn_order()
+            game.starting_player_id = starting_id
+            game.active_player_id = starting_id
+            game.board.clear()
+        elif op == OP_MATCH_START:
+            game.start_match()
+        elif op == OP_SNAPSHOT:
+            self.game = type(game).from_snapshot(delta[1], self.catalog)
+        elif op == OP_MATCH_END:
+            pass
+        else:
+            raise ValueError(f"Unknown delta opcode={op}")
@@ -0,0 +1,360 @@
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.deltas import OP_REMOVE
+from src.card_duel.modifiers import Modifier, horn, weather
+
+if TYPE_CHECKING:
+    from src.card_duel.game import Game
+
+
+# Zdarzenia, na które reagują efekty kart (nazwy metod Effect)
+ON_PLAY = "on_play"              # karta została właśnie zagrana
+ON_ROUND_END = "on_round_end"    # koniec rundy, karta leży na planszy
+ON_ROW_CHANGE = "on_row_change"  # inna karta weszła do rzędu karty albo z niego zeszła
+EVENTS = (ON_PLAY, ON_ROUND_END, ON_ROW_CHANGE)
+
+# wpisy dziennika skutków efektów (cofane przez Game.undo)
+_DRAW = 0
+_DESTROY = 1
+_MODIFY = 2
+
+RowKey = Tuple[int, RowAffinity]
+
+
+class Effect:
+    """
+    Efekt przypisany do tagu karty. Podklasa wymienia w `events`
+    zdarzenia, na które reaguje, i nadpisuje odpowiadające im metody.
+    Stan gry zmienia tylko przez EffectBus (draw, destroy, modify), żeby
+    skutki dało się cofnąć i zapisać w deltach.
+    """
+
+    events: Tuple[str, ...] = ()
+
+    def on_play(self, bus: "EffectBus", card: Card, owner_id: int,
+                row: RowAffinity) -> None:
+        pass
+
+    def on_round_end(self, bus: "EffectBus", card: Card, owner_id: int,
+                     row: RowAffinity, winner_id: Optional[int]) -> None:
+        pass
+
+    def on_row_change(self, bus: "EffectBus", card: Card, owner_id: int,
+                      row: RowAffinity, changed: Card, delta: int) -> None:
+        pass
+
+
+class DrawEffect(Effect):
+    """Po zagraniu właściciel dobiera count kart z talii."""
+
+    events = (ON_PLAY,)
+
+    def __init__(self, count: int = 1) -> None:
+        self.count = count
+
+    def on_play(self, bus, card, owner_id, row):
+        bus.draw(owner_id, self.count)
+
+
+class ScorchEffect(Effect):
+    """
+    Po zagraniu niszczy najsilniejsze (wg siły efektywnej) karty
+    przeciwników w tym samym rzędzie.
+    """
+
+    events = (ON_PLAY,)
+
+    def on_play(self, bus, card, owner_id, row):
+        board = bus.game.board
+        best = None
+        targets: List[Tuple[int, Card]] = []
+        for opponent_id in bus.game.get_opponent_ids(owner_id):
+            opponent_row = board.get_row(opponent_id, row)
+            for target in opponent_row.cards:
+                power = opponent_row.card_power(target)
+                if best is None or power > best:
+                    best, targets = power, [(opponent_id, target)]
+                elif power == best:
+                    targets.append((opponent_id, target))
+        for opponent_id, target in targets:
+            bus.destroy(opponent_id, row, target)
+
+
+class ReinforceEffect(Effect):
+    """Na koniec przegranej (albo zremisowanej) rundy właściciel dobiera count kart."""
+
+    events = (ON_ROUND_END,)
+
+    def __init__(self, count: int = 1) -> None:
+        self.count = count
+
+    def on_round_end(self, bus, card, owner_id, row, winner_id):
+        if winner_id is None or owner_id not in bus.game.get_team_ids(winner_id):
+            bus.draw(owner_id, self.count)
+
+
+class VengeanceEffect(Effect):
+    """Gdy inna karta zejdzie z rzędu w trakcie rundy, właściciel dobiera kartę."""
+
+    events = (ON_ROW_CHANGE,)
+
+    def on_row_change(self, bus, card, owner_id, row, changed, delta):
+        if delta < 0:
+            bus.draw(owner_id, 1)
+
+
+class WeatherEffect(Effect):
+    """Po zagraniu pogoda w danym rzędzie wszystkich graczy (jednostki mają siłę 1)."""
+
+    events = (ON_PLAY,)
+
+    def __init__(self, lane: RowAffinity) -> None:
+        self.lane = lane
+
+    def on_play(self, bus, card, owner_id, row):
+        for player_id in bus.game.player_order:
+            if weather() not in bus.game.board.get_row(player_id, self.lane).modifiers:
+                bus.modify(player_id, self.lane, weather())
+
+
+class HornEffect(Effect):
+    """Po zagraniu róg na rzędzie właściciela, do którego trafiła karta (siła x2)."""
+
+    events = (ON_PLAY,)
+
+    def on_play(self, bus, card, owner_id, row):
+        bus.modify(owner_id, row, horn())
+
+
+class EffectRegistry:
+    """Efekty wg tagów kart (tag -> Effect)."""
+
+    def __init__(self) -> None:
+        self._by_tag: Dict[str, Effect] = {}
+
+    def register(self, tag: str, effect: Effect) -> Effect:
+        unknown = [event for event in effect.events if event not in EVENTS]
+        if unknown:
+            raise ValueError(f"Unknown effect events={unknown}")
+        if tag in self._by_tag:
+            raise ValueError(f"Effect for tag={tag!r} already registered")
+        self._by_tag[tag] = effect
+        return effect
+
+    def get(self, tag: str) -> Optional[Effect]:
+        return self._by_tag.get(tag)
+
+    def effects_for(self, card: Card) -> Tuple[Tuple[str, Effect], ...]:
+        """Pary (tag, efekt) dla tagów karty, które mają efekt."""
+        return tuple((tag, self._by_tag[tag])
+                     for tag in card.tags if tag in self._by_tag)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._by_tag
+
+    def __len__(self) -> int:
+        return len(self._by_tag)
+
+
+def default_effects() -> EffectRegistry:
+    """
+    Rejestr z wbudowanymi efektami: Draw, Scorch, Reinforce, Vengeance,
+    pogoda Frost/Fog/Rain (MELEE/RANGED/SIEGE) i Horn.
+    """
+    registry = EffectRegistry()
+    registry.register("Draw", DrawEffect())
+    registry.register("Scorch", ScorchEffect())
+    registry.register("Reinforce", ReinforceEffect())
+    registry.register("Vengeance", VengeanceEffect())
+    registry.register("Frost", WeatherEffect(RowAffinity.MELEE))
+    registry.register("Fog", WeatherEffect(RowAffinity.RANGED))
+    registry.register("Rain", WeatherEffect(RowAffinity.SIEGE))
+    registry.register("Horn", HornEffect())
+    return registry
+
+
+class EffectBus:
+    """
+    Szyna zdarzeń efektów podpięta do Game (game.effects).
+
+    Indeksy utrzymywane przyrostowo z Row.on_card_change:
+    - zdarzenie -> (gracz, rząd) -> karty na planszy, które je subskrybują,
+    - tag -> (gracz, rząd) -> karty na planszy z tym tagiem.
+    Rozwiązanie zdarzenia odwiedza tylko subskrybentów (rzędy bez nich
+    nie występują w indeksie), a nie wszystkie rzędy Board.rows_by_player.
+
+    Zmiany wykonane przez efekty wewnątrz Game.apply trafiają do dziennika,
+    który Game.undo cofa razem z akcją.
+    """
+
+    def __init__(self, game: "Game", registry: EffectRegistry) -> None:
+        self.game = game
+        self.registry = registry
+        # wyciszona szyna aktualizuje indeksy, ale nie wywołuje efektów (undo)
+        self.muted: bool = False
+
+        self._effects_by_card: Dict[int, Tuple[Tuple[str, Effect], ...]] = {}
+        self._subscribers: Dict[str, Dict[RowKey, List[Tuple[Card, Effect]]]] = {
+            event: {} for event in EVENTS
+        }
+        self._tagged: Dict[str, Dict[RowKey, List[Card]]] = {}
+        self._journal: list = []
+        self._marks: List[int] = []
+
+        game.effects = self
+        self.reindex()
+
+    def detach(self) -> None:
+        if self.game.effects is self:
+            self.game.effects = None
+
+    def _effects(self, card: Card) -> Tuple[Tuple[str, Effect], ...]:
+        # karty to niemutowalne flyweighty (tagi w krotce) – efekty liczone
+        # raz na id; po zmianie rejestru trzeba wywołać reindex()
+        effects = self._effects_by_card.get(card.id)
+        if effects is None:
+            effects = self.registry.effects_for(card)
+            self._effects_by_card[card.id] = effects
+        return effects
+
+    # --- indeksy ---
+
+    def reindex(self) -> None:
+        """Buduje indeksy od zera z kart leżących na planszy."""
+        self._effects_by_card.clear()
+        for by_row in self._subscribers.values():
+            by_row.clear()
+        self._tagged.clear()
+        for player_id, rows in self.game.board.rows_by_player.items():
+            for affinity, row in rows.items():
+                for card in row.cards:
+                    self._index(player_id, affinity, card, 1)
+
+    def _index(self, player_id: int, row: RowAffinity, card: Card, delta: int) -> None:
+        key = (player_id, row)
+        for tag, effect in self._effects(card):
+            self._update(self._tagged.setdefault(tag, {}), key, card, delta)
+            for event in effect.events:
+                # on_play dotyczy tylko zagranej karty – bez indeksu
+                if event != ON_PLAY:
+                    self._update(self._subscribers[event], key, (card, effect), delta)
+
+    @staticmethod
+    def _update(by_row: dict, key: RowKey, entry, delta: int) -> None:
+        if delta > 0:
+            by_row.setdefault(key, []).append(entry)
+            return
+        entries = by_row[key]
+        entries.remove(entry)
+        if not entries:
+            del by_row[key]
+
+    def subscribers(self, event: str) -> Iterator[Tuple[int, RowAffinity, Card, Effect]]:
+        """(gracz, rząd, karta, efekt) dla kart na planszy subskrybujących zdarzenie."""
+        for (player_id, row), entries in self._subscribers[event].items():
+            for card, effect in entries:
+                yield player_id, row, card, effect
+
+    def tagged(self, tag: str,
+               player_id: Optional[int] = None) -> List[Tuple[int, RowAffinity, Card]]:
+        """Karty na planszy z danym tagiem (opcjonalnie tylko danego gracza)."""
+        return [(pid, row, card)
+                for (pid, row), cards in self._tagged.get(tag, {}).items()
+                if player_id is None or pid == player_id
+                for card in cards]
+
+    # --- zdarzenia (wywołuje Game) ---
+
+    def row_changed(self, player_id: int, row: RowAffinity, card: Card, delta: int) -> None:
+        if self._effects(card):
+            if delta > 0:
+                # karta reaguje dopiero na kolejne zmiany, nie na swoje wejście
+                self._dispatch_row_change(player_id, row, card, delta)
+                self._index(player_id, row, card, delta)
+                return
+            self._index(player_id, row, card, delta)
+        self._dispatch_row_change(player_id, row, card, delta)
+
+    def _dispatch_row_change(self, player_id: int, row: RowAffinity,
+                             changed: Card, delta: int) -> None:
+        entries = self._subscribers[ON_ROW_CHANGE].get((player_id, row))
+        if not entries or self.muted or not self.game.is_round_active:
+            return
+        for card, effect in tuple(entries):
+            effect.on_row_change(self, card, player_id, row, changed, delta)
+
+    def card_played(self, card: Card, owner_id: int, row: RowAffinity) -> None:
+        if self.muted:
+            return
+        for _, effect in self._effects(card):
+            if ON_PLAY in effect.events:
+                effect.on_play(self, card, owner_id, row)
+
+    def round_ended(self, winner_id: Optional[int]) -> None:
+        if self.muted:
+            return
+        for player_id, row, card, effect in tuple(self.subscribers(ON_ROUND_END)):
+            effect.on_round_end(self, card, player_id, row, winner_id)
+
+    # --- zmiany stanu wykonywane przez efekty ---
+
+    def draw(self, player_id: int, n: int = 1) -> List[Card]:
+        drawn = self.game.players[player_id].draw_from_deck(n)
+        if drawn and self._marks:
+            self._journal.append((_DRAW, player_id, drawn))
+        return drawn
+
+    def destroy(self, player_id: int, row_affinity: RowAffinity, card: Card) -> None:
+        row = self.game.board.get_row(player_id, row_affinity)
+        try:
+            index = row.cards.index(card)
+        except ValueError:
+            raise ValueError(f"Card id={card.id} is not in row "
+                             f"{row_affinity.name} of player_id={player_id}")
+        if self._marks:
+            self._journal.append((_DESTROY, player_id, row_affinity, index, card))
+        row.remove_card(card)
+        if self.game.delta_sink is not None:
+            self.game.delta_sink((OP_REMOVE, player_id, row_affinity.value, card.id))
+
+    def modify(self, player_id: int, row_affinity: RowAffinity,
+               modifier: Modifier, card: Optional[Card] = None) -> None:
+        """Dodaje modyfikator rzędu (albo karty w rzędzie)."""
+        self.game.board.add_modifier(player_id, row_affinity, modifier, card)
+        if self._marks:
+            self._journal.append((_MODIFY, player_id, row_affinity, modifier, card))
+
+    # --- dziennik dla Game.apply / Game.undo ---
+
+    def begin_action(self) -> None:
+        self._marks.append(len(self._journal))
+
+    def commit_action(self) -> None:
+        """Zatwierdza ostatnią akcję – jej skutków nie da się już cofnąć osobno."""
+        self._marks.pop()
+        if not self._marks:
+            # żadna otwarta akcja nie cofnie już tych wpisów
+            self._journal.clear()
+
+    def undo_action(self) -> None:
+        """Cofa skutki efektów ostatniej akcji (w odwrotnej kolejności), bez zdarzeń."""
+        mark = self._marks.pop()
+        journal = self._journal
+        players = self.game.players
+        muted, self.muted = self.muted, True
+        while len(journal) > mark:
+            entry = journal.pop()
+            if entry[0] == _DRAW:
+                _, player_id, cards = entry
+                player = players[player_id]
+                for card in reversed(cards):
+                    player.play_card(player.hand_size() - 1)
+                    player.deck.cards.append(card)
+            elif entry[0] == _DESTROY:
+                _, player_id, row_affinity, index, card = entry
+                self.game.board.get_row(player_id, row_affinity).insert_card(index, card)
+            else:
+                _, player_id, row_affinity, modifier, card = entry
+                self.game.board.remove_modifier(player_id, row_affinity, modifier, card)
+        self.muted = muted
@@ -0,0 +1,231 @@
+import mmap
+import os
+import struct
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from src.card_duel.card import RowAffinity
+from src.card_duel.deltas import (OP_MATCH_START, OP_ROUND_START, OP_DRAW,
+                                  OP_PLAY, OP_PASS, OP_TURN, OP_ROUND_END,
+                                  OP_SNAPSHOT, OP_MATCH_END, OP_REMOVE,
+                                  OP_MODIFIER, DeltaStreamTruncated,
+                                  apply_modifier_delta, encode_delta,
+                                  iter_deltas)
+
+if TYPE_CHECKING:
+    from src.card_duel.catalog import CardCatalog
+    from src.card_duel.game import Game
+
+
+LOG_MAGIC = b"CDLG"
+# 2: kwota w OP_MODIFIER jako int32
+LOG_VERSION = 2
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+# magic, wersja formatu
+_FILE_HEADER = struct.Struct("<4sB")
+
+# Plik logu: nagłówek, a po nim mecze jeden za drugim. Mecz to
+# OP_SNAPSHOT (stan przed start_match, w tym kolejność talii),
+# delty z Game.delta_sink i OP_MATCH_END.
+
+
+class MatchLogWriter:
+    """
+    Dopisuje mecze do binarnego logu (tylko append).
+    Delty są kodowane od razu i trafiają do bufora; na dysk idą
+    porcjami po buffer_size bajtów oraz przy flush()/close().
+    """
+
+    def __init__(self, path: str, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive")
+
+        self.path = path
+        self.buffer_size = buffer_size
+        self.matches_written: int = 0
+        self._buffer = bytearray()
+        self._game: Optional["Game"] = None
+
+        self._file = open(path, "a+b")
+        self._file.seek(0)
+        header = self._file.read(_FILE_HEADER.size)
+        if not header:
+            self._file.write(_FILE_HEADER.pack(LOG_MAGIC, LOG_VERSION))
+        else:
+            try:
+                _check_header(header)
+            except ValueError:
+                self._file.close()
+                raise
+
+    def begin_match(self, game: "Game") -> None:
+        """Zapisuje stan początkowy i podpina log jako delta_sink gry."""
+        if self._game is not None:
+            raise ValueError("Another match is already being logged")
+        if game.delta_sink is not None:
+            raise ValueError("Game already has a delta sink")
+
+        self._game = game
+        self._append((OP_SNAPSHOT, game.to_snapshot()))
+        game.delta_sink = self._append
+
+    def end_match(self) -> None:
+        if self._game is None:
+            raise ValueError("No match is being logged")
+        self._game.delta_sink = None
+        self._game = None
+        self._append((OP_MATCH_END,))
+        self.matches_written += 1
+
+    def abort_match(self) -> None:
+        """Odpina log bez OP_MATCH_END – przy odtwarzaniu mecz jest pomijany."""
+        if self._game is not None:
+            self._game.delta_sink = None
+            self._game = None
+
+    def _append(self, delta: tuple) -> None:
+        self._buffer += encode_delta(delta)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.abort_match()
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "MatchLogWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _check_header(header: bytes) -> None:
+    try:
+        magic, version = _FILE_HEADER.unpack_from(header, 0)
+    except struct.error:
+        raise ValueError("Match log too short")
+    if magic != LOG_MAGIC:
+        raise ValueError("Not a match log")
+    if version != LOG_VERSION:
+        raise ValueError(f"Unsupported match log version={version}")
+
+
+def _diverged(what: str, expected, found) -> ValueError:
+    return ValueError(f"Log replay diverged: expected {what} {expected}, "
+                      f"found {found}")
+
+
+class MatchReplayer:
+    """
+    Odtwarza delty z logu, wykonując je na Game (play_card, pass_turn,
+    start_round, dobieranie z talii) – stan liczą reguły silnika.
+    Przy verify=True zapisane skutki (karty, tura, zwycięzca rundy)
+    są porównywane ze stanem gry. Efekty kart nie są wykonywane
+    ponownie – ich skutki są w logu (OP_DRAW, OP_REMOVE, OP_MODIFIER).
+    """
+
+    def __init__(self, catalog: "CardCatalog", verify: bool = True) -> None:
+        self.catalog = catalog
+        self.verify = verify
+        self.game: Optional["Game"] = None
+
+    def apply(self, delta: tuple) -> None:
+        op = delta[0]
+        game = self.game
+
+        if op == OP_SNAPSHOT:
+            # początek meczu albo resynchronizacja po Game.undo
+            from src.card_duel.game import Game
+            self.game = Game.from_snapshot(delta[1], self.catalog)
+            return
+        if game is None:
+            raise ValueError("Match log record before initial snapshot")
+
+        if op == OP_PLAY:
+            _, player_id, position, card_id, row_value = delta
+            if self.verify:
+                hand = game.players[player_id].hand
+                found = hand[position].id if position < len(hand) else None
+                if found != card_id:
+                    raise _diverged("card", card_id, found)
+            game.play_card(player_id, position, RowAffinity(row_value))
+        elif op == OP_PASS:
+            game.pass_turn(delta[1])
+        elif op == OP_DRAW:
+            _, player_id, card_id = delta
+            drawn = game.players[player_id].draw_from_deck(1)
+            if self.verify:
+                found = drawn[0].id if drawn else None
+                if found != card_id:
+                    raise _diverged("drawn card", card_id, found)
+        elif op == OP_REMOVE:
+            _, player_id, row_value, card_id = delta
+            row = game.board.get_row(player_id, RowAffinity(row_value))
+            card = self.catalog.get(card_id)
+            if card not in row.cards:
+                raise _diverged(f"card in row {row.name.name}", card_id, None)
+            row.remove_card(card)
+        elif op == OP_MODIFIER:
+            apply_modifier_delta(game, self.catalog, delta)
+        elif op == OP_ROUND_START:
+            _, round_number, starting_id = delta
+            game.start_round()
+            if self.verify and (game.current_round, game.starting_player_id) \
+                    != (round_number, starting_id):
+                raise _diverged("round start", (round_number, starting_id),
+                                (game.current_round, game.starting_player_id))
+        elif op == OP_MATCH_START:
+            game.start_match()
+        elif op == OP_TURN:
+            if self.verify and game.active_player_id != delta[1]:
+                raise _diverged("active player", delta[1],
+                                game.active_player_id)
+        elif op == OP_ROUND_END:
+            # rundę kończy sam silnik w play_card/pass_turn
+            if self.verify and (game.is_round_active
+                                or game.last_round_winner_id != delta[1]):
+                raise _diverged("round winner", delta[1],
+                                game.last_round_winner_id)
+        elif op != OP_MATCH_END:
+            raise ValueError(f"Unknown delta opcode={op}")
+
+
+def replay_log(path: str,
+               catalog: "CardCatalog",
+               verify: bool = True) -> Iterator["Game"]:
+    """
+    Mapuje plik logu do pamięci i zwraca kolejno odtworzone mecze
+    (Game w stanie końcowym). Mecze bez OP_MATCH_END (przerwane,
+    abort_match) są pomijane – także ostatni, którego zapis urwała
+    awaria w połowie rekordu. Błędne dane wewnątrz pliku dają ValueError.
+    """
+    if os.path.getsize(path) == 0:
+        raise ValueError("Match log too short")
+
+    with open(path, "rb") as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        _check_header(data[:_FILE_HEADER.size])
+
+        replayer = MatchReplayer(catalog, verify)
+        deltas = iter_deltas(data, _FILE_HEADER.size)
+        try:
+            for delta in deltas:
+                replayer.apply(delta)
+                if delta[0] == OP_MATCH_END:
+                    yield replayer.game
+                    replayer.game = None
+        except DeltaStreamTruncated:
+            # urwany ogon pliku – nieukończony mecz, jak po abort_match
+            return
+        finally:
+            # zwalnia memoryview na mmap przed jego zamknięciem
+            deltas.close()
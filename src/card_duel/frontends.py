@@ -0,0 +1,58 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Frontend = para (input_handler, renderer) dla GameController.
+# Fabryki importują swój backend dopiero przy wywołaniu, więc sam rejestr
+# (i np. procesy symulacji) nie ładuje ani CLI, ani pygame.
+Frontend = Tuple[object, object]
+FrontendFactory = Callable[..., Frontend]
+
+_FACTORIES: Dict[str, FrontendFactory] = {}
+
+
+def register_frontend(name: str, factory: FrontendFactory) -> None:
+    if name in _FACTORIES:
+        raise ValueError(f"Frontend {name!r} is already registered")
+    _FACTORIES[name] = factory
+
+
+def frontend_names() -> List[str]:
+    return sorted(_FACTORIES)
+
+
+def create_frontend(name: str, **options) -> Frontend:
+    """(input_handler, renderer) wybranego frontendu; options trafiają do fabryki."""
+    try:
+        factory = _FACTORIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown frontend={name!r}, expected one of {frontend_names()}")
+    return factory(**options)
+
+
+def _cli_frontend(mode: Optional[str] = None, stream=None) -> Frontend:
+    from src.card_duel.cli.input_handler import InputHandlerCLI
+    from src.card_duel.cli.renderer_cli import MODE_PLAIN, RendererCLI
+
+    return InputHandlerCLI(), RendererCLI(mode or MODE_PLAIN, stream)
+
+
+def _pygame_frontend(width: int = 1024, height: int = 768, fps: Optional[int] = None) -> Frontend:
+    # pygame.init() i okno dopiero tutaj – nigdy w trybie headless
+    from src.card_duel.pygame_ui import DEFAULT_FPS, InputHandlerPygame, RendererPygame
+
+    renderer = RendererPygame(width, height)
+    return InputHandlerPygame(renderer, fps or DEFAULT_FPS), renderer
+
+
+def _null_frontend(input_handler=None) -> Frontend:
+    """Bez wyjścia; decyzje podejmuje podany input_handler (np. bot)."""
+    from src.card_duel.headless.renderer_null import RendererNull
+
+    if input_handler is None:
+        raise ValueError("The null frontend needs an input_handler (e.g. a bot)")
+    return input_handler, RendererNull()
+
+
+register_frontend("cli", _cli_frontend)
+register_frontend("pygame", _pygame_frontend)
+register_frontend("null", _null_frontend)
@@ -1,64 +1,245 @@
-from src.card_duel.card import RowAffinity
+from contextlib import contextmanager
+from functools import partial
+from src.card_duel.actions import (Action, PLAY, PASS, PASS_ACTION,
+                                   play_action, rows_for_affinity)
+from src.card_duel.card import Card, RowAffinity
 from src.card_duel.board import Board
+from src.card_duel.deltas import (OP_MATCH_START, OP_ROUND_START, OP_DRAW,
+                                  OP_PLAY, OP_PASS, OP_TURN, OP_ROUND_END,
+                                  OP_SNAPSHOT, OP_MODIFIER, NO_CARD)
 from src.card_duel.player import Player
 from src.card_duel.rules import Rules
-from typing import List
+from src.card_duel.zobrist import (HAND_ZONE, MODIFIER_ZONE, ZobristCards,
+                                  flag_key, zobrist_key)
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.card_duel.effects import EffectBus
 
 
 class Game:
     def __init__(self,
                  players: List[Player],
                  board: Board,
-                 rules: Rules) -> None:
+                 rules: Rules,
+                 teams: Optional[List[List[int]]] = None) -> None:
+        """
+        players – w kolejności miejsc przy stole (tak krąży tura).
+        teams – opcjonalny podział id graczy na drużyny (np. 2v2);
+        bez niego każdy gra sam (free-for-all, dla 2 graczy pojedynek).
+        """
 
         if not players:
             raise ValueError("Game requires at least one player")
-        if len(players) != 2:
-            raise ValueError("Current implementation supports "
-                             "exactly 2 players")
+        if len(players) < 2:
+            raise ValueError("Game requires at least 2 players")
 
         self.players: dict[int, Player] = {p.id: p for p in players}
         self.player_order: list[int] = [p.id for p in players]
+        if len(self.players) != len(players):
+            raise ValueError("Player ids must be unique")
+        self._init_teams(teams)
+
+        # stały pierścień miejsc i pierścień graczy, którzy w tej rundzie
+        # nie spasowali (lista dwukierunkowa – pas i undo w O(1))
+        order = self.player_order
+        self._next_seat: dict[int, int] = {
+            pid: order[(i + 1) % len(order)] for i, pid in enumerate(order)
+        }
+        self._turn_next: dict[int, int] = {}
+        self._turn_prev: dict[int, int] = {}
+        self.rebuild_turn_order()
         self.board: Board = board
         self.rules = rules
         self.current_round: int = 0
         self.active_player_id: int | None = None
         self.starting_player_id = self.player_order[0]
-        self.is_round_active: bool = False
+        # is_round_active (property) – zmiana przełącza klucz w hashu
+        self._round_active: bool = False
+        self.last_round_winner_id: int | None = None
+        # odbiorca delt stanu (np. list.append albo wysyłka do klienta)
+        self.delta_sink: Optional[Callable[[tuple], None]] = None
+        # efekty kart (ustawia EffectBus); bez niego tagi kart nic nie robią
+        self.effects: Optional["EffectBus"] = None
+
+        # legal_actions: wynik dla ręki gracza ważny, dopóki wersja
+        # ręki (podbijana przy każdej zmianie kart w ręce) się nie zmieni
+        self._hand_versions: dict[int, int] = {pid: 0 for pid in self.player_order}
+        self._legal_cache: dict[int, tuple] = {}
+
+        # hash kart i flag aktualizowany przez Player/Row przy każdej zmianie
+        self._zobrist = ZobristCards()
+        for player_id, player in self.players.items():
+            player.on_hand_change = partial(self._on_zone_change,
+                                            HAND_ZONE, player_id)
+            player.on_flag_change = partial(self._on_flag_change, player_id)
+            for affinity, row in self.board.rows_by_player[player_id].items():
+                row.on_card_change = partial(self._on_zone_change,
+                                             affinity.value, player_id)
+                row.on_modifier_change = partial(self._on_modifier_change,
+                                                 affinity, player_id)
+        self.rehash()
+
+    @property
+    def is_round_active(self) -> bool:
+        return self._round_active
+
+    @is_round_active.setter
+    def is_round_active(self, value: bool) -> None:
+        if value != self._round_active:
+            self._zobrist.toggle(zobrist_key("round_active"))
+        self._round_active = value
+
+    def _init_teams(self, teams: Optional[List[List[int]]]) -> None:
+        if teams is None:
+            groups = [(pid,) for pid in self.player_order]
+        else:
+            groups = [tuple(team) for team in teams]
+            members = [pid for team in groups for pid in team]
+            if any(not team for team in groups) or len(groups) < 2:
+                raise ValueError("Teams require at least 2 non-empty teams")
+            if sorted(members) != sorted(self.player_order):
+                raise ValueError("Teams must split all players exactly once")
+
+        self.teams: Optional[list[tuple[int, ...]]] = None if teams is None else groups
+        self.team_by_player: dict[int, int] = {
+            pid: index for index, team in enumerate(groups) for pid in team
+        }
+        self._team_members: dict[int, tuple[int, ...]] = {
+            pid: team for team in groups for pid in team
+        }
+        self._opponents: dict[int, tuple[int, ...]] = {
+            pid: tuple(other for other in self.player_order
+                       if self.team_by_player[other] != self.team_by_player[pid])
+            for pid in self.player_order
+        }
+
+    def rebuild_turn_order(self) -> None:
+        """
+        Odbudowuje pierścień tury z flag has_passed (np. po ich ręcznej
+        zmianie). Dla każdego gracza: najbliższy niespasowany gracz
+        za nim i przed nim w kolejności miejsc.
+        """
+        order = self.player_order
+        n = len(order)
+        following = preceding = None
+        for k in range(2 * n - 1, -1, -1):
+            pid = order[k % n]
+            if k < n:
+                self._turn_next[pid] = pid if following is None else following
+            if not self.players[pid].has_passed:
+                following = pid
+        for k in range(2 * n):
+            pid = order[k % n]
+            if k >= n:
+                self._turn_prev[pid] = pid if preceding is None else preceding
+            if not self.players[pid].has_passed:
+                preceding = pid
+
+    def _leave_turn_order(self, player_id: int) -> None:
+        prev_id = self._turn_prev[player_id]
+        next_id = self._turn_next[player_id]
+        if self._turn_next[prev_id] != player_id:
+            return  # już poza pierścieniem
+        self._turn_next[prev_id] = next_id
+        self._turn_prev[next_id] = prev_id
+
+    def _rejoin_turn_order(self, player_id: int) -> None:
+        # odwrotność _leave_turn_order (wskaźniki gracza zostały bez zmian)
+        self._turn_next[self._turn_prev[player_id]] = player_id
+        self._turn_prev[self._turn_next[player_id]] = player_id
+
+    def next_player_id(self, player_id: int) -> int:
+        """Następny gracz w kolejności, który nie spasował (pomija spasowanych)."""
+        next_id = self._turn_next[player_id]
+        if self.players[next_id].has_passed:
+            # flagi zmienione z pominięciem Game – odtwarzamy pierścień
+            self.rebuild_turn_order()
+            next_id = self._turn_next[player_id]
+        return next_id
 
     def start_match(self) -> None:
         self.current_round = 0
         self.is_round_active = False
+        self.last_round_winner_id = None
         self.board.clear()
         self.active_player_id = self.player_order[0]
         self.starting_player_id = self.player_order[0]
         for player in self.players.values():
             player.reset_for_new_match()
+        self.rebuild_turn_order()
+        if self.delta_sink is not None:
+            self.delta_sink((OP_MATCH_START,))
 
     def start_round(self) -> None:
+        # plansza czyszczona przed startem rundy – bez zdarzeń on_row_change
+        self.board.clear()
         self.current_round += 1
         self.is_round_active = True
         for player in self.players.values():
             player.reset_for_new_round()
+        self.rebuild_turn_order()
 
         if self.current_round > 1:
-            self.starting_player_id = self.get_opponent_id(self.starting_player_id)
+            # rozpoczyna następne miejsce przy stole
+            self.starting_player_id = self._next_seat[self.starting_player_id]
 
         self.active_player_id = self.starting_player_id
-        self.board.clear()
+        if self.delta_sink is not None:
+            self.delta_sink((OP_ROUND_START, self.current_round,
+                             self.starting_player_id))
 
     def get_active_player_id(self) -> int | None:
         return self.active_player_id
 
     def get_opponent_id(self, player_id: int) -> int:
-        if player_id not in self.players:
+        opponents = self._opponents.get(player_id)
+        if opponents is None:
+            raise ValueError(f"Unknown player_id={player_id}")
+        if len(opponents) != 1:
+            raise ValueError(f"player_id={player_id} has {len(opponents)} "
+                             f"opponents, use get_opponent_ids")
+        return opponents[0]
+
+    def get_opponent_ids(self, player_id: int) -> Tuple[int, ...]:
+        opponents = self._opponents.get(player_id)
+        if opponents is None:
             raise ValueError(f"Unknown player_id={player_id}")
+        return opponents
+
+    def get_team_ids(self, player_id: int) -> Tuple[int, ...]:
+        """Gracze z drużyny player_id (w free-for-all tylko on sam)."""
+        return self._team_members[player_id]
+
+    def get_team_power(self, player_id: int) -> int:
+        return sum(self.board.get_total_power(pid)
+                   for pid in self._team_members[player_id])
+
+    def legal_actions(self, player_id: int) -> Tuple[Action, ...]:
+        """
+        Dozwolone akcje gracza: PASS oraz zagranie każdej karty z ręki
+        (po indeksie) do rzędu zgodnego z jej row_affinity (ANY – każdy).
+        Pusta krotka, gdy gracz nie ma ruchu; po pasie tylko PASS.
+        Wynik jest cache'owany do najbliższej zmiany ręki gracza.
+        """
+        if player_id != self.active_player_id or not self.is_round_active:
+            return ()
+        player = self.players[player_id]
+        if player.has_passed:
+            return (PASS_ACTION,)
 
-        for player in self.players.keys():
-            if player != player_id:
-                return player
+        version = self._hand_versions[player_id]
+        cached = self._legal_cache.get(player_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
-        raise ValueError(f"No opponent found for player_id={player_id}")
+        actions = [PASS_ACTION]
+        for idx, card in enumerate(player.hand):
+            for row_affinity in rows_for_affinity(card.row_affinity):
+                actions.append(play_action(idx, row_affinity))
+        actions = tuple(actions)
+        self._legal_cache[player_id] = (version, actions)
+        return actions
 
     def play_card(self,
                   player_id: int,
@@ -72,13 +253,25 @@ class Game:
         if not self.is_round_active:
             raise ValueError("Cannot play card when round is not active")
 
-        card = self.players[player_id].play_card(card_index)
+        player = self.players[player_id]
+        try:
+            affinity = player.hand[card_index].row_affinity
+        except IndexError:
+            raise ValueError("Invalid card index")
+        # ta sama reguła co w legal_actions – karta tylko do swojego rzędu
+        if row_affinity not in rows_for_affinity(affinity):
+            raise ValueError(f"Card with row_affinity={affinity.name} "
+                             f"cannot be played to {row_affinity.name}")
+        card = player.play_card(card_index)
         self.board.place_card(player_id, card, row_affinity)
+        if self.delta_sink is not None:
+            position = card_index if card_index >= 0 else card_index + player.hand_size() + 1
+            self.delta_sink((OP_PLAY, player_id, position, card.id,
+                             row_affinity.value))
+        if self.effects is not None:
+            card.on_play(self, player_id, row_affinity)
 
-        if self.is_round_over():
-            self.end_round()
-        else:
-            self.active_player_id = self.get_opponent_id(player_id)
+        self._finish_turn(player_id)
 
     def pass_turn(self, player_id: int) -> None:
         if player_id != self.active_player_id:
@@ -88,29 +281,218 @@ class Game:
             raise ValueError("Cannot pass when round is not active")
 
         self.players[player_id].pass_round()
+        self._leave_turn_order(player_id)
+        if self.delta_sink is not None:
+            self.delta_sink((OP_PASS, player_id))
 
+        self._finish_turn(player_id)
+
+    def _finish_turn(self, player_id: int) -> None:
         if self.is_round_over():
             self.end_round()
         else:
-            self.active_player_id = self.get_opponent_id(player_id)
+            self.active_player_id = self.next_player_id(player_id)
+            if self.delta_sink is not None:
+                self.delta_sink((OP_TURN, self.active_player_id))
 
     def is_round_over(self) -> bool:
         return self.rules.is_round_over(list(self.players.values()))
 
     def end_round(self) -> None:
         player_list = list(self.players.values())
-        winner_id = self.rules.get_round_winner_id(self.board, player_list)
+        if self.teams is None:
+            winner_id = self.rules.get_round_winner_id(self.board, player_list)
+            winner_ids = [] if winner_id is None else [winner_id]
+        else:
+            # rundę wygrywa drużyna – rundy liczy się każdemu jej członkowi
+            winner_ids = self.rules.get_team_round_winner_ids(self.board, self.teams)
+            winner_id = winner_ids[0] if winner_ids else None
 
-        if winner_id is not None:
-            self.players[winner_id].increment_rounds_won()
+        for pid in winner_ids:
+            self.players[pid].increment_rounds_won()
+        self.last_round_winner_id = winner_id
         self.is_round_active = False
         self.active_player_id = None
+        if self.delta_sink is not None:
+            self.delta_sink((OP_ROUND_END, winner_id))
+        if self.effects is not None:
+            self.effects.round_ended(winner_id)
+
+    def apply(self, action: Action) -> tuple:
+        """
+        Wykonuje akcję aktywnego gracza i zwraca token dla undo().
+        Tokeny trzeba cofać w odwrotnej kolejności (stos), bez kopiowania stanu.
+        Token, którego nie cofamy, należy przekazać do commit() – inaczej
+        dziennik efektów (EffectBus) rośnie z każdą akcją.
+        """
+        player_id = self.active_player_id
+        if player_id is None:
+            raise ValueError("No active player")
+        player = self.players[player_id]
+        prev_last_winner = self.last_round_winner_id
+        effects = self.effects
+        if effects is not None:
+            # skutki efektów tej akcji trafiają do dziennika dla undo()
+            effects.begin_action()
+
+        try:
+            if action.kind == PLAY:
+                hand = player.hand
+                try:
+                    removed = hand[action.card_index]
+                except (IndexError, TypeError):
+                    raise ValueError("Invalid card index")
+                position = action.card_index % len(hand)
+                self.play_card(player_id, action.card_index, action.row_affinity)
+                detail = (position, removed, action.row_affinity)
+            elif action.kind == PASS:
+                had_passed = player.has_passed
+                self.pass_turn(player_id)
+                detail = (had_passed,)
+            else:
+                raise ValueError(f"Unknown action kind={action.kind}")
+        except BaseException:
+            if effects is not None:
+                effects.undo_action()
+            raise
+
+        round_ended = not self.is_round_active
+        return (action.kind, player_id, detail, round_ended,
+                self.last_round_winner_id, prev_last_winner)
+
+    def undo(self, token: tuple) -> None:
+        """Cofa akcję wykonaną przez apply() – przywraca stan 1:1."""
+        kind, player_id, detail, round_ended, winner_id, prev_last_winner = token
+        player = self.players[player_id]
+        # cofnięcia są rzadkie poza wyszukiwaniem – klient dostaje pełny stan
+        sink, self.delta_sink = self.delta_sink, None
+        effects = self.effects
+        if effects is not None:
+            # najpierw skutki efektów (dobrania, zniszczenia), potem sama akcja
+            effects.undo_action()
+            effects.muted = True
+
+        if round_ended:
+            if winner_id is not None:
+                for pid in self._team_members[winner_id]:
+                    self.players[pid].rounds_won -= 1
+            self.is_round_active = True
+        self.last_round_winner_id = prev_last_winner
+        self.active_player_id = player_id
+
+        if kind == PLAY:
+            position, removed, row_affinity = detail
+            self.board.get_row(player_id, row_affinity).pop_card()
+            player.return_card(position, removed)
+        else:
+            player.has_passed = detail[0]
+            if not player.has_passed:
+                self._rejoin_turn_order(player_id)
+
+        if effects is not None:
+            effects.muted = False
+        self.delta_sink = sink
+        if sink is not None:
+            sink((OP_SNAPSHOT, self.to_snapshot()))
+
+    def commit(self, token: tuple) -> None:
+        """Porzuca token z apply() – akcja zostaje; zatwierdza się od ostatniego, jak undo()."""
+        if self.effects is not None:
+            self.effects.commit_action()
+
+    @contextmanager
+    def speculative(self) -> Iterator["Game"]:
+        """
+        Ruchy próbne (apply/undo, np. w MCTS) bez wysyłania delt.
+        Wszystko w bloku trzeba cofnąć – po wyjściu sink wraca na miejsce.
+        """
+        sink, self.delta_sink = self.delta_sink, None
+        try:
+            yield self
+        finally:
+            self.delta_sink = sink
 
     def is_match_over(self) -> bool:
         return self.rules.is_match_over(list(self.players.values()))
 
     def get_match_winner_id(self) -> int | None:
-        return self.rules.get_match_winner_id(list(self.players.values()))
+        if self.teams is None:
+            return self.rules.get_match_winner_id(list(self.players.values()))
+        winner_ids = self.get_match_winner_ids()
+        return winner_ids[0] if winner_ids else None
+
+    def get_match_winner_ids(self) -> List[int]:
+        """Zwycięzcy meczu – cała drużyna albo jeden gracz; pusto przy remisie."""
+        if self.teams is None:
+            winner_id = self.get_match_winner_id()
+            return [] if winner_id is None else [winner_id]
+        return self.rules.get_team_match_winner_ids(list(self.players.values()),
+                                                    self.teams)
+
+    def _on_zone_change(self,
+                        zone: int,
+                        player_id: int,
+                        card: Card,
+                        delta: int) -> None:
+        self._zobrist.update(zone, player_id, card.id, delta)
+        if zone == HAND_ZONE:
+            self._hand_versions[player_id] += 1
+            if delta > 0 and self.delta_sink is not None:
+                self.delta_sink((OP_DRAW, player_id, card.id))
+        elif self.effects is not None:
+            self.effects.row_changed(player_id, RowAffinity(zone), card, delta)
+
+    def _on_flag_change(self, player_id: int, flag: str, old, new) -> None:
+        self._zobrist.toggle(flag_key(flag, player_id, old)
+                             ^ flag_key(flag, player_id, new))
+
+    def _on_modifier_change(self,
+                            affinity: RowAffinity,
+                            player_id: int,
+                            modifier: tuple,
+                            card_id: Optional[int],
+                            delta: int) -> None:
+        card_id = NO_CARD if card_id is None else card_id
+        self._zobrist.update(MODIFIER_ZONE + affinity.value, player_id,
+                             (card_id, *modifier), delta)
+        if self.delta_sink is not None:
+            self.delta_sink((OP_MODIFIER, player_id, affinity.value, card_id,
+                             *modifier, delta))
+
+    def rehash(self) -> None:
+        """
+        Przelicza hash kart i flag od zera (np. po ręcznej podmianie
+        player.hand) i unieważnia cache legal_actions.
+        """
+        self._zobrist.reset()
+        self._legal_cache.clear()
+        if self._round_active:
+            self._zobrist.toggle(zobrist_key("round_active"))
+        for player_id, player in self.players.items():
+            self._zobrist.toggle(flag_key("passed", player_id, player.has_passed)
+                                 ^ flag_key("won", player_id, player.rounds_won))
+            for card in player.hand:
+                self._zobrist.update(HAND_ZONE, player_id, card.id, 1)
+            for affinity, row in self.board.rows_by_player[player_id].items():
+                for card in row.cards:
+                    self._zobrist.update(affinity.value, player_id, card.id, 1)
+                zone = MODIFIER_ZONE + affinity.value
+                for modifier in row.modifiers:
+                    self._zobrist.update(zone, player_id, (NO_CARD, *modifier), 1)
+                for card_id, modifiers in row.card_modifiers.items():
+                    for modifier in modifiers:
+                        self._zobrist.update(zone, player_id, (card_id, *modifier), 1)
+
+    def zobrist_hash(self) -> int:
+        """
+        64-bitowy hash pozycji: ręce, rzędy, modyfikatory, pasy, wygrane rundy,
+        aktywny gracz i runda. Karty i flagi (pas, wygrane, aktywna runda)
+        są w hashu przyrostowym; przy odczycie dochodzą tylko runda
+        i aktywny gracz.
+        """
+        return (self._zobrist.value
+                ^ zobrist_key("round", self.current_round)
+                ^ zobrist_key("active", self.active_player_id))
 
     def serialize(self) -> dict:
         return {
@@ -126,3 +508,14 @@ class Game:
             "starting_player_id": self.starting_player_id,
             "is_round_active": self.is_round_active,
         }
+
+    def to_snapshot(self) -> bytes:
+        """Kompaktowy zapis binarny (zob. snapshot.encode_snapshot)."""
+        from src.card_duel.snapshot import encode_snapshot
+        return encode_snapshot(self)
+
+    @classmethod
+    def from_snapshot(cls, data: bytes, catalog) -> "Game":
+        """Odtwarza mecz z to_snapshot(); karty pobierane z CardCatalog."""
+        from src.card_duel.snapshot import decode_snapshot
+        return decode_snapshot(data, catalog)
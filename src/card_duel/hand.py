@@ -0,0 +1,176 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional
+
+from src.card_duel.card import Card, RowAffinity
+
+
+# odstęp między kolejnymi numerami slotów – restore_at wstawia kartę
+# w środek luki, bez przenumerowania pozostałych
+SLOT_GAP = 1 << 20
+
+
+class Hand(list):
+    """
+    Ręka gracza: lista kart (odczyt jak zwykła lista) plus indeksy
+    po row_affinity i base_power. Zmiany tylko przez metody poniżej –
+    pozostałe mutatory listy są zablokowane, żeby indeksy nie rozjechały
+    się z zawartością.
+
+    Semantyka indeksów (kolejność kart jest stabilna – to widzi gracz):
+    - append dokłada kartę na koniec (pozycja len-1),
+    - remove_at(i) usuwa dokładnie kartę z pozycji i; dalsze karty
+      przesuwają się o jedną pozycję w lewo,
+    - restore_at(i, card) odwraca remove_at(i) (Game.undo).
+
+    Indeksy nie trzymają pozycji (te przesuwają się przy każdym
+    usunięciu), tylko rosnące numery slotów; pozycja karty to bisect
+    jej slotu w _slots. Dla każdego row_affinity (None = wszystkie karty)
+    posortowana lista sił i posortowane sloty w każdym kubełku siły,
+    więc strongest/weakest kosztują O(log n).
+
+    Koszt: remove_at i restore_at są O(n) – przesunięcie listy kart
+    i _slots (memmove) oraz kubełka siły. To świadomy wybór: swap-remove
+    byłby O(1), ale zmieniałby pozycje kart, które widzi gracz, oraz
+    indeksy akcji zapisane w deltach i logach. Ręka ma kilkanaście kart,
+    więc przesunięcie jest tańsze niż utrzymywanie osobnego porządku.
+    """
+
+    __slots__ = ("_slots", "_powers", "_buckets", "_counts")
+
+    def __init__(self, cards: Optional[Iterable[Card]] = None) -> None:
+        super().__init__()
+        # slot karty z pozycji i (rosnąco, równolegle do listy)
+        self._slots: List[int] = []
+        # affinity -> posortowane różne base_power
+        self._powers: Dict[Optional[RowAffinity], List[int]] = {}
+        # affinity -> base_power -> posortowane sloty
+        self._buckets: Dict[Optional[RowAffinity], Dict[int, List[int]]] = {}
+        self._counts: Dict[Optional[RowAffinity], int] = {}
+        for card in cards or ():
+            self.append(card)
+
+    # --- indeksy ---
+
+    def _add(self, slot: int, card: Card) -> None:
+        power = card.base_power
+        for key in (None, card.row_affinity):
+            buckets = self._buckets.get(key)
+            if buckets is None:
+                buckets = self._buckets[key] = {}
+                self._powers[key] = []
+            bucket = buckets.get(power)
+            if bucket is None:
+                buckets[power] = [slot]
+                insort(self._powers[key], power)
+            else:
+                insort(bucket, slot)
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def _discard(self, slot: int, card: Card) -> None:
+        power = card.base_power
+        for key in (None, card.row_affinity):
+            buckets = self._buckets[key]
+            bucket = buckets[power]
+            if len(bucket) == 1:
+                del buckets[power]
+                powers = self._powers[key]
+                del powers[bisect_left(powers, power)]
+            else:
+                del bucket[bisect_left(bucket, slot)]
+            self._counts[key] -= 1
+
+    def _renumber(self) -> None:
+        # luka między sąsiadami się wyczerpała – sloty od nowa, co SLOT_GAP
+        cards = list(self)
+        self.clear()
+        for card in cards:
+            self.append(card)
+
+    def _position(self, slot: int) -> int:
+        return bisect_left(self._slots, slot)
+
+    # --- zmiany ---
+
+    def append(self, card: Card) -> None:
+        slot = self._slots[-1] + SLOT_GAP if self._slots else 0
+        self._slots.append(slot)
+        self._add(slot, card)
+        list.append(self, card)
+
+    def remove_at(self, index: int) -> Card:
+        # O(n): karty za index przesuwają się w lewo (kolejność stabilna)
+        card = self[index]
+        if index < 0:
+            index += len(self)
+
+        self._discard(self._slots.pop(index), card)
+        list.pop(self, index)
+        return card
+
+    def restore_at(self, index: int, card: Card) -> None:
+        if not 0 <= index <= len(self):
+            raise IndexError("Hand index out of range")
+        if index == len(self):
+            self.append(card)
+            return
+
+        slots = self._slots
+        if index == 0:
+            slot = slots[0] - SLOT_GAP
+        else:
+            if slots[index] - slots[index - 1] < 2:
+                self._renumber()
+            # remove_at + restore_at w tym samym miejscu daje ten sam slot
+            slot = (slots[index - 1] + slots[index]) // 2
+        slots.insert(index, slot)
+        self._add(slot, card)
+        list.insert(self, index, card)
+
+    def clear(self) -> None:
+        list.clear(self)
+        self._slots.clear()
+        self._powers.clear()
+        self._buckets.clear()
+        self._counts.clear()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Hand can only be changed with append, "
+                        "remove_at, restore_at or clear")
+
+    insert = remove = pop = extend = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    # --- zapytania ---
+
+    def strongest(self, affinity: Optional[RowAffinity] = None) -> Optional[int]:
+        """
+        Pozycja najsilniejszej karty (opcjonalnie tylko z danym
+        row_affinity); przy remisie najniższa pozycja. None, gdy brak kart.
+        """
+        powers = self._powers.get(affinity)
+        if not powers:
+            return None
+        return self._position(self._buckets[affinity][powers[-1]][0])
+
+    def weakest(self, affinity: Optional[RowAffinity] = None) -> Optional[int]:
+        powers = self._powers.get(affinity)
+        if not powers:
+            return None
+        return self._position(self._buckets[affinity][powers[0]][0])
+
+    def positions(self, affinity: RowAffinity) -> List[int]:
+        """Pozycje kart o danym row_affinity (rosnąco)."""
+        buckets = self._buckets.get(affinity, {})
+        return sorted(self._position(slot)
+                      for bucket in buckets.values()
+                      for slot in bucket)
+
+    def count_affinity(self, affinity: RowAffinity) -> int:
+        return self._counts.get(affinity, 0)
+
+    def __reduce__(self):
+        # indeksy odbudowuje konstruktor (pickle, copy)
+        return (Hand, (list(self),))
+
+    def __repr__(self) -> str:
+        return f"Hand({list.__repr__(self)})"
@@ -0,0 +1,30 @@
+from src.card_duel.game import Game
+from src.card_duel.player import Player
+
+
+class RendererNull:
+    """
+    Renderer bez wyjścia – odpowiednik RendererCLI dla symulacji.
+    Wszystkie metody są puste, więc mecz nie płaci za rysowanie.
+    """
+
+    def render_game_state(self, game: Game) -> None:
+        pass
+
+    def render_board(self, game: Game) -> None:
+        pass
+
+    def render_player_turn_header(self, player: Player) -> None:
+        pass
+
+    def render_player_hand(self, player: Player) -> None:
+        pass
+
+    def render_round_start(self, round_number: int) -> None:
+        pass
+
+    def render_round_end(self, game: Game) -> None:
+        pass
+
+    def render_match_result(self, game: Game) -> None:
+        pass
@@ -0,0 +1,258 @@
+import math
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.card_duel.actions import Action, PASS, PASS_ACTION, PLAY, play_action
+from src.card_duel.bots import row_for_card
+from src.card_duel.card import RowAffinity
+from src.card_duel.game import Game
+from src.card_duel.player import Player
+
+
+def legal_actions(game: Game) -> List[Action]:
+    """
+    Akcje aktywnego gracza do przeszukiwania: Game.legal_actions bez
+    duplikatów – zagrania kart o tym samym id do tego samego rzędu
+    są równoważne.
+    """
+    player_id = game.active_player_id
+    if player_id is None:
+        return []
+    hand = game.players[player_id].hand
+
+    actions = []
+    seen = set()
+    for action in game.legal_actions(player_id):
+        if action.kind == PLAY:
+            key = (hand[action.card_index].id, action.row_affinity)
+            if key in seen:
+                continue
+            seen.add(key)
+        actions.append(action)
+    return actions
+
+
+class MCTSNode:
+    # bez wskaźnika na rodzica – drzewo nie ma cykli, więc odrzucone
+    # poddrzewa zwalnia licznik referencji, a nie pauzy cyklicznego GC
+    __slots__ = ("action", "mover_id", "children", "untried",
+                 "visits", "value", "signature")
+
+    def __init__(self,
+                 action: Optional[Action],
+                 mover_id: Optional[int],
+                 game: Game) -> None:
+        self.action = action
+        # gracz, który wykonał action (z jego perspektywy liczymy UCB)
+        self.mover_id = mover_id
+        self.children: Dict[Action, "MCTSNode"] = {}
+        self.untried: List[Action] = legal_actions(game)
+        self.visits: int = 0
+        # suma nagród z perspektywy gracza, dla którego szukamy ruchu
+        self.value: float = 0.0
+        self.signature = game.zobrist_hash()
+
+
+class MCTSBot:
+    """
+    Bot Monte Carlo Tree Search – zamiennik InputHandlerCLI.
+
+    - szuka ruchu do końca bieżącej rundy, korzystając z Game.apply/undo,
+    - budżet: liczba iteracji i/lub czas na ruch (time_budget_ms),
+    - rollouty losowe ("random") albo zachłanne ("greedy"),
+    - drzewo jest używane ponownie w kolejnym ruchu, jeśli pozycja się zgadza.
+
+    Ograniczenie: bot gra z pełną informacją – selekcja i rollouty
+    korzystają z prawdziwych rąk przeciwników (nie losuje ich z kart
+    nieznanych). Nadaje się do symulacji i turniejów botów, ale przeciw
+    człowiekowi albo klientowi sieciowemu ma przewagę, której gracz nie ma.
+    """
+
+    def __init__(self,
+                 seed: int | None = None,
+                 iterations: int | None = None,
+                 time_budget_ms: float | None = 50.0,
+                 rollout: str = "random",
+                 exploration: float = 1.4,
+                 card_weight: float = 0.05,
+                 reuse_tree: bool = True) -> None:
+
+        if iterations is None and time_budget_ms is None:
+            raise ValueError("MCTSBot requires iterations or time_budget_ms")
+        if rollout not in ("random", "greedy"):
+            raise ValueError(f"Unknown rollout policy={rollout}")
+
+        self.rng = random.Random(seed)
+        self.iterations = iterations
+        self.time_budget_ms = time_budget_ms
+        self.rollout = rollout
+        self.exploration = exploration
+        self.card_weight = card_weight
+        self.reuse_tree = reuse_tree
+
+        self._roots: Dict[int, MCTSNode] = {}
+        self._chosen: Optional[Action] = None
+        self.last_iterations: int = 0
+        self.last_search_ms: float = 0.0
+
+    # --- API kompatybilne z InputHandlerCLI ---
+
+    def choose_action(self, game: Game, player: Player) -> str:
+        if player.hand_size() == 0 or player.has_passed:
+            self._chosen = PASS_ACTION
+            return "pass"
+
+        self._chosen = self.search(game, player.id)
+        return "pass" if self._chosen.kind == PASS else "play"
+
+    def choose_card_index(self, game: Game, player: Player) -> int:
+        if player.hand_size() == 0:
+            raise ValueError("No cards in hand to play.")
+        if self._chosen is None or self._chosen.kind == PASS:
+            # wywołanie bez wcześniejszego choose_action – pierwsza karta
+            self._chosen = play_action(0, row_for_card(player.hand[0]))
+        return self._chosen.card_index
+
+    def choose_row_affinity(self, game: Game, player: Player) -> RowAffinity:
+        if self._chosen is None or self._chosen.row_affinity is None:
+            return RowAffinity.MELEE
+        return self._chosen.row_affinity
+
+    # --- wyszukiwanie ---
+
+    def search(self, game: Game, player_id: int) -> Action:
+        started = time.perf_counter()
+        deadline = (None if self.time_budget_ms is None
+                    else started + self.time_budget_ms / 1000.0)
+
+        root = self._reuse_root(game, player_id)
+        if len(root.untried) + len(root.children) == 1:
+            action = (root.untried or list(root.children))[0]
+        else:
+            iterations = 0
+            # ruchy próbne nie mogą trafić do logu meczu ani do klientów
+            with game.speculative():
+                while True:
+                    self._iterate(game, root, player_id)
+                    iterations += 1
+                    if self.iterations is not None and iterations >= self.iterations:
+                        break
+                    if deadline is not None:
+                        now = time.perf_counter()
+                        # kończymy, gdy kolejna iteracja przekroczyłaby budżet
+                        per_iteration = (now - started) / iterations
+                        if now + per_iteration >= deadline:
+                            break
+            self.last_iterations = iterations
+            action = max(root.children.values(),
+                         key=lambda node: node.visits).action
+
+        self.last_search_ms = (time.perf_counter() - started) * 1000.0
+        if self.reuse_tree and action in root.children:
+            self._roots[player_id] = root.children[action]
+        return action
+
+    def _reuse_root(self, game: Game, player_id: int) -> MCTSNode:
+        signature = game.zobrist_hash()
+        previous = self._roots.pop(player_id, None)
+        if self.reuse_tree and previous is not None:
+            if previous.signature == signature:
+                return previous
+            # między naszymi ruchami przeciwnik wykonał dokładnie jedną akcję
+            for child in previous.children.values():
+                if child.signature == signature:
+                    return child
+        return MCTSNode(None, None, game)
+
+    def _iterate(self, game: Game, root: MCTSNode, player_id: int) -> None:
+        node = root
+        path = [root]
+        tokens = []
+
+        # szukamy na żywej grze – cofamy wszystko także wtedy, gdy
+        # apply albo rollout rzuci wyjątek w połowie iteracji
+        try:
+            # selekcja
+            while not node.untried and node.children and game.is_round_active:
+                node = self._select_child(node, game.get_team_ids(player_id))
+                path.append(node)
+                tokens.append(game.apply(node.action))
+
+            # ekspansja
+            if node.untried and game.is_round_active:
+                action = node.untried.pop(self.rng.randrange(len(node.untried)))
+                mover_id = game.active_player_id
+                tokens.append(game.apply(action))
+                child = MCTSNode(action, mover_id, game)
+                node.children[action] = child
+                path.append(child)
+
+            # symulacja
+            while game.is_round_active:
+                tokens.append(game.apply(self._rollout_action(game)))
+
+            reward = self._evaluate(game, player_id)
+        finally:
+            while tokens:
+                game.undo(tokens.pop())
+
+        # propagacja wsteczna
+        for node in path:
+            node.visits += 1
+            node.value += reward
+
+    def _select_child(self, node: MCTSNode, allies: Tuple[int, ...]) -> MCTSNode:
+        log_visits = math.log(node.visits)
+        best = None
+        best_score = -math.inf
+        for child in node.children.values():
+            mean = child.value / child.visits
+            # ruch przeciwnika oceniamy z jego perspektywy
+            if child.mover_id not in allies:
+                mean = 1.0 - mean
+            score = mean + self.exploration * math.sqrt(log_visits / child.visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _rollout_action(self, game: Game) -> Action:
+        player = game.players[game.active_player_id]
+        if player.has_passed or not player.hand:
+            return PASS_ACTION
+
+        if self.rollout == "random":
+            choice = self.rng.randrange(len(player.hand) + 1)
+            if choice == len(player.hand):
+                return PASS_ACTION
+            return play_action(choice, row_for_card(player.hand[choice]))
+
+        # greedy – jak GreedyBot
+        opponent_ids = game.get_opponent_ids(player.id)
+        if (all(game.players[pid].has_passed for pid in opponent_ids)
+                and game.get_team_power(player.id)
+                > max(game.get_team_power(pid) for pid in opponent_ids)):
+            return PASS_ACTION
+        best = player.hand.strongest()
+        return play_action(best, row_for_card(player.hand[best]))
+
+    def _evaluate(self, game: Game, player_id: int) -> float:
+        """Nagroda w [0, 1]: wynik rundy + niewielka premia za przewagę kart."""
+        winner_id = game.last_round_winner_id
+        if winner_id is None:
+            reward = 0.5
+        elif winner_id in game.get_team_ids(player_id):
+            reward = 1.0
+        else:
+            reward = 0.0
+
+        # przy kilku przeciwnikach porównujemy ze średnią ich ręki
+        opponent_ids = game.get_opponent_ids(player_id)
+        my_cards = game.players[player_id].hand_size()
+        opponent_cards = (sum(game.players[pid].hand_size() for pid in opponent_ids)
+                          / len(opponent_ids))
+        total = my_cards + opponent_cards
+        if total:
+            advantage = (my_cards - opponent_cards) / total
+            reward += self.card_weight * advantage
+        return min(1.0, max(0.0, reward))
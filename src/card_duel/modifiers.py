@@ -0,0 +1,61 @@
+from typing import Iterable, Tuple
+
+
+# Modyfikator to krotka (rodzaj, wartość) – na cały rząd albo na kartę w rzędzie.
+WEATHER = 1  # siła jednostek spada do 1 (przed buffami i rogiem)
+HORN = 2     # podwaja siłę; kilka rogów działa jak jeden
+BUFF = 3     # +wartość do siły (kumuluje się, ujemna osłabia)
+KINDS = (WEATHER, HORN, BUFF)
+
+Modifier = Tuple[int, int]
+# podsumowanie stosu modyfikatorów: (pogoda, róg, suma buffów)
+Summary = Tuple[bool, bool, int]
+NO_MODIFIERS: Summary = (False, False, 0)
+
+
+def weather() -> Modifier:
+    return (WEATHER, 0)
+
+
+def horn() -> Modifier:
+    return (HORN, 0)
+
+
+def buff(amount: int) -> Modifier:
+    return (BUFF, amount)
+
+
+def check_modifier(modifier: Modifier) -> Modifier:
+    try:
+        kind, amount = modifier
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid modifier={modifier!r}")
+    if kind not in KINDS or not isinstance(amount, int):
+        raise ValueError(f"Invalid modifier={modifier!r}")
+    return (kind, amount)
+
+
+def summarize(modifiers: Iterable[Modifier]) -> Summary:
+    has_weather = has_horn = False
+    total_buff = 0
+    for kind, amount in modifiers:
+        if kind == WEATHER:
+            has_weather = True
+        elif kind == HORN:
+            has_horn = True
+        else:
+            total_buff += amount
+    return has_weather, has_horn, total_buff
+
+
+def combine(row: Summary, card: Summary) -> Summary:
+    return (row[0] or card[0], row[1] or card[1], row[2] + card[2])
+
+
+def modified_power(base_power: int, summary: Summary) -> int:
+    """Siła karty po modyfikatorach: pogoda, potem buffy, na końcu róg (min. 0)."""
+    has_weather, has_horn, total_buff = summary
+    power = (min(base_power, 1) if has_weather else base_power) + total_buff
+    if has_horn:
+        power *= 2
+    return max(power, 0)
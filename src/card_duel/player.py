@@ -1,35 +1,85 @@
+from typing import Callable, Optional
+
 from src.card_duel.deck import Deck
 from src.card_duel.card import Card
+from src.card_duel.hand import Hand
 
 
 class Player:
     def __init__(self, id: int, deck: Deck):
         self.id = id
         self.deck = deck
-        self.hand: list[Card] = []
-        self.rounds_won: int = 0
-        self.has_passed: bool = False
+        self._hand = Hand()
+        self._rounds_won: int = 0
+        self._has_passed: bool = False
+        # wywoływane z kartą i +1/-1 przy zmianie ręki (np. hash Zobrista)
+        self.on_hand_change: Optional[Callable[[Card, int], None]] = None
+        # wywoływane z (flaga, stara, nowa wartość) przy zmianie
+        # has_passed ("passed") albo rounds_won ("won")
+        self.on_flag_change: Optional[Callable[[str, object, object], None]] = None
+
+    @property
+    def has_passed(self) -> bool:
+        return self._has_passed
+
+    @has_passed.setter
+    def has_passed(self, value: bool) -> None:
+        value = bool(value)
+        old, self._has_passed = self._has_passed, value
+        if old != value and self.on_flag_change is not None:
+            self.on_flag_change("passed", old, value)
+
+    @property
+    def rounds_won(self) -> int:
+        return self._rounds_won
+
+    @rounds_won.setter
+    def rounds_won(self, value: int) -> None:
+        value = int(value)
+        old, self._rounds_won = self._rounds_won, value
+        if old != value and self.on_flag_change is not None:
+            self.on_flag_change("won", old, value)
+
+    @property
+    def hand(self) -> Hand:
+        return self._hand
+
+    @hand.setter
+    def hand(self, cards) -> None:
+        # bez powiadomień on_hand_change – po podmianie wywołaj Game.rehash()
+        self._hand = cards if isinstance(cards, Hand) else Hand(cards)
 
     def draw_from_deck(self, n: int = 1) -> list[Card]:
         draw_cards = self.deck.draw_many(n)
         for card in draw_cards:
-            self.hand.append(card)
+            self._hand.append(card)
+            if self.on_hand_change is not None:
+                self.on_hand_change(card, 1)
         return draw_cards
 
     def draw_starting_hand(self, hand_size: int) -> list[Card]:
         return self.draw_from_deck(hand_size)
 
     def play_card(self, card_index: int) -> Card:
+        # usuwa dokładnie kartę z pozycji card_index; kolejność pozostałych
+        # kart się nie zmienia (zob. Hand.remove_at)
         try:
-            card = self.hand[card_index]
+            card = self._hand.remove_at(card_index)
         except IndexError:
             raise ValueError("Invalid card index")
 
-        self.hand.remove(card)
+        if self.on_hand_change is not None:
+            self.on_hand_change(card, -1)
         return card
 
+    def return_card(self, position: int, card: Card) -> None:
+        """Wkłada kartę z powrotem do ręki na danej pozycji (Game.undo)."""
+        self._hand.restore_at(position, card)
+        if self.on_hand_change is not None:
+            self.on_hand_change(card, 1)
+
     def hand_size(self) -> int:
-        return len(self.hand)
+        return len(self._hand)
 
     def pass_round(self) -> None:
         self.has_passed = True
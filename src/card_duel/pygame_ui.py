@@ -1,9 +1,12 @@
+import time
+from collections import deque
+
 import pygame
-from typing import Optional
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from src.card_duel.game import Game
 from src.card_duel.player import Player
-from src.card_duel.card import RowAffinity
+from src.card_duel.card import Card, RowAffinity
 
 
 # Proste kolory
@@ -16,6 +19,26 @@ RED = (200, 0, 0)
 BLUE = (0, 120, 200)
 YELLOW = (220, 220, 0)
 
+# Układ ekranu
+BOARD_TOP = 100
+ROW_HEIGHT = 40
+ROW_PADDING = 5
+BOARD_TILE_WIDTH = 30
+HAND_TILE_WIDTH = 70
+HAND_TILE_HEIGHT = 80
+MATCH_MESSAGE_Y = 290
+ROW_ORDER = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+# powyżej tej liczby napisów / kafelków cache jest czyszczony (np. długie mecze)
+TEXT_CACHE_SIZE = 1024
+TILE_CACHE_SIZE = 256
+# limit odświeżania ekranu w czasie czekania na ruch gracza
+DEFAULT_FPS = 30
+ROW_KEYS = {
+    pygame.K_1: RowAffinity.MELEE,
+    pygame.K_2: RowAffinity.RANGED,
+    pygame.K_3: RowAffinity.SIEGE,
+}
+
 
 class RendererPygame:
     """
@@ -24,6 +47,11 @@ class RendererPygame:
       - planszę (3 rzędy na gracza),
       - rękę aktywnego gracza,
       - podstawowe informacje o meczu.
+
+    Ekran jest podzielony na obszary (nagłówek, suma gracza, każdy rząd,
+    ręka). Klatka odrysowuje tylko obszary, których treść się zmieniła,
+    i przekazuje je do pygame.display.update(rects); napisy i kafelki
+    kart są renderowane raz i brane z cache.
     """
 
     def __init__(self, width: int = 1024, height: int = 768) -> None:
@@ -40,6 +68,20 @@ class RendererPygame:
         self._last_round_msg: Optional[str] = None
         self._last_match_msg: Optional[str] = None
 
+        # cache gotowych powierzchni: napisy (font, tekst, kolor) i kafelki kart
+        self._text_cache: Dict[Tuple, pygame.Surface] = {}
+        self._tile_cache: Dict[Tuple, pygame.Surface] = {}
+        # sygnatura treści każdego obszaru z poprzedniej klatki – obszar
+        # jest rysowany ponownie tylko wtedy, gdy sygnatura się zmieni
+        self._signatures: Dict[Tuple, Tuple] = {}
+        self._dirty: List[pygame.Rect] = []
+        self._full_redraw: bool = True
+        # pozycje kart w ręce i rzędów z ostatniej klatki (wybór myszą)
+        self._hand_rects: List[pygame.Rect] = []
+        self._row_rects: List[Tuple[pygame.Rect, RowAffinity]] = []
+        # wywoływane z perf_counter() po wysłaniu klatki na ekran
+        self.on_frame: Optional[Callable[[float], None]] = None
+
     # --- API kompatybilne z RendererCLI ---
 
     def render_game_state(self, game: Game) -> None:
@@ -90,10 +132,70 @@ class RendererPygame:
         self._draw(game)
         self._wait_for_exit()
 
+    # --- Cache powierzchni ---
+
+    def _text(self, text: str, color: Tuple[int, int, int], big: bool = False) -> pygame.Surface:
+        key = (big, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            font = self.big_font if big else self.font
+            surface = font.render(text, True, color)
+            self._store(self._text_cache, TEXT_CACHE_SIZE, key, surface)
+        return surface
+
+    @staticmethod
+    def _store(cache: Dict[Tuple, pygame.Surface], limit: int,
+               key: Tuple, surface: pygame.Surface) -> None:
+        if len(cache) >= limit:
+            cache.clear()
+        cache[key] = surface
+
+    def _board_tile(self, power: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = ("board", power, color)
+        tile = self._tile_cache.get(key)
+        if tile is None:
+            tile = pygame.Surface((BOARD_TILE_WIDTH, ROW_HEIGHT - ROW_PADDING))
+            tile.fill(color)
+            tile.blit(self._text(str(power), WHITE), (8, 10))
+            self._store(self._tile_cache, TILE_CACHE_SIZE, key, tile)
+        return tile
+
+    def _hand_tile(self, index: int, card: Card) -> pygame.Surface:
+        key = ("hand", index, card.name, card.base_power)
+        tile = self._tile_cache.get(key)
+        if tile is None:
+            tile = pygame.Surface((HAND_TILE_WIDTH, HAND_TILE_HEIGHT))
+            tile.fill(GREY)
+            pygame.draw.rect(tile, WHITE, tile.get_rect(), 2)
+            tile.blit(self._text(str(index), YELLOW), (4, 4))
+            tile.blit(self._text(card.name[:10], WHITE), (4, 24))
+            tile.blit(self._text(str(card.base_power), WHITE), (4, 44))
+            self._store(self._tile_cache, TILE_CACHE_SIZE, key, tile)
+        return tile
+
     # --- Rysowanie właściwe ---
 
+    def invalidate(self) -> None:
+        """Wymusza odrysowanie całego ekranu w następnej klatce."""
+        self._full_redraw = True
+
+    def _region(self, key: Tuple, rect: pygame.Rect, signature: Tuple,
+                draw: Callable[[], None]) -> None:
+        """Rysuje obszar tylko przy zmianie treści i oznacza go do update()."""
+        if self._signatures.get(key) == signature:
+            return
+        self._signatures[key] = signature
+        self.screen.fill(DARK_GREY, rect)
+        draw()
+        self._dirty.append(rect)
+
     def _draw(self, game: Game) -> None:
-        self.screen.fill(DARK_GREY)
+        if self._full_redraw:
+            self.screen.fill(DARK_GREY)
+            self._signatures.clear()
+        self._dirty = []
+        self._hand_rects = []
+        self._row_rects = []
 
         # Górny pasek info
         self._draw_header(game)
@@ -102,48 +204,52 @@ class RendererPygame:
         self._draw_board(game)
 
         # Ręka aktywnego gracza
-        if self._active_player is not None:
-            self._draw_hand(self._active_player)
+        self._draw_hand(self._active_player)
 
-        pygame.display.flip()
+        # Komunikat końca meczu leży na planszy – odnawiany, gdy ją zamazano
+        self._draw_match_message()
 
-    def _draw_header(self, game: Game) -> None:
-        y = 10
-        x = 10
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        elif self._dirty:
+            pygame.display.update(self._dirty)
+        if self.on_frame is not None:
+            self.on_frame(time.perf_counter())
 
-        # aktywny gracz
+    def _draw_header(self, game: Game) -> None:
+        lines = []
         if self._active_player is not None:
-            text = self.big_font.render(
-                f"Player {self._active_player.id}'s turn (P=play, S=pass, 0-9=card index)",
-                True,
-                YELLOW,
-            )
-            self.screen.blit(text, (x, y))
-            y += 30
-
-        # rundy wygrane
+            lines.append((f"Player {self._active_player.id}'s turn "
+                          f"(P=play, S=pass, 0-9=card index)", YELLOW, True, 30))
         for pid, player in game.players.items():
-            text = self.font.render(
-                f"Player {pid}: rounds_won={player.rounds_won}, hand={player.hand_size()}, passed={player.has_passed}",
-                True,
-                WHITE,
-            )
-            self.screen.blit(text, (x, y))
-            y += 20
-
-        # komunikaty rundy / meczu
+            lines.append((f"Player {pid}: rounds_won={player.rounds_won}, "
+                          f"hand={player.hand_size()}, passed={player.has_passed}",
+                          WHITE, False, 20))
         if self._last_round_msg:
-            text = self.font.render(self._last_round_msg, True, GREEN)
-            self.screen.blit(text, (x, y))
-            y += 20
-
-        if self._last_match_msg:
-            text = self.font.render(self._last_match_msg, True, RED)
-            self.screen.blit(text, (x, y+200))
-            
+            lines.append((self._last_round_msg, GREEN, False, 20))
+
+        def draw() -> None:
+            y = 10
+            for text, color, big, height in lines:
+                self.screen.blit(self._text(text, color, big), (10, y))
+                y += height
+
+        self._region(("header",), pygame.Rect(0, 0, self.width, BOARD_TOP),
+                     tuple(lines), draw)
+
+    def _draw_match_message(self) -> None:
+        if not self._last_match_msg:
+            return
+        surface = self._text(self._last_match_msg, RED)
+        rect = surface.get_rect(topleft=(10, MATCH_MESSAGE_Y))
+        changed = self._signatures.get(("match",)) != (self._last_match_msg,)
+        if changed or rect.collidelist(self._dirty) != -1:
+            self._signatures[("match",)] = (self._last_match_msg,)
+            self.screen.blit(surface, rect)
+            self._dirty.append(rect)
 
     def _draw_board(self, game: Game) -> None:
-        board = game.board
         player_ids = list(game.players.keys())
 
         # jeśli dwóch graczy – przeciwnik na górze, my na dole
@@ -152,174 +258,271 @@ class RendererPygame:
         else:
             top_id = bottom_id = player_ids[0]
 
-        row_order = [RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE]
-        row_labels = {
-            RowAffinity.MELEE: "MELEE",
-            RowAffinity.RANGED: "RANGED",
-            RowAffinity.SIEGE: "SIEGE",
-        }
-
         # obszar na board (środek ekranu)
-        board_top = 100
         board_height = self.height - 250
-        mid_y = board_top + board_height // 2
+        mid_y = BOARD_TOP + board_height // 2
 
-        # Każdy rząd będzie pasem o wysokości ~40px
-        row_height = 40
-        padding = 5
+        self._draw_player_rows(game, top_id, BOARD_TOP, BLUE)
+        self._draw_player_rows(game, bottom_id, mid_y + 20, GREEN)
 
-        # --- Gracz na górze ---
-        y = board_top
-        total_top = board.get_total_power(top_id)
-        text = self.font.render(f"Player {top_id} (total: {total_top})", True, WHITE)
-        self.screen.blit(text, (10, y))
-        y += 25
-
-        for affinity in row_order:
-            row = board.get_row(top_id, affinity)
-            powers = [card.base_power for card in row.cards]
-            row_total = sum(powers) if powers else 0
-
-            label_text = self.font.render(f"{row_labels[affinity]} ({row_total})", True, WHITE)
-            self.screen.blit(label_text, (10, y))
-
-            # Karty jako prostokąty
-            card_x = 200
-            for p in powers:
-                rect = pygame.Rect(card_x, y, 30, row_height - padding)
-                pygame.draw.rect(self.screen, BLUE, rect)
-                power_surf = self.font.render(str(p), True, WHITE)
-                self.screen.blit(power_surf, (card_x + 8, y + 10))
-                card_x += 35
-
-            y += row_height
-
-        # --- Gracz na dole ---
-        y = mid_y + 20
-        total_bottom = board.get_total_power(bottom_id)
-        text = self.font.render(f"Player {bottom_id} (total: {total_bottom})", True, WHITE)
-        self.screen.blit(text, (10, y))
+    def _draw_player_rows(self, game: Game, player_id: int, y: int,
+                          color: Tuple[int, int, int]) -> None:
+        board = game.board
+        total = board.get_total_power(player_id)
+        label = f"Player {player_id} (total: {total})"
+        self._region(("total", y), pygame.Rect(0, y, self.width, 25), (label,),
+                     lambda: self.screen.blit(self._text(label, WHITE), (10, y)))
         y += 25
 
-        for affinity in row_order:
-            row = board.get_row(bottom_id, affinity)
-            powers = [card.base_power for card in row.cards]
-            row_total = sum(powers) if powers else 0
-
-            label_text = self.font.render(f"{row_labels[affinity]} ({row_total})", True, WHITE)
-            self.screen.blit(label_text, (10, y))
-
-            card_x = 200
-            for p in powers:
-                rect = pygame.Rect(card_x, y, 30, row_height - padding)
-                pygame.draw.rect(self.screen, GREEN, rect)
-                power_surf = self.font.render(str(p), True, WHITE)
-                self.screen.blit(power_surf, (card_x + 8, y + 10))
-                card_x += 35
-
-            y += row_height
-
-    def _draw_hand(self, player: Player) -> None:
+        for affinity in ROW_ORDER:
+            row = board.get_row(player_id, affinity)
+            # siła efektywna (z modyfikatorami) – tak, jak liczą ją reguły
+            powers = tuple(row.card_power(card) for card in row.cards)
+            row_label = f"{affinity.name} ({row.total_power()})"
+
+            def draw(row_y=y, row_label=row_label, powers=powers) -> None:
+                self.screen.blit(self._text(row_label, WHITE), (10, row_y))
+                card_x = 200
+                for power in powers:
+                    self.screen.blit(self._board_tile(power, color), (card_x, row_y))
+                    card_x += BOARD_TILE_WIDTH + 5
+
+            rect = pygame.Rect(0, y, self.width, ROW_HEIGHT)
+            self._row_rects.append((rect, affinity))
+            self._region(("row", y), rect, (row_label, powers, color), draw)
+            y += ROW_HEIGHT
+
+    def _draw_hand(self, player: Optional[Player]) -> None:
         """Rysuje rękę aktywnego gracza na dole ekranu."""
         y = self.height - 120
-        x = 10
+        rect = pygame.Rect(0, y, self.width, 120)
+        if player is None:
+            self._region(("hand",), rect, (), lambda: None)
+            return
+
+        cards = tuple(player.hand)
+        self._hand_rects = [
+            pygame.Rect(10 + idx * (HAND_TILE_WIDTH + 10), y + 25,
+                        HAND_TILE_WIDTH, HAND_TILE_HEIGHT)
+            for idx in range(len(cards))
+        ]
+
+        def draw() -> None:
+            self.screen.blit(self._text(f"Player {player.id} hand:", WHITE), (10, y))
+            x = 10
+            for idx, card in enumerate(cards):
+                self.screen.blit(self._hand_tile(idx, card), (x, y + 25))
+                x += HAND_TILE_WIDTH + 10
+
+        self._region(("hand",), rect,
+                     (player.id,) + tuple((card.name, card.base_power) for card in cards),
+                     draw)
+
+    def card_index_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        """Indeks karty w ręce pod kursorem (wg ostatniej klatki)."""
+        for idx, rect in enumerate(self._hand_rects):
+            if rect.collidepoint(pos):
+                return idx
+        return None
+
+    def row_at(self, pos: Tuple[int, int]) -> Optional[RowAffinity]:
+        """Rząd planszy pod kursorem (dowolnego gracza – wybór pasa)."""
+        for rect, affinity in self._row_rects:
+            if rect.collidepoint(pos):
+                return affinity
+        return None
 
-        label = self.font.render(f"Player {player.id} hand:", True, WHITE)
-        self.screen.blit(label, (x, y))
-        y += 25
-
-        card_width = 70
-        card_height = 80
-        gap = 10
+    def _wait_for_exit(self) -> None:
+        """Czeka (blokująco, bez odpytywania) aż użytkownik zamknie okno po meczu."""
+        while True:
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                break
+            if event.type == pygame.WINDOWEXPOSED:
+                # okno odsłonięte – bufor ekranu jest aktualny, wystarczy flip
+                pygame.display.flip()
 
-        for idx, card in enumerate(player.hand):
-            rect = pygame.Rect(x, y, card_width, card_height)
-            pygame.draw.rect(self.screen, GREY, rect)
-            pygame.draw.rect(self.screen, WHITE, rect, 2)
+        pygame.quit()
 
-            idx_text = self.font.render(str(idx), True, YELLOW)
-            name_text = self.font.render(card.name[:10], True, WHITE)
-            power_text = self.font.render(str(card.base_power), True, WHITE)
 
-            self.screen.blit(idx_text, (x + 4, y + 4))
-            self.screen.blit(name_text, (x + 4, y + 24))
-            self.screen.blit(power_text, (x + 4, y + 44))
+class LatencyStats:
+    """Ostatnie próbki czasu (sekundy) z podsumowaniem w milisekundach."""
 
-            x += card_width + gap
+    def __init__(self, max_samples: int = 1000) -> None:
+        self.samples: Deque[float] = deque(maxlen=max_samples)
 
-    def _wait_for_exit(self) -> None:
-        """Czeka aż użytkownik zamknie okno po zakończeniu meczu."""
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    waiting = False
-            pygame.time.delay(50)
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
 
-        pygame.quit()
+    def summary(self) -> Dict[str, float]:
+        if not self.samples:
+            return {"count": 0, "mean_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self.samples)
+        return {
+            "count": len(ordered),
+            "mean_ms": 1000 * sum(ordered) / len(ordered),
+            "p95_ms": 1000 * ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+            "max_ms": 1000 * ordered[-1],
+        }
 
 
 class InputHandlerPygame:
     """
     Input handler oparty o Pygame – odpowiednik InputHandlerCLI.
-    Używa klawiatury:
+    Klawiatura:
       - P -> play
       - S -> pass
       - 0-9 -> indeks karty z ręki
+      - 1/2/3 -> rząd MELEE/RANGED/SIEGE (tylko dla kart ANY)
+    Mysz:
+      - klik w kartę w ręce -> zagranie tej karty
+      - klik w rząd planszy -> wybór rzędu
+
+    Czeka blokująco na pygame.event.wait – bez aktywnego odpytywania
+    i bez stałego opóźnienia. Z podanym rendererem w czasie czekania
+    odświeża ekran najwyżej fps razy na sekundę.
+
+    Metryki (metrics()):
+      - input: od odebrania zdarzenia, które dało decyzję, do pierwszej
+        klatki wysłanej na ekran po niej (wymaga renderera); zdarzenia
+        pygame nie mają znacznika czasu, a czekamy blokująco, więc
+        odebranie to praktycznie chwila naciśnięcia,
+      - frame: czas odrysowania klatki w trakcie czekania.
     """
 
-    def __init__(self) -> None:
-        # nic specjalnego na start
-        pass
+    def __init__(self,
+                 renderer: Optional[RendererPygame] = None,
+                 fps: int = DEFAULT_FPS) -> None:
+        self.renderer = renderer
+        self.frame_interval: float = 1.0 / fps
+        self._next_frame: float = 0.0
+        # karta wybrana myszą w choose_action (zwracana w choose_card_index)
+        self._clicked_index: Optional[int] = None
+        self._chosen_index: Optional[int] = None
+        self.input_latency = LatencyStats()
+        self.frame_time = LatencyStats()
+        # chwila odebrania zdarzenia z decyzją, która czeka na swoją klatkę
+        self._input_received: Optional[float] = None
+        if renderer is not None:
+            renderer.on_frame = self._frame_presented
+
+    def _frame_presented(self, presented: float) -> None:
+        if self._input_received is not None:
+            self.input_latency.record(presented - self._input_received)
+            self._input_received = None
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        return {"input": self.input_latency.summary(),
+                "frame": self.frame_time.summary()}
+
+    def _redraw(self, game: Game) -> None:
+        if self.renderer is None:
+            return
+        now = time.perf_counter()
+        if now < self._next_frame:
+            return
+        self.renderer.render_game_state(game)
+        finished = time.perf_counter()
+        self.frame_time.record(finished - now)
+        self._next_frame = now + self.frame_interval
+
+    def _wait(self, game: Game, handle: Callable[[pygame.event.Event], Optional[object]]):
+        """Czeka na zdarzenie, dla którego handle zwróci wynik (nie None)."""
+        while True:
+            self._redraw(game)
+            if self.renderer is None:
+                event = pygame.event.wait()
+            else:
+                # budzi się najpóźniej na następną klatkę
+                timeout = max(1, int(1000 * (self._next_frame - time.perf_counter())))
+                event = pygame.event.wait(timeout)
+            received = time.perf_counter()
+
+            if event.type == pygame.QUIT:
+                raise SystemExit("Window closed")
+            if event.type == pygame.WINDOWEXPOSED and self.renderer is not None:
+                self.renderer.invalidate()
+                self._next_frame = 0.0
+                continue
+            if event.type == pygame.NOEVENT:
+                continue
+
+            result = handle(event)
+            if result is not None:
+                if self._input_received is None:
+                    self._input_received = received
+                return result
+
+    def _clicked_card(self, event: pygame.event.Event) -> Optional[int]:
+        if (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+                and self.renderer is not None):
+            return self.renderer.card_index_at(event.pos)
+        return None
 
     def choose_action(self, game: Game, player: Player) -> str:
         """
         Czeka na decyzję: 'play' lub 'pass'.
-        P -> 'play'
-        S -> 'pass'
+        P -> 'play', S -> 'pass', klik w kartę -> 'play' tą kartą.
         """
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    raise SystemExit("Window closed")
-
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_p:
-                        return "play"
-                    if event.key == pygame.K_s:
-                        return "pass"
-
-            pygame.time.delay(50)
+        self._clicked_index = None
+
+        def handle(event):
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_p:
+                    return "play"
+                if event.key == pygame.K_s:
+                    return "pass"
+            idx = self._clicked_card(event)
+            if idx is not None:
+                self._clicked_index = idx
+                return "play"
+            return None
+
+        return self._wait(game, handle)
 
     def choose_card_index(self, game: Game, player: Player) -> int:
         """
-        Czeka na naciśnięcie cyfry 0-9 i zwraca ją jako indeks karty.
+        Zwraca kartę klikniętą w choose_action albo czeka na cyfrę 0-9
+        lub klik w kartę.
         """
         if player.hand_size() == 0:
             raise ValueError("No cards in hand to play.")
 
         max_idx = player.hand_size() - 1
+        idx, self._clicked_index = self._clicked_index, None
 
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    raise SystemExit("Window closed")
-
-                if event.type == pygame.KEYDOWN:
-                    # cyfry 0-9
-                    if pygame.K_0 <= event.key <= pygame.K_9:
-                        idx = event.key - pygame.K_0
-                        if 0 <= idx <= max_idx:
-                            return idx
-                        # poza zakresem – ignorujemy
-            pygame.time.delay(50)
+        def handle(event):
+            if event.type == pygame.KEYDOWN and pygame.K_0 <= event.key <= pygame.K_9:
+                chosen = event.key - pygame.K_0
+            else:
+                chosen = self._clicked_card(event)
+            # poza zakresem – ignorujemy
+            if chosen is not None and 0 <= chosen <= max_idx:
+                return chosen
+            return None
+
+        if idx is None or not 0 <= idx <= max_idx:
+            idx = self._wait(game, handle)
+        self._chosen_index = idx
+        return idx
 
     def choose_row_affinity(self, game: Game, player: Player) -> RowAffinity:
         """
-        Na razie uproszczenie: wszystkie karty gramy w MELEE.
-        Można to potem rozbudować o klawisze:
-          - 1 -> MELEE
-          - 2 -> RANGED
-          - 3 -> SIEGE
+        Karta z konkretnym row_affinity trafia do swojego rzędu;
+        dla kart ANY czeka na 1/2/3 albo klik w rząd planszy.
         """
-        return RowAffinity.MELEE
+        idx = self._chosen_index
+        if idx is not None and 0 <= idx < player.hand_size():
+            affinity = player.hand[idx].row_affinity
+            if affinity is not RowAffinity.ANY:
+                return affinity
+
+        def handle(event):
+            if event.type == pygame.KEYDOWN and event.key in ROW_KEYS:
+                return ROW_KEYS[event.key]
+            if (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+                    and self.renderer is not None):
+                return self.renderer.row_at(event.pos)
+            return None
+
+        return self._wait(game, handle)
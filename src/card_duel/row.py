@@ -1,27 +1,176 @@
 from src.card_duel.card import RowAffinity, Card
-from typing import List, Optional
+from src.card_duel.modifiers import (Modifier, NO_MODIFIERS, Summary,
+                                     check_modifier, combine,
+                                     modified_power, summarize)
+from typing import Callable, Dict, List, Optional
 
 
 class Row:
-    def __init__(self, name: RowAffinity, cards: Optional[List[Card]] = None):
+    def __init__(self,
+                 name: RowAffinity,
+                 cards: Optional[List[Card]] = None,
+                 on_power_change: Optional[Callable[[int], None]] = None,
+                 debug: bool = False,
+                 on_card_change: Optional[Callable[[Card, int], None]] = None,
+                 on_invalidate: Optional[Callable[[], None]] = None,
+                 on_modifier_change: Optional[Callable[[Modifier, Optional[int], int], None]] = None):
         self.name: RowAffinity = name
         self.cards: List[Card] = list(cards) if cards is not None else []
+        # modyfikatory całego rzędu i pojedynczych kart (id karty -> stos);
+        # modyfikator karty działa na każdą jej kopię w tym rzędzie
+        self.modifiers: List[Modifier] = []
+        self.card_modifiers: Dict[int, List[Modifier]] = {}
+        self._row_summary: Summary = NO_MODIFIERS
+        self._card_summaries: Dict[int, Summary] = {}
+        # suma efektywnej mocy utrzymywana przyrostowo – total_power() w O(1);
+        # zmiana modyfikatora tylko ją unieważnia, przeliczenie przy odczycie
+        self._total_power: int = sum(card.base_power for card in self.cards)
+        self._dirty: bool = False
+        # wywoływane z różnicą mocy (np. Board aktualizuje sumę gracza)
+        self.on_power_change = on_power_change
+        # wywoływane, gdy suma przestaje być aktualna (zmiana modyfikatora)
+        self.on_invalidate = on_invalidate
+        # tryb debug: każde total_power() porównuje cache z pełnym przeliczeniem
+        self.debug: bool = debug
+        # wywoływane z kartą i +1/-1 (np. Game aktualizuje hash Zobrista)
+        self.on_card_change = on_card_change
+        # wywoływane z modyfikatorem, id karty (None = cały rząd) i +1/-1
+        self.on_modifier_change = on_modifier_change
+
+    def _apply_delta(self, delta: int) -> None:
+        if self._dirty:
+            # suma i tak będzie przeliczona przy odczycie
+            return
+        self._total_power += delta
+        if self.on_power_change is not None and delta != 0:
+            self.on_power_change(delta)
+
+    def card_power(self, card: Card) -> int:
+        """Efektywna siła karty w tym rzędzie (base_power po modyfikatorach)."""
+        if self._row_summary is NO_MODIFIERS and not self._card_summaries:
+            return card.base_power
+        summary = self._card_summaries.get(card.id)
+        if summary is not None:
+            return modified_power(card.base_power, combine(self._row_summary, summary))
+        return modified_power(card.base_power, self._row_summary)
 
     def add_card(self, card: Card) -> None:
         self.cards.append(card)
+        self._apply_delta(self.card_power(card))
+        if self.on_card_change is not None:
+            self.on_card_change(card, 1)
+
+    def insert_card(self, index: int, card: Card) -> None:
+        """Wstawia kartę na pozycję index (odwrotność remove_card)."""
+        self.cards.insert(index, card)
+        self._apply_delta(self.card_power(card))
+        if self.on_card_change is not None:
+            self.on_card_change(card, 1)
 
     def remove_card(self, card: Card) -> None:
         if card in self.cards:
-            self.cards.remove(card)
+            removed = self.cards.pop(self.cards.index(card))
+            self._apply_delta(-self.card_power(removed))
+            if self.on_card_change is not None:
+                self.on_card_change(removed, -1)
+
+    def pop_card(self) -> Optional[Card]:
+        if not self.cards:
+            return None
+        card = self.cards.pop()
+        self._apply_delta(-self.card_power(card))
+        if self.on_card_change is not None:
+            self.on_card_change(card, -1)
+        return card
 
     def clear(self) -> None:
+        """Zdejmuje karty i modyfikatory (np. pogodę) – nowa runda."""
+        if self.on_card_change is not None:
+            for card in self.cards:
+                self.on_card_change(card, -1)
+        if self.on_modifier_change is not None:
+            for modifier in self.modifiers:
+                self.on_modifier_change(modifier, None, -1)
+            for card_id, modifiers in self.card_modifiers.items():
+                for modifier in modifiers:
+                    self.on_modifier_change(modifier, card_id, -1)
         self.cards.clear()
+        self.modifiers.clear()
+        self.card_modifiers.clear()
+        self._row_summary = NO_MODIFIERS
+        self._card_summaries.clear()
+        self._apply_delta(-self._total_power)
+        self._total_power = 0
+        self._dirty = False
+
+    # --- modyfikatory ---
+
+    def add_modifier(self, modifier: Modifier, card: Optional[Card] = None) -> None:
+        """Dodaje modyfikator rzędu albo (z card) modyfikator tej karty w rzędzie."""
+        modifier = check_modifier(modifier)
+        card_id = None if card is None else card.id
+        if card_id is None:
+            self.modifiers.append(modifier)
+        else:
+            self.card_modifiers.setdefault(card_id, []).append(modifier)
+        self._modifiers_changed(card_id)
+        if self.on_modifier_change is not None:
+            self.on_modifier_change(modifier, card_id, 1)
+
+    def remove_modifier(self, modifier: Modifier, card: Optional[Card] = None) -> None:
+        modifier = check_modifier(modifier)
+        card_id = None if card is None else card.id
+        stack = self.modifiers if card_id is None else self.card_modifiers.get(card_id, [])
+        # zdejmujemy ostatnie wystąpienie – cofnięcie add_modifier przy
+        # duplikatach (np. dwa rogi) zachowuje kolejność stosu
+        for index in range(len(stack) - 1, -1, -1):
+            if stack[index] == modifier:
+                del stack[index]
+                break
+        else:
+            raise ValueError(f"Modifier {modifier} not in row {self.name.name}")
+        if card_id is not None and not stack:
+            del self.card_modifiers[card_id]
+        self._modifiers_changed(card_id)
+        if self.on_modifier_change is not None:
+            self.on_modifier_change(modifier, card_id, -1)
+
+    def _modifiers_changed(self, card_id: Optional[int]) -> None:
+        if card_id is None:
+            self._row_summary = (summarize(self.modifiers) if self.modifiers
+                                 else NO_MODIFIERS)
+        elif card_id in self.card_modifiers:
+            self._card_summaries[card_id] = summarize(self.card_modifiers[card_id])
+        else:
+            self._card_summaries.pop(card_id, None)
+        if not self._dirty:
+            self._dirty = True
+            if self.on_invalidate is not None:
+                self.on_invalidate()
+
+    def has_modifiers(self) -> bool:
+        return bool(self.modifiers or self.card_modifiers)
+
+    # --- moc ---
+
+    def recompute_power(self) -> int:
+        return sum(self.card_power(card) for card in self.cards)
 
     def total_power(self) -> int:
-        row_total_sum = 0
-        for card in self.cards:
-            row_total_sum += card.base_power
-        return row_total_sum
+        if self._dirty:
+            self._total_power = self.recompute_power()
+            self._dirty = False
+        elif self.debug:
+            self.check_power_cache()
+        return self._total_power
+
+    def check_power_cache(self) -> None:
+        if self._dirty:
+            return
+        expected = self.recompute_power()
+        if expected != self._total_power:
+            raise RuntimeError(f"Row {self.name.name} power cache out of sync: "
+                               f"cached={self._total_power}, actual={expected}")
 
     def __len__(self) -> int:
         return len(self.cards)
@@ -34,4 +183,13 @@ class Row:
                     "name": self.name.name,
                     "cards": [card.serialize() for card in self.cards]
                    }
+        if self.has_modifiers():
+            row_dict["modifiers"] = self.serialize_modifiers()
         return row_dict
+
+    def serialize_modifiers(self) -> dict:
+        return {
+            "row": [list(modifier) for modifier in self.modifiers],
+            "cards": {card_id: [list(modifier) for modifier in modifiers]
+                      for card_id, modifiers in self.card_modifiers.items()},
+        }
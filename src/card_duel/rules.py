@@ -50,5 +50,30 @@ class Rules:
             return qualified[0].id
         return None
 
+    def get_team_round_winner_ids(self,
+                                  board: Board,
+                                  teams: list[tuple[int, ...]]) -> list[int]:
+        """Członkowie drużyny z największą łączną mocą; pusto przy remisie."""
+        power_by_team = [sum(board.get_total_power(pid) for pid in team)
+                         for team in teams]
+        max_power = max(power_by_team)
+
+        winners = [team for team, power in zip(teams, power_by_team)
+                   if power == max_power]
+        if len(winners) == 1:
+            return list(winners[0])
+        return []
+
+    def get_team_match_winner_ids(self,
+                                  players: list[Player],
+                                  teams: list[tuple[int, ...]]) -> list[int]:
+        rounds_won = {player.id: player.rounds_won for player in players}
+        qualified = [team for team in teams
+                     if any(rounds_won[pid] >= self.rounds_to_win for pid in team)]
+
+        if len(qualified) == 1:
+            return list(qualified[0])
+        return []
+
     def serialize(self) -> dict:
         return {"rounds_to_win": self.rounds_to_win}
@@ -0,0 +1,102 @@
+import asyncio
+from typing import Dict
+
+from src.card_duel.card import RowAffinity
+from src.card_duel.controller import INPUT_PHASES, GameController
+from src.card_duel.game import Game
+from src.card_duel.player import Player
+
+
+# Asynchroniczny input handler ma te same metody co InputHandlerCLI,
+# tylko jako korutyny:
+#   async choose_action(game, player) -> "play" | "pass"
+#   async choose_card_index(game, player) -> int
+#   async choose_row_affinity(game, player) -> RowAffinity
+
+
+class AsyncBot:
+    """
+    Adapter bota synchronicznego (RandomBot, GreedyBot, ...) na protokół
+    asynchroniczny. Przed każdą decyzją oddaje sterowanie pętli zdarzeń,
+    więc tysiące meczów botów dzielą się jednym wątkiem po równo.
+    """
+
+    def __init__(self, bot) -> None:
+        self.bot = bot
+
+    async def choose_action(self, game: Game, player: Player) -> str:
+        await asyncio.sleep(0)
+        return self.bot.choose_action(game, player)
+
+    async def choose_card_index(self, game: Game, player: Player) -> int:
+        return self.bot.choose_card_index(game, player)
+
+    async def choose_row_affinity(self, game: Game, player: Player) -> RowAffinity:
+        return self.bot.choose_row_affinity(game, player)
+
+
+class AsyncSeats:
+    """Kieruje decyzje do handlera gracza, który ma ruch (id gracza -> handler)."""
+
+    def __init__(self, handlers: Dict[int, object]) -> None:
+        self.handlers = handlers
+
+    async def choose_action(self, game: Game, player: Player) -> str:
+        return await self.handlers[player.id].choose_action(game, player)
+
+    async def choose_card_index(self, game: Game, player: Player) -> int:
+        return await self.handlers[player.id].choose_card_index(game, player)
+
+    async def choose_row_affinity(self, game: Game, player: Player) -> RowAffinity:
+        return await self.handlers[player.id].choose_row_affinity(game, player)
+
+
+class AsyncGameController(GameController):
+    """
+    Wersja GameController jako korutyna: ten sam przebieg meczu
+    (dobieranie, rundy, tury), ale decyzje graczy są awaitowane,
+    więc wiele meczów może działać na jednej pętli asyncio.
+    """
+
+    async def run_match_async(self) -> None:
+        if self.event_log is not None:
+            self.event_log.begin_match(self.game)
+            try:
+                await self._run_match_async()
+            except BaseException:
+                self.event_log.abort_match()
+                raise
+            self.event_log.end_match()
+        else:
+            await self._run_match_async()
+
+    async def _run_match_async(self) -> None:
+        timer = self.timer
+        if timer is None:
+            await self._match_loop_async(self.game, self.renderer)
+            return
+        timer.reset()
+        with timer.span("match"):
+            await self._match_loop_async(*self._timed_engine_and_renderer(timer))
+
+    async def _match_loop_async(self, engine, renderer) -> None:
+        # ten sam przebieg co _match_loop (GameController._match_steps),
+        # tylko decyzje są awaitowane
+        timer = self.timer
+        steps = self._match_steps(engine, renderer)
+        request = next(steps, None)
+        while request is not None:
+            name, player = request
+            decide = getattr(self.input, name)
+            try:
+                if timer is None:
+                    decision = await decide(self.game, player)
+                else:
+                    # TimedProxy zmierzyłby tylko utworzenie korutyny –
+                    # mierzymy całe oczekiwanie na decyzję
+                    with timer.span(INPUT_PHASES[name]):
+                        decision = await decide(self.game, player)
+            except Exception as error:
+                request = self._resume(steps, error=error)
+            else:
+                request = self._resume(steps, decision)
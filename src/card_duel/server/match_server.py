@@ -0,0 +1,298 @@
+import asyncio
+import json
+import random
+from typing import Callable, List, Optional, Tuple
+
+from src.card_duel.board import Board
+from src.card_duel.actions import play_action
+from src.card_duel.bots import RandomBot, row_for_card
+from src.card_duel.card import RowAffinity
+from src.card_duel.deck import Deck
+from src.card_duel.game import Game
+from src.card_duel.headless.renderer_null import RendererNull
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+from src.card_duel.server.async_controller import (AsyncBot,
+                                                    AsyncGameController,
+                                                    AsyncSeats)
+from src.card_duel.static_decks import make_static_decks
+
+
+DEFAULT_ACTION_TIMEOUT = 30.0
+# tyle błędnych odpowiedzi w jednej turze, potem wymuszony pas
+MAX_INVALID_REPLIES = 3
+PLAYER_IDS = (1, 2)
+
+# Protokół: jeden obiekt JSON na linię.
+# klient -> serwer:
+#   {"type": "join"}                      – czekaj na drugiego gracza
+#   {"type": "join", "opponent": "bot"}   – graj od razu z botem
+#   {"type": "action", "turn": 1, "action": "pass"}
+#   {"type": "action", "turn": 1, "action": "play", "card_index": 0, "row": "MELEE"}
+#   ("turn" powtarza numer z wiadomości "turn"; odpowiedzi na starsze
+#   tury są pomijane, "row" domyślnie wg row_affinity karty)
+# serwer -> klient:
+#   {"type": "waiting"}, {"type": "start", "player_id": ...},
+#   {"type": "turn", "turn": ..., "state": ...}, {"type": "timeout"},
+#   {"type": "error", "message": ...}, {"type": "result", "winner_id": ..., "state": ...}
+
+
+def public_state(game: Game, player_id: int) -> dict:
+    """Game.serialize() z perspektywy gracza – ręka przeciwnika tylko jako liczba kart."""
+    state = game.serialize()
+    for player_state in state["players"]:
+        if player_state["id"] != player_id:
+            player_state["hand_size"] = len(player_state.pop("hand"))
+    return state
+
+
+class RemoteInput:
+    """
+    Gracz po drugiej stronie gniazda (asynchroniczny input handler).
+    Brak poprawnej odpowiedzi w action_timeout, MAX_INVALID_REPLIES
+    błędnych odpowiedzi albo rozłączenie = pas, więc żaden klient nie
+    wstrzymuje meczu dłużej niż limit na akcję.
+    """
+
+    def __init__(self,
+                 reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter,
+                 action_timeout: float = DEFAULT_ACTION_TIMEOUT) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.action_timeout = action_timeout
+        self.player_id: int | None = None
+        self.connected: bool = True
+        # numer tury – odpowiedź klienta musi go powtórzyć
+        self._turn: int = 0
+        self._pending: Tuple[int, RowAffinity] = (0, RowAffinity.MELEE)
+
+    async def send(self, message: dict) -> None:
+        if not self.connected:
+            return
+        self.writer.write(json.dumps(message).encode("utf-8") + b"\n")
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            self.connected = False
+
+    async def receive(self) -> Optional[dict]:
+        """Następna wiadomość klienta; None po rozłączeniu."""
+        try:
+            line = await self.reader.readline()
+        except (ConnectionError, ValueError):
+            line = b""
+        if not line:
+            self.connected = False
+            return None
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return {}
+        return message if isinstance(message, dict) else {}
+
+    async def choose_action(self, game: Game, player: Player) -> str:
+        if not self.connected:
+            return "pass"
+
+        self._turn += 1
+        await self.send({"type": "turn", "turn": self._turn,
+                         "state": public_state(game, player.id)})
+        loop = asyncio.get_running_loop()
+        # jeden limit czasu na całą turę – także na kolejne błędne odpowiedzi
+        deadline = loop.time() + self.action_timeout
+        invalid = 0
+        while invalid < MAX_INVALID_REPLIES:
+            try:
+                message = await asyncio.wait_for(self.receive(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                await self.send({"type": "timeout"})
+                return "pass"
+            if message is None:
+                return "pass"
+
+            turn = message.get("turn")
+            if isinstance(turn, int) and turn < self._turn:
+                # spóźniona odpowiedź na wcześniejszą turę (np. po timeoucie)
+                continue
+            action = await self._parse_action(game, player, message)
+            if action is not None:
+                return action
+            invalid += 1
+
+        await self.send({"type": "error", "message": "Too many invalid actions, passing"})
+        return "pass"
+
+    async def _parse_action(self, game: Game, player: Player, message: dict) -> Optional[str]:
+        """Sprawdza odpowiedź klienta; None (po wysłaniu błędu), gdy jest niepoprawna."""
+        action = message.get("action")
+        if (message.get("type") != "action" or message.get("turn") != self._turn
+                or action not in ("play", "pass")):
+            await self.send({"type": "error", "message": "Unknown action"})
+            return None
+        if action == "pass":
+            return action
+
+        card_index = message.get("card_index")
+        if (not isinstance(card_index, int) or isinstance(card_index, bool)
+                or not 0 <= card_index < player.hand_size()):
+            await self.send({"type": "error", "message": "Invalid card index"})
+            return None
+        name = message.get("row")
+        try:
+            row = (row_for_card(player.hand[card_index]) if name is None
+                   else RowAffinity[name])
+        except (KeyError, TypeError):
+            await self.send({"type": "error", "message": "Invalid row"})
+            return None
+        if play_action(card_index, row) not in game.legal_actions(player.id):
+            await self.send({"type": "error", "message": "Card cannot be played to this row"})
+            return None
+        self._pending = (card_index, row)
+        return action
+
+    async def choose_card_index(self, game: Game, player: Player) -> int:
+        # zagranie sprawdzone już w choose_action
+        return self._pending[0]
+
+    async def choose_row_affinity(self, game: Game, player: Player) -> RowAffinity:
+        return self._pending[1]
+
+
+class MatchServer:
+    """
+    Serwer meczów na jednej pętli asyncio (TCP albo gniazdo Unix).
+    Każdy mecz to korutyna AsyncGameController; gracze zdalni to
+    RemoteInput, boty – AsyncBot. Talie z deck_factory, tasowane
+    z generatora serwera (seed).
+    """
+
+    def __init__(self,
+                 deck_factory: Callable[[], Tuple[Deck, Deck]] = make_static_decks,
+                 bot_factory: Callable[[int], object] = RandomBot,
+                 rounds_to_win: int = 2,
+                 action_timeout: float = DEFAULT_ACTION_TIMEOUT,
+                 seed: int | None = None) -> None:
+        self.deck_factory = deck_factory
+        self.bot_factory = bot_factory
+        self.rounds_to_win = rounds_to_win
+        self.action_timeout = action_timeout
+        self.rng = random.Random(seed)
+
+        self.active_matches: int = 0
+        self.matches_played: int = 0
+        self._servers: List[asyncio.AbstractServer] = []
+        self._waiting: Optional[Tuple[RemoteInput, asyncio.Future]] = None
+
+    # --- nasłuch ---
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        server = await asyncio.start_server(self._handle_client, host, port)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        server = await asyncio.start_unix_server(self._handle_client, path)
+        self._servers.append(server)
+        return server
+
+    async def close(self) -> None:
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+        if self._waiting is not None:
+            self._waiting[1].cancel()
+            self._waiting = None
+
+    # --- mecze ---
+
+    def new_game(self) -> Game:
+        deck_a, deck_b = self.deck_factory()
+        players = []
+        for player_id, deck in zip(PLAYER_IDS, (deck_a, deck_b)):
+            shuffled = Deck(deck.name, deck.original_cards, deck.meta,
+                            rng=self.rng.getrandbits(32))
+            shuffled.shuffle()
+            players.append(Player(player_id, shuffled))
+        return Game(players, Board(list(PLAYER_IDS)),
+                    Rules(rounds_to_win=self.rounds_to_win))
+
+    async def play_match(self, first, second) -> Game:
+        """Rozgrywa mecz między dwoma asynchronicznymi handlerami."""
+        game = self.new_game()
+        controller = AsyncGameController(game,
+                                         AsyncSeats(dict(zip(PLAYER_IDS, (first, second)))),
+                                         RendererNull())
+        self.active_matches += 1
+        try:
+            await controller.run_match_async()
+        finally:
+            self.active_matches -= 1
+        self.matches_played += 1
+        return game
+
+    async def play_bot_matches(self, n_matches: int) -> List[Game]:
+        """n_matches meczów bot vs bot jednocześnie na bieżącej pętli."""
+        def bot() -> AsyncBot:
+            return AsyncBot(self.bot_factory(self.rng.getrandbits(32)))
+
+        return await asyncio.gather(*(self.play_match(bot(), bot())
+                                      for _ in range(n_matches)))
+
+    async def _host(self, first, second) -> None:
+        remotes = []
+        for player_id, handler in zip(PLAYER_IDS, (first, second)):
+            if isinstance(handler, RemoteInput):
+                handler.player_id = player_id
+                remotes.append(handler)
+                await handler.send({"type": "start", "player_id": player_id})
+
+        game = await self.play_match(first, second)
+
+        for remote in remotes:
+            await remote.send({"type": "result",
+                               "winner_id": game.get_match_winner_id(),
+                               "state": public_state(game, remote.player_id)})
+
+    async def _handle_client(self,
+                             reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        remote = RemoteInput(reader, writer, self.action_timeout)
+        try:
+            try:
+                join = await asyncio.wait_for(remote.receive(), self.action_timeout)
+            except asyncio.TimeoutError:
+                return
+            if not join or join.get("type") != "join":
+                await remote.send({"type": "error", "message": "Expected join"})
+                return
+
+            if join.get("opponent") == "bot":
+                await self._host(remote, AsyncBot(self.bot_factory(self.rng.getrandbits(32))))
+                return
+
+            waiting = self._waiting
+            if waiting is None or not waiting[0].connected:
+                finished = asyncio.get_running_loop().create_future()
+                self._waiting = (remote, finished)
+                await remote.send({"type": "waiting"})
+                # mecz prowadzi korutyna drugiego gracza
+                await finished
+                return
+
+            self._waiting = None
+            opponent, finished = waiting
+            try:
+                await self._host(opponent, remote)
+            finally:
+                if not finished.done():
+                    finished.set_result(None)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
@@ -0,0 +1,51 @@
+import numpy as np
+from typing import List
+
+
+# Philox daje 4 słowa 64-bitowe na krok licznika
+_WORDS_PER_STEP = 4
+_SEED_MASK = (1 << 64) - 1
+
+
+def _stride(n_cards: int) -> int:
+    """Liczba słów losowych na jedno tasowanie (wyrównana do kroku licznika)."""
+    steps = max(1, -(-n_cards // _WORDS_PER_STEP))
+    return steps * _WORDS_PER_STEP
+
+
+def bulk_permutations(seed: int,
+                      start: int,
+                      count: int,
+                      n_cards: int,
+                      stream: int = 0) -> np.ndarray:
+    """
+    Permutacje dla meczów [start, start + count), kształt (count, n_cards).
+
+    Generator licznikowy (Philox) jest przesuwany wprost do meczu start,
+    więc wiersz dla meczu i jest identyczny niezależnie od tego, czy
+    generujemy całą paczkę, czy tylko ten jeden mecz (match_permutation).
+    stream rozróżnia talie w meczu (np. 0 i 1).
+    """
+    if count < 0 or n_cards < 0 or start < 0:
+        raise ValueError("start, count and n_cards cannot be negative")
+
+    stride = _stride(n_cards)
+    key = np.array([seed & _SEED_MASK, stream], dtype=np.uint64)
+    bit_generator = np.random.Philox(key=key)
+    bit_generator.advance(start * stride // _WORDS_PER_STEP)
+
+    raw = bit_generator.random_raw(count * stride).reshape(count, stride)
+    return np.argsort(raw[:, :n_cards], axis=1, kind="stable")
+
+
+def match_permutation(seed: int,
+                      match_index: int,
+                      n_cards: int,
+                      stream: int = 0) -> List[int]:
+    """Permutacja pojedynczego meczu – do odtworzenia go z seeda."""
+    return bulk_permutations(seed, match_index, 1, n_cards, stream)[0].tolist()
+
+
+def restrict_permutation(permutation: np.ndarray, n_cards: int) -> List[int]:
+    """Losowa permutacja n_cards z dłuższej (zachowuje rozkład jednostajny)."""
+    return permutation[permutation < n_cards].tolist()
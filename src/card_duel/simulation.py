@@ -0,0 +1,245 @@
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.card_duel.board import Board
+from src.card_duel.bots import RandomBot, SeatedBots
+from src.card_duel.controller import GameController
+from src.card_duel.deck import Deck
+from src.card_duel.game import Game
+from src.card_duel.headless.renderer_null import RendererNull
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+DeckPair = Tuple[Deck, Deck]
+# fabryka bota: przyjmuje seed, zwraca obiekt z choose_action /
+# choose_card_index / choose_row_affinity (jak InputHandlerCLI).
+# Musi być picklowalna (klasa lub funkcja z poziomu modułu, partial).
+BotFactory = Callable[[int], object]
+
+
+class SimulationResult:
+    """Zagregowane wyniki serii meczów (sumy – łatwo łączyć między procesami)."""
+
+    def __init__(self) -> None:
+        self.matches: int = 0
+        self.draws: int = 0
+        self.rounds_played: int = 0
+        self.matches_by_deck: Dict[str, int] = {}
+        self.wins_by_deck: Dict[str, int] = {}
+        self.final_power_by_deck: Dict[str, int] = {}
+
+    def record(self, game: Game) -> None:
+        self.matches += 1
+        self.rounds_played += game.current_round
+
+        for player in game.players.values():
+            name = player.deck.name
+            power = game.board.get_total_power(player.id)
+            self.matches_by_deck[name] = self.matches_by_deck.get(name, 0) + 1
+            self.final_power_by_deck[name] = (
+                self.final_power_by_deck.get(name, 0) + power
+            )
+
+        winner_id = game.get_match_winner_id()
+        if winner_id is None:
+            self.draws += 1
+        else:
+            name = game.players[winner_id].deck.name
+            self.wins_by_deck[name] = self.wins_by_deck.get(name, 0) + 1
+
+    def merge(self, other: "SimulationResult") -> None:
+        self.matches += other.matches
+        self.draws += other.draws
+        self.rounds_played += other.rounds_played
+        for target, source in (
+            (self.matches_by_deck, other.matches_by_deck),
+            (self.wins_by_deck, other.wins_by_deck),
+            (self.final_power_by_deck, other.final_power_by_deck),
+        ):
+            for name, value in source.items():
+                target[name] = target.get(name, 0) + value
+
+    def win_rate(self, deck_name: str) -> float:
+        played = self.matches_by_deck.get(deck_name, 0)
+        if played == 0:
+            return 0.0
+        return self.wins_by_deck.get(deck_name, 0) / played
+
+    def average_final_power(self, deck_name: str) -> float:
+        played = self.matches_by_deck.get(deck_name, 0)
+        if played == 0:
+            return 0.0
+        return self.final_power_by_deck.get(deck_name, 0) / played
+
+    def serialize(self) -> dict:
+        return {
+            "matches": self.matches,
+            "draws": self.draws,
+            "rounds_played": self.rounds_played,
+            "matches_by_deck": dict(self.matches_by_deck),
+            "wins_by_deck": dict(self.wins_by_deck),
+            "final_power_by_deck": dict(self.final_power_by_deck),
+        }
+
+
+def match_seed(seed: int, match_index: int) -> int:
+    """Seed pojedynczego meczu – niezależny od podziału na paczki."""
+    return (seed << 32) + match_index
+
+
+def run_single_match(deck_a: Deck,
+                     deck_b: Deck,
+                     bot_factory: BotFactory,
+                     seed: int,
+                     rounds_to_win: int = 2,
+                     permutations: Optional[Sequence[Sequence[int]]] = None,
+                     second_bot_factory: Optional[BotFactory] = None
+                     ) -> Game:
+    """
+    Rozgrywa jeden mecz bot vs bot przez GameController (bez renderowania).
+    Talie są kopiowane z original_cards i tasowane z podanego seeda
+    albo podanymi permutacjami (po jednej na talię).
+    Z second_bot_factory gracz 2 ma własnego bota (inaczej jeden bot gra obiema stronami).
+    """
+    rng = random.Random(seed)
+
+    deck1 = Deck(deck_a.name, deck_a.original_cards, deck_a.meta, rng=rng)
+    deck2 = Deck(deck_b.name, deck_b.original_cards, deck_b.meta, rng=rng)
+    if permutations is None:
+        deck1.shuffle()
+        deck2.shuffle()
+    else:
+        deck1.shuffle(permutations[0])
+        deck2.shuffle(permutations[1])
+
+    player1 = Player(1, deck1)
+    player2 = Player(2, deck2)
+    board = Board([player1.id, player2.id])
+    rules = Rules(rounds_to_win=rounds_to_win)
+    game = Game([player1, player2], board, rules)
+
+    bot = bot_factory(rng.getrandbits(32))
+    if second_bot_factory is not None:
+        bot = SeatedBots({player1.id: bot,
+                          player2.id: second_bot_factory(rng.getrandbits(32))})
+    controller = GameController(game, bot, RendererNull())
+    controller.run_match()
+    return game
+
+
+def _max_deck_size(deck_pairs: List[DeckPair]) -> int:
+    return max(len(deck.original_cards)
+               for pair in deck_pairs for deck in pair)
+
+
+def _run_chunk(deck_pairs: List[DeckPair],
+               bot_factory: BotFactory,
+               seed: int,
+               start: int,
+               count: int,
+               rounds_to_win: int,
+               bulk_shuffle: bool = False) -> SimulationResult:
+    """Jednostka pracy dla procesu: mecze [start, start + count)."""
+    result = SimulationResult()
+
+    if bulk_shuffle:
+        # NumPy potrzebny tylko w tym trybie
+        from src.card_duel.shuffling import bulk_permutations, restrict_permutation
+
+        n_cards = _max_deck_size(deck_pairs)
+        first = bulk_permutations(seed, start, count, n_cards, stream=0)
+        second = bulk_permutations(seed, start, count, n_cards, stream=1)
+
+    for offset, match_index in enumerate(range(start, start + count)):
+        deck_a, deck_b = deck_pairs[match_index % len(deck_pairs)]
+        permutations = None
+        if bulk_shuffle:
+            permutations = (
+                restrict_permutation(first[offset], len(deck_a.original_cards)),
+                restrict_permutation(second[offset], len(deck_b.original_cards)),
+            )
+        game = run_single_match(deck_a,
+                                deck_b,
+                                bot_factory,
+                                match_seed(seed, match_index),
+                                rounds_to_win,
+                                permutations)
+        result.record(game)
+    return result
+
+
+def replay_match(deck_pairs: List[DeckPair],
+                 bot_factory: BotFactory,
+                 seed: int,
+                 match_index: int,
+                 rounds_to_win: int = 2,
+                 bulk_shuffle: bool = False) -> Game:
+    """Odtwarza pojedynczy mecz z symulacji (ten sam seed i indeks meczu)."""
+    pairs = list(deck_pairs)
+    deck_a, deck_b = pairs[match_index % len(pairs)]
+    permutations = None
+    if bulk_shuffle:
+        from src.card_duel.shuffling import match_permutation
+
+        n_cards = _max_deck_size(pairs)
+        permutations = [
+            [i for i in match_permutation(seed, match_index, n_cards, stream)
+             if i < len(deck.original_cards)]
+            for stream, deck in enumerate((deck_a, deck_b))
+        ]
+    return run_single_match(deck_a, deck_b, bot_factory,
+                            match_seed(seed, match_index),
+                            rounds_to_win, permutations)
+
+
+def simulate_matches(deck_pairs: List[DeckPair],
+                     bot_factory: BotFactory = RandomBot,
+                     seed: int = 0,
+                     n_matches: int = 1000,
+                     workers: int | None = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     rounds_to_win: int = 2,
+                     bulk_shuffle: bool = False) -> SimulationResult:
+    """
+    Headless symulacja n_matches meczów:
+    - mecz i gra parą deck_pairs[i % len(deck_pairs)],
+    - mecze dzielone są na paczki po chunk_size i rozsyłane do ProcessPoolExecutor,
+    - workers=1 uruchamia wszystko w bieżącym procesie,
+    - bulk_shuffle=True generuje permutacje talii hurtowo (NumPy) dla paczki.
+    Każdy mecz można odtworzyć przez replay_match.
+    Wynik zależy tylko od seeda, nie od liczby procesów ani chunk_size.
+    """
+    if not deck_pairs:
+        raise ValueError("Simulation requires at least one deck pair")
+    if n_matches < 0:
+        raise ValueError("n_matches cannot be negative")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    pairs = list(deck_pairs)
+    chunks = [(start, min(chunk_size, n_matches - start))
+              for start in range(0, n_matches, chunk_size)]
+
+    result = SimulationResult()
+
+    if workers == 1 or len(chunks) <= 1:
+        for start, count in chunks:
+            result.merge(_run_chunk(pairs, bot_factory, seed,
+                                    start, count, rounds_to_win,
+                                    bulk_shuffle))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_chunk, pairs, bot_factory, seed,
+                            start, count, rounds_to_win, bulk_shuffle)
+            for start, count in chunks
+        ]
+        for future in as_completed(futures):
+            result.merge(future.result())
+
+    return result
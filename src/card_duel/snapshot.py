@@ -0,0 +1,215 @@
+import struct
+import sys
+from array import array
+from typing import List
+
+from src.card_duel.board import Board
+from src.card_duel.card import RowAffinity
+from src.card_duel.catalog import CardCatalog
+from src.card_duel.deck import Deck
+from src.card_duel.game import Game
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+
+
+MAGIC = b"CDSN"
+SNAPSHOT_VERSION = 3
+NO_INDEX = -1
+NO_CARD = -1
+ROW_LANES = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+
+# magic, wersja, liczba graczy, runda, aktywny, rozpoczynający,
+# flagi (bit 0: runda aktywna, bit 1: drużyny), rounds_to_win,
+# zwycięzca ostatniej rundy
+_HEADER = struct.Struct("<4sBBHbbBBb")
+# id gracza, wygrane rundy, has_passed, długość nazwy talii, drużyna
+_PLAYER = struct.Struct("<iBBHB")
+# wersja 1 (tylko 2 graczy, bez drużyn)
+_PLAYER_V1 = struct.Struct("<iBBH")
+# liczność: ręka, talia, MELEE, RANGED, SIEGE
+_COUNTS = struct.Struct("<HHHHH")
+# od wersji 3: liczba modyfikatorów gracza, a po niej
+# (indeks rzędu, id karty albo NO_CARD, rodzaj, wartość)
+_MODIFIER_COUNT = struct.Struct("<H")
+_MODIFIER = struct.Struct("<BiBh")
+
+_FLAG_ROUND_ACTIVE = 1
+_FLAG_TEAMS = 2
+
+
+def _index_of(order: List[int], player_id: int | None) -> int:
+    return NO_INDEX if player_id is None else order.index(player_id)
+
+
+def _player_at(order: List[int], index: int) -> int | None:
+    if index == NO_INDEX:
+        return None
+    if not 0 <= index < len(order):
+        raise ValueError("Invalid player in snapshot")
+    return order[index]
+
+
+def _pack_ids(ids: List[int]) -> bytes:
+    packed = array("i", ids)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def encode_snapshot(game: Game) -> bytes:
+    """
+    Binarny zapis stanu meczu: karty jako id z katalogu (int32),
+    rzędy, ręce i talie jako spakowane tablice, flagi w bajtach.
+    """
+    order = game.player_order
+    flags = _FLAG_ROUND_ACTIVE if game.is_round_active else 0
+    if game.teams is not None:
+        flags |= _FLAG_TEAMS
+
+    try:
+        parts = [_HEADER.pack(MAGIC,
+                              SNAPSHOT_VERSION,
+                              len(order),
+                              game.current_round,
+                              _index_of(order, game.active_player_id),
+                              _index_of(order, game.starting_player_id),
+                              flags,
+                              game.rules.rounds_to_win,
+                              _index_of(order, game.last_round_winner_id))]
+
+        for player_id in order:
+            player = game.players[player_id]
+            name = player.deck.name.encode("utf-8")
+            rows = [game.board.get_row(player_id, affinity).cards
+                    for affinity in ROW_LANES]
+
+            parts.append(_PLAYER.pack(player_id, player.rounds_won,
+                                      player.has_passed, len(name),
+                                      game.team_by_player[player_id]))
+            parts.append(name)
+            parts.append(_COUNTS.pack(len(player.hand), len(player.deck),
+                                      *(len(cards) for cards in rows)))
+            ids = [card.id for card in player.hand]
+            ids += [card.id for card in player.deck.cards]
+            for cards in rows:
+                ids += [card.id for card in cards]
+            parts.append(_pack_ids(ids))
+
+            modifiers = []
+            for row_index, affinity in enumerate(ROW_LANES):
+                row = game.board.get_row(player_id, affinity)
+                for kind, amount in row.modifiers:
+                    modifiers.append(_MODIFIER.pack(row_index, NO_CARD, kind, amount))
+                for card_id, card_modifiers in row.card_modifiers.items():
+                    for kind, amount in card_modifiers:
+                        modifiers.append(_MODIFIER.pack(row_index, card_id, kind, amount))
+            parts.append(_MODIFIER_COUNT.pack(len(modifiers)))
+            parts.extend(modifiers)
+    except (struct.error, OverflowError) as exc:
+        raise ValueError(f"Game state does not fit snapshot format: {exc}")
+
+    return b"".join(parts)
+
+
+def decode_snapshot(data: bytes, catalog: CardCatalog) -> Game:
+    """Odtwarza Game z encode_snapshot; karty pochodzą z katalogu."""
+    view = memoryview(data)
+    try:
+        (magic, version, n_players, current_round, active_index,
+         starting_index, flags, rounds_to_win,
+         last_winner_index) = _HEADER.unpack_from(view, 0)
+    except struct.error:
+        raise ValueError("Snapshot too short")
+    if magic != MAGIC:
+        raise ValueError("Not a game snapshot")
+    if version not in (1, 2, SNAPSHOT_VERSION):
+        raise ValueError(f"Unsupported snapshot version={version}")
+    player_format = _PLAYER_V1 if version == 1 else _PLAYER
+
+    offset = _HEADER.size
+    card = catalog.get
+    players = []
+    rows_by_player = []
+    modifiers_by_player = []
+    team_by_player = {}
+
+    try:
+        for _ in range(n_players):
+            fields = player_format.unpack_from(view, offset)
+            player_id, rounds_won, has_passed, name_len = fields[:4]
+            team_by_player[player_id] = fields[4] if version > 1 else 0
+            offset += player_format.size
+            name = bytes(view[offset:offset + name_len]).decode("utf-8")
+            offset += name_len
+            counts = _COUNTS.unpack_from(view, offset)
+            offset += _COUNTS.size
+
+            n_ids = sum(counts)
+            ids = array("i")
+            ids.frombytes(view[offset:offset + 4 * n_ids])
+            if len(ids) != n_ids:
+                raise ValueError("Snapshot truncated")
+            if sys.byteorder == "big":
+                ids.byteswap()
+            offset += 4 * n_ids
+
+            cards = [card(card_id) for card_id in ids]
+            hand_count, deck_count = counts[0], counts[1]
+            position = hand_count + deck_count
+
+            player = Player(player_id, Deck(name, cards[hand_count:position]))
+            player.hand = cards[:hand_count]
+            player.rounds_won = rounds_won
+            player.has_passed = bool(has_passed)
+            players.append(player)
+
+            player_rows = []
+            for count in counts[2:]:
+                player_rows.append(cards[position:position + count])
+                position += count
+            rows_by_player.append(player_rows)
+
+            modifiers = []
+            if version >= 3:
+                (n_modifiers,) = _MODIFIER_COUNT.unpack_from(view, offset)
+                offset += _MODIFIER_COUNT.size
+                for _ in range(n_modifiers):
+                    modifiers.append(_MODIFIER.unpack_from(view, offset))
+                    offset += _MODIFIER.size
+            modifiers_by_player.append(modifiers)
+    except struct.error:
+        raise ValueError("Snapshot truncated")
+
+    if offset != len(view):
+        raise ValueError("Trailing data after snapshot")
+
+    order = [player.id for player in players]
+    board = Board(order)
+    for player_id, player_rows in zip(order, rows_by_player):
+        for affinity, cards in zip(ROW_LANES, player_rows):
+            for row_card in cards:
+                board.place_card(player_id, row_card, affinity)
+    for player_id, modifiers in zip(order, modifiers_by_player):
+        for row_index, card_id, kind, amount in modifiers:
+            try:
+                board.add_modifier(player_id, ROW_LANES[row_index], (kind, amount),
+                                   None if card_id == NO_CARD else card(card_id))
+            except IndexError:
+                raise ValueError("Invalid modifier row in snapshot")
+
+    teams = None
+    if flags & _FLAG_TEAMS:
+        grouped = {}
+        for player_id in order:
+            grouped.setdefault(team_by_player[player_id], []).append(player_id)
+        teams = [grouped[team] for team in sorted(grouped)]
+
+    game = Game(players, board, Rules(rounds_to_win=rounds_to_win), teams)
+    game.current_round = current_round
+    game.active_player_id = _player_at(order, active_index)
+    game.starting_player_id = _player_at(order, starting_index)
+    if game.starting_player_id is None:
+        raise ValueError("Invalid player in snapshot")
+    game.is_round_active = bool(flags & _FLAG_ROUND_ACTIVE)
+    game.last_round_winner_id = _player_at(order, last_winner_index)
+    return game
@@ -0,0 +1,26 @@
+import os
+from functools import lru_cache
+from typing import Tuple
+
+from src.card_duel.catalog import CardCatalog
+from src.card_duel.catalog_loader import load_catalog
+from src.card_duel.deck import Deck
+
+
+# wspólne definicje kart i talii dla run.py / run_pygame.py / serwera
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+STATIC_CATALOG_FILES = (os.path.join(DATA_DIR, "cards.csv"),
+                        os.path.join(DATA_DIR, "decks.json"))
+NORTHERN_ALLIANCE = "Northern Alliance"
+SKELLIGE_RAIDERS = "Skellige Raiders"
+
+
+@lru_cache(maxsize=None)
+def get_static_catalog() -> CardCatalog:
+    """Katalog budowany raz na proces – kolejne talie współdzielą karty."""
+    return load_catalog(STATIC_CATALOG_FILES)
+
+
+def make_static_decks() -> Tuple[Deck, Deck]:
+    catalog = get_static_catalog()
+    return catalog.deck(NORTHERN_ALLIANCE), catalog.deck(SKELLIGE_RAIDERS)
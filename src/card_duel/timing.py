@@ -0,0 +1,150 @@
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+
+# kubełek b histogramu trzyma czasy z przedziału [2**(b-1), 2**b) ns
+BUCKETS = 64
+
+
+class Histogram:
+    """Histogram czasów (ns) w kubełkach potęg dwójki plus count/sum/min/max."""
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns: int = 0
+        self.buckets: List[int] = [0] * BUCKETS
+
+    def record(self, ns: int) -> None:
+        self.count += 1
+        self.total_ns += ns
+        if self.min_ns is None or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.buckets[min(ns.bit_length(), BUCKETS - 1)] += 1
+
+    def merge(self, other: "Histogram") -> None:
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.total_ns += other.total_ns
+        if self.min_ns is None or other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        for bucket, count in enumerate(other.buckets):
+            self.buckets[bucket] += count
+
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile_ns(self, q: float) -> int:
+        """Górna granica kubełka, w którym wypada percentyl q (0..100)."""
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * q // 100))
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min((1 << bucket) - 1, self.max_ns)
+        return self.max_ns
+
+    def serialize(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.mean_ns(),
+            "min_ns": self.min_ns or 0,
+            "max_ns": self.max_ns,
+            "p50_ns": self.percentile_ns(50),
+            "p90_ns": self.percentile_ns(90),
+            "p99_ns": self.percentile_ns(99),
+            # [górna granica kubełka w ns, liczba pomiarów], tylko niepuste
+            "buckets": [[(1 << bucket) - 1, count]
+                        for bucket, count in enumerate(self.buckets) if count],
+        }
+
+
+class PhaseTimer:
+    """
+    Zbiera czasy faz (perf_counter_ns) w histogramy – po jednym na fazę.
+    Pomiar dokładany jest przez owinięcie metod (timed/wrap), więc kod,
+    który timera nie używa, nie płaci nic.
+    """
+
+    def __init__(self) -> None:
+        self.histograms: Dict[str, Histogram] = {}
+
+    def histogram(self, phase: str) -> Histogram:
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = Histogram()
+        return histogram
+
+    def timed(self, func: Callable, phase: str) -> Callable:
+        """Zwraca func mierzoną jako faza phase."""
+        record = self.histogram(phase).record
+        clock = time.perf_counter_ns
+
+        def call(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - start)
+
+        return call
+
+    def wrap(self, target: Any, phases: Dict[str, str]) -> "TimedProxy":
+        """Obiekt zastępczy: metody z phases (nazwa -> faza) są mierzone."""
+        return TimedProxy(target, self, phases)
+
+    @contextmanager
+    def span(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.histogram(phase).record(time.perf_counter_ns() - start)
+
+    def reset(self) -> None:
+        self.histograms.clear()
+
+    def merge(self, other: "PhaseTimer") -> None:
+        """Dolicza pomiary innego timera (np. sumowanie wielu meczów)."""
+        for phase, histogram in other.histograms.items():
+            self.histogram(phase).merge(histogram)
+
+    def serialize(self) -> dict:
+        return {"phases": {phase: histogram.serialize()
+                           for phase, histogram in sorted(self.histograms.items())}}
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        return json.dumps(self.serialize(), indent=indent)
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_json(indent=2))
+
+
+class TimedProxy:
+    """Przepuszcza atrybuty do target; wybrane metody mierzy timerem."""
+
+    def __init__(self, target: Any, timer: PhaseTimer, phases: Dict[str, str]) -> None:
+        self._target = target
+        for name, phase in phases.items():
+            setattr(self, name, timer.timed(getattr(target, name), phase))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
+
+
+def phases(prefix: str, names: Iterable[str]) -> Dict[str, str]:
+    """Mapowanie nazw metod na fazy "prefix.nazwa"."""
+    return {name: f"{prefix}.{name}" for name in names}
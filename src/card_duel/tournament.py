@@ -0,0 +1,379 @@
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from src.card_duel.bots import RandomBot
+from src.card_duel.deck import Deck
+from src.card_duel.simulation import BotFactory, match_seed, run_single_match
+
+
+ROUND_ROBIN = "round_robin"
+SWISS = "swiss"
+MODES = (ROUND_ROBIN, SWISS)
+
+DEFAULT_GAMES_PER_PAIRING = 100
+DEFAULT_CHUNK_SIZE = 100
+
+INITIAL_RATING = 1500.0
+DEFAULT_ELO_K = 16.0
+INITIAL_RD = 350.0
+# dolne ograniczenie RD – przy tysiącach gier Glicko nie "zamarza"
+MIN_RD = 30.0
+
+# wynik gry z punktu widzenia gracza a (bajt w ChunkResult.outcomes)
+LOSS, DRAW, WIN = 0, 1, 2
+
+Pairing = Tuple[str, str]
+
+
+class Entrant:
+    """Uczestnik turnieju: talia i bot, który nią gra."""
+
+    def __init__(self, name: str, deck: Deck, bot_factory: BotFactory = RandomBot) -> None:
+        self.name = name
+        self.deck = deck
+        self.bot_factory = bot_factory
+
+
+class ChunkResult:
+    """Wyniki paczki gier jednej pary (gry [start, start + len(outcomes)))."""
+
+    def __init__(self, name_a: str, name_b: str, pairing: int, start: int,
+                 outcomes: bytes) -> None:
+        self.name_a = name_a
+        self.name_b = name_b
+        self.pairing = pairing
+        self.start = start
+        self.outcomes = outcomes
+
+    @property
+    def games(self) -> int:
+        return len(self.outcomes)
+
+    @property
+    def wins_a(self) -> int:
+        return self.outcomes.count(WIN)
+
+    @property
+    def wins_b(self) -> int:
+        return self.outcomes.count(LOSS)
+
+    @property
+    def draws(self) -> int:
+        return self.outcomes.count(DRAW)
+
+    def scores_a(self) -> List[float]:
+        return [outcome / 2 for outcome in self.outcomes]
+
+    def serialize(self) -> dict:
+        return {
+            "a": self.name_a,
+            "b": self.name_b,
+            "pairing": self.pairing,
+            "start": self.start,
+            "games": self.games,
+            "wins_a": self.wins_a,
+            "wins_b": self.wins_b,
+            "draws": self.draws,
+        }
+
+
+def _play_chunk(entrant_a: Entrant,
+                entrant_b: Entrant,
+                pairing_seed: int,
+                pairing: int,
+                start: int,
+                count: int,
+                rounds_to_win: int) -> ChunkResult:
+    """Jednostka pracy dla procesu; strony stołu zmieniają się co grę."""
+    outcomes = bytearray()
+    for game_index in range(start, start + count):
+        a_first = game_index % 2 == 0
+        first, second = (entrant_a, entrant_b) if a_first else (entrant_b, entrant_a)
+        game = run_single_match(first.deck, second.deck, first.bot_factory,
+                                match_seed(pairing_seed, game_index), rounds_to_win,
+                                second_bot_factory=second.bot_factory)
+        winner_id = game.get_match_winner_id()
+        if winner_id is None:
+            outcomes.append(DRAW)
+        else:
+            outcomes.append(WIN if (winner_id == 1) == a_first else LOSS)
+    return ChunkResult(entrant_a.name, entrant_b.name, pairing, start, bytes(outcomes))
+
+
+# --- rankingi ---
+
+class EloRatings:
+    """Elo aktualizowane gra po grze (kolejność gier w paczce)."""
+
+    def __init__(self, k: float = DEFAULT_ELO_K, initial: float = INITIAL_RATING) -> None:
+        self.k = k
+        self.initial = initial
+        self.ratings: Dict[str, float] = {}
+
+    def rating(self, name: str) -> float:
+        return self.ratings.get(name, self.initial)
+
+    def expected(self, name_a: str, name_b: str) -> float:
+        return 1.0 / (1.0 + 10 ** ((self.rating(name_b) - self.rating(name_a)) / 400))
+
+    def record(self, name_a: str, name_b: str, scores_a: Iterable[float]) -> None:
+        rating_a, rating_b = self.rating(name_a), self.rating(name_b)
+        for score in scores_a:
+            change = self.k * (score - 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400)))
+            rating_a += change
+            rating_b -= change
+        self.ratings[name_a] = rating_a
+        self.ratings[name_b] = rating_b
+
+
+class GlickoRatings:
+    """Glicko-1; każda paczka gier to okres ratingowy dla obu graczy."""
+
+    Q = math.log(10) / 400
+
+    def __init__(self, initial: float = INITIAL_RATING, initial_rd: float = INITIAL_RD,
+                 c: float = 0.0, min_rd: float = MIN_RD) -> None:
+        self.initial = initial
+        self.initial_rd = initial_rd
+        # wzrost niepewności między okresami (0 = brak)
+        self.c = c
+        self.min_rd = min_rd
+        self.ratings: Dict[str, Tuple[float, float]] = {}
+
+    def rating(self, name: str) -> Tuple[float, float]:
+        """(rating, RD)"""
+        return self.ratings.get(name, (self.initial, self.initial_rd))
+
+    @classmethod
+    def _g(cls, rd: float) -> float:
+        return 1.0 / math.sqrt(1.0 + 3.0 * (cls.Q * rd) ** 2 / math.pi ** 2)
+
+    def _updated(self, player: Tuple[float, float], opponent: Tuple[float, float],
+                 scores: Sequence[float]) -> Tuple[float, float]:
+        rating, rd = player
+        rd = min(math.sqrt(rd ** 2 + self.c ** 2), self.initial_rd)
+        opponent_rating, opponent_rd = opponent
+        g = self._g(opponent_rd)
+        expected = 1.0 / (1.0 + 10 ** (-g * (rating - opponent_rating) / 400))
+        # wszystkie gry okresu z tym samym przeciwnikiem – sumy zamiast pętli
+        information = self.Q ** 2 * len(scores) * g ** 2 * expected * (1.0 - expected)
+        denominator = 1.0 / rd ** 2 + information
+        rating += self.Q / denominator * g * (sum(scores) - len(scores) * expected)
+        return rating, max(math.sqrt(1.0 / denominator), self.min_rd)
+
+    def record(self, name_a: str, name_b: str, scores_a: Sequence[float]) -> None:
+        if not scores_a:
+            return
+        player_a, player_b = self.rating(name_a), self.rating(name_b)
+        self.ratings[name_a] = self._updated(player_a, player_b, scores_a)
+        self.ratings[name_b] = self._updated(player_b, player_a,
+                                             [1.0 - score for score in scores_a])
+
+
+class Standing:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.games = 0
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+
+    @property
+    def points(self) -> float:
+        return self.wins + self.draws / 2
+
+    def record(self, wins: int, draws: int, losses: int) -> None:
+        self.games += wins + draws + losses
+        self.wins += wins
+        self.draws += draws
+        self.losses += losses
+
+
+# --- parowanie ---
+
+def round_robin_pairings(names: Sequence[str]) -> List[Pairing]:
+    return [(names[i], names[j])
+            for i in range(len(names)) for j in range(i + 1, len(names))]
+
+
+def swiss_pairings(ranked: Sequence[str],
+                   played: Set[FrozenSet[str]],
+                   byes: Optional[Set[str]] = None) -> List[Pairing]:
+    """
+    Parowanie rundy szwajcarskiej: od góry tabeli każdy dostaje najbliższego
+    rywala, z którym jeszcze nie grał (gdy się nie da – najbliższego
+    w ogóle). Przy nieparzystej liczbie pauzuje najniżej sklasyfikowany
+    spośród tych, którzy jeszcze nie pauzowali (byes).
+    """
+    unpaired = list(ranked)
+    if len(unpaired) % 2:
+        byes = byes or set()
+        bye = next((name for name in reversed(unpaired) if name not in byes), unpaired[-1])
+        unpaired.remove(bye)
+    pairings = []
+    while unpaired:
+        first = unpaired.pop(0)
+        opponent = next((name for name in unpaired
+                         if frozenset((first, name)) not in played), unpaired[0])
+        unpaired.remove(opponent)
+        pairings.append((first, opponent))
+    return pairings
+
+
+class Tournament:
+    """
+    Turniej talii/botów: każda para gra games_per_pairing gier (strony
+    stołu na zmianę). Gry dzielone są na paczki po chunk_size i rozsyłane
+    do ProcessPoolExecutor (workers=1 – w bieżącym procesie). results()
+    oddaje paczki w miarę kończenia, a tabela i rankingi (Elo, Glicko)
+    są aktualizowane przyrostowo, więc stan można oglądać w trakcie.
+    Wyniki gier zależą tylko od seeda; Elo dodatkowo od kolejności
+    kończenia paczek (deterministyczne przy workers=1).
+    """
+
+    def __init__(self,
+                 entrants: Sequence[Entrant],
+                 games_per_pairing: int = DEFAULT_GAMES_PER_PAIRING,
+                 mode: str = ROUND_ROBIN,
+                 rounds: Optional[int] = None,
+                 seed: int = 0,
+                 workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 rounds_to_win: int = 2,
+                 elo_k: float = DEFAULT_ELO_K,
+                 results_path: Optional[str] = None) -> None:
+        names = [entrant.name for entrant in entrants]
+        if len(names) < 2:
+            raise ValueError("Tournament requires at least two entrants")
+        if len(set(names)) != len(names):
+            raise ValueError("Entrant names must be unique")
+        if mode not in MODES:
+            raise ValueError(f"Unknown tournament mode={mode!r}, expected one of {MODES}")
+        if games_per_pairing <= 0 or chunk_size <= 0:
+            raise ValueError("games_per_pairing and chunk_size must be positive")
+
+        self.entrants: Dict[str, Entrant] = {entrant.name: entrant for entrant in entrants}
+        self.games_per_pairing = games_per_pairing
+        self.mode = mode
+        # domyślnie tyle rund szwajcarskich, ile trzeba do wyłonienia lidera
+        self.rounds = rounds if rounds is not None else max(1, math.ceil(math.log2(len(names))))
+        self.seed = seed
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.rounds_to_win = rounds_to_win
+        # opcjonalny strumień JSON lines: jedna linia na zakończoną paczkę
+        self.results_path = results_path
+
+        self.elo = EloRatings(elo_k)
+        self.glicko = GlickoRatings()
+        self.standings: Dict[str, Standing] = {name: Standing(name) for name in names}
+        self.played: Set[FrozenSet[str]] = set()
+        self.byes: Set[str] = set()
+        self.chunks_done = 0
+        self._pairings = 0
+
+    # --- przebieg ---
+
+    def _schedule(self) -> Iterator[List[Pairing]]:
+        """Kolejne rundy parowań; rundę szwajcarską paruje się po poprzedniej."""
+        if self.mode == ROUND_ROBIN:
+            yield round_robin_pairings(list(self.entrants))
+            return
+        for _ in range(self.rounds):
+            ranked = [row["name"] for row in self.table()]
+            pairings = swiss_pairings(ranked, self.played, self.byes)
+            self.byes.update(set(ranked).difference(*pairings))
+            yield pairings
+
+    def _tasks(self, pairings: List[Pairing]) -> List[tuple]:
+        tasks = []
+        for name_a, name_b in pairings:
+            pairing = self._pairings
+            self._pairings += 1
+            self.played.add(frozenset((name_a, name_b)))
+            for start in range(0, self.games_per_pairing, self.chunk_size):
+                count = min(self.chunk_size, self.games_per_pairing - start)
+                tasks.append((self.entrants[name_a], self.entrants[name_b],
+                              match_seed(self.seed, pairing), pairing, start, count,
+                              self.rounds_to_win))
+        return tasks
+
+    def _apply(self, chunk: ChunkResult) -> None:
+        wins_a, wins_b, draws = chunk.wins_a, chunk.wins_b, chunk.draws
+        self.standings[chunk.name_a].record(wins_a, draws, wins_b)
+        self.standings[chunk.name_b].record(wins_b, draws, wins_a)
+        scores = chunk.scores_a()
+        self.elo.record(chunk.name_a, chunk.name_b, scores)
+        self.glicko.record(chunk.name_a, chunk.name_b, scores)
+        self.chunks_done += 1
+
+    def results(self) -> Iterator[ChunkResult]:
+        """Rozgrywa turniej, oddając każdą paczkę po wliczeniu jej do tabeli."""
+        executor = None
+        if self.workers != 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+        stream = open(self.results_path, "w", encoding="utf-8") if self.results_path else None
+        try:
+            for pairings in self._schedule():
+                tasks = self._tasks(pairings)
+                if executor is None:
+                    finished = (_play_chunk(*task) for task in tasks)
+                else:
+                    finished = (future.result() for future in
+                                as_completed([executor.submit(_play_chunk, *task)
+                                              for task in tasks]))
+                for chunk in finished:
+                    self._apply(chunk)
+                    if stream is not None:
+                        record = chunk.serialize()
+                        record["elo"] = {name: self.elo.rating(name)
+                                         for name in (chunk.name_a, chunk.name_b)}
+                        stream.write(json.dumps(record) + "\n")
+                        stream.flush()
+                    yield chunk
+        finally:
+            if executor is not None:
+                # przerwany turniej nie czeka na niezaczęte paczki
+                executor.shutdown(cancel_futures=True)
+            if stream is not None:
+                stream.close()
+
+    def run(self) -> List[dict]:
+        for _ in self.results():
+            pass
+        return self.table()
+
+    # --- tabela ---
+
+    def table(self) -> List[dict]:
+        """Tabela posortowana po punktach, potem po Elo."""
+        rows = []
+        for name, standing in self.standings.items():
+            glicko, glicko_rd = self.glicko.rating(name)
+            rows.append({
+                "name": name,
+                "games": standing.games,
+                "wins": standing.wins,
+                "draws": standing.draws,
+                "losses": standing.losses,
+                "points": standing.points,
+                "elo": self.elo.rating(name),
+                "glicko": glicko,
+                "glicko_rd": glicko_rd,
+            })
+        rows.sort(key=lambda row: (-row["points"], -row["elo"], row["name"]))
+        return rows
+
+
+def format_table(rows: Sequence[dict]) -> str:
+    width = max([len(row["name"]) for row in rows] + [5])
+    lines = [f"{'#':>3}  {'name':<{width}}  {'games':>7}  {'W':>6}  {'D':>5}  {'L':>6}  "
+             f"{'points':>8}  {'elo':>7}  {'glicko':>13}"]
+    for place, row in enumerate(rows, start=1):
+        lines.append(f"{place:>3}  {row['name']:<{width}}  {row['games']:>7}  "
+                     f"{row['wins']:>6}  {row['draws']:>5}  {row['losses']:>6}  "
+                     f"{row['points']:>8.1f}  {row['elo']:>7.0f}  "
+                     f"{row['glicko']:>6.0f} ±{row['glicko_rd']:.0f}")
+    return "\n".join(lines)
@@ -0,0 +1,58 @@
+import hashlib
+from functools import lru_cache
+from typing import Dict, Tuple
+
+# strefa kart w ręce; rzędy używają RowAffinity.value (1..3)
+HAND_ZONE = 0
+# modyfikatory rzędu: MODIFIER_ZONE + RowAffinity.value
+MODIFIER_ZONE = 4
+
+
+@lru_cache(maxsize=None)
+def zobrist_key(*feature) -> int:
+    """
+    Losowy 64-bitowy klucz dla cechy pozycji.
+    Wyprowadzony z samej cechy (blake2b), więc jest taki sam w każdym
+    procesie i nie zależy od kolejności, w jakiej cechy się pojawiają.
+    """
+    digest = hashlib.blake2b(repr(feature).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def flag_key(flag: str, player_id: int, value) -> int:
+    """Klucz flagi gracza (np. pas, wygrane rundy); False/0 nie zmienia hasha."""
+    return zobrist_key(flag, player_id, value) if value else 0
+
+
+class ZobristCards:
+    """
+    Przyrostowy hash kart w rękach i rzędach (multizbiory, bez kolejności).
+    k-ta kopia tej samej karty w strefie ma własny klucz, więc duplikaty
+    nie znoszą się w XOR.
+    """
+
+    def __init__(self) -> None:
+        self.value: int = 0
+        self._counts: Dict[Tuple[int, int, int], int] = {}
+
+    def update(self, zone: int, player_id: int, card_id, delta: int) -> None:
+        key = (zone, player_id, card_id)
+        counts = self._counts
+        if delta > 0:
+            copy_index = counts.get(key, 0)
+            counts[key] = copy_index + 1
+        else:
+            copy_index = counts[key] - 1
+            if copy_index:
+                counts[key] = copy_index
+            else:
+                del counts[key]
+        self.value ^= zobrist_key(zone, player_id, card_id, copy_index)
+
+    def toggle(self, key: int) -> None:
+        """Dokłada albo zdejmuje (XOR) klucz flagi."""
+        self.value ^= key
+
+    def reset(self) -> None:
+        self.value = 0
+        self._counts.clear()
@@ -0,0 +1,163 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.card_duel.actions import rows_for_affinity  # noqa: E402
+from src.card_duel.batch_engine import BatchGame, ROW_LANES, NO_PLAYER  # noqa: E402
+from src.card_duel.board import Board  # noqa: E402
+from src.card_duel.catalog import CardCatalog  # noqa: E402
+from src.card_duel.card import RowAffinity  # noqa: E402
+from src.card_duel.game import Game  # noqa: E402
+from src.card_duel.player import Player  # noqa: E402
+from src.card_duel.rules import Rules  # noqa: E402
+
+
+def make_catalog() -> CardCatalog:
+    catalog = CardCatalog()
+    affinities = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+    for card_id in range(1, 13):
+        catalog.define(card_id, f"Card {card_id}", card_id % 7 + 1,
+                       affinities[card_id % 3])
+    return catalog
+
+
+def make_game(catalog: CardCatalog, seed: int) -> Game:
+    """Gra z potasowanymi taliami – z duplikatami id, jak w build_deck."""
+    rng = random.Random(seed)
+    players = []
+    for player_id in (1, 2):
+        card_ids = [rng.randint(1, 12) for _ in range(14)]
+        players.append(Player(player_id, catalog.build_deck(f"Deck {player_id}",
+                                                            card_ids)))
+    return Game(players, Board([1, 2]), Rules(rounds_to_win=2))
+
+
+def play_in_lockstep(n_games: int, seed: int):
+    catalog = make_catalog()
+    games = [make_game(catalog, seed * 1000 + i) for i in range(n_games)]
+    for game in games:
+        game.start_match()
+    batch = BatchGame.from_games(games)
+    rng = random.Random(seed)
+
+    for game in games:
+        for player in game.players.values():
+            player.draw_from_deck(6)
+    batch.draw(6)
+
+    for _ in range(3):
+        for game in games:
+            if not game.is_match_over():
+                game.start_round()
+        batch.start_round(~batch.is_match_over())
+
+        for _ in range(40):
+            play = np.zeros(batch.n_games, bool)
+            pass_ = np.zeros(batch.n_games, bool)
+            card_index = np.zeros(batch.n_games, np.int64)
+            row_index = np.zeros(batch.n_games, np.int64)
+
+            for g, game in enumerate(games):
+                active_id = game.get_active_player_id()
+                if not game.is_round_active or active_id is None:
+                    continue
+                player = game.players[active_id]
+                if player.hand_size() == 0 or player.has_passed or rng.random() < 0.15:
+                    game.pass_turn(active_id)
+                    pass_[g] = True
+                    continue
+                idx = rng.randrange(player.hand_size())
+                row = ROW_LANES.index(rng.choice(
+                    rows_for_affinity(player.hand[idx].row_affinity)))
+                game.play_card(active_id, idx, ROW_LANES[row])
+                play[g] = True
+                card_index[g] = idx
+                row_index[g] = row
+
+            batch.play_card(card_index, row_index, play)
+            batch.pass_turn(pass_)
+
+        for game in games:
+            for player in game.players.values():
+                player.draw_from_deck(2)
+        batch.draw(2)
+
+    return games, batch
+
+
+class TestBatchGame:
+
+    def test_lockstep_matches_game_bit_for_bit(self):
+        games, batch = play_in_lockstep(n_games=25, seed=3)
+
+        for g, game in enumerate(games):
+            assert batch.serialize_game(g) == game.serialize()
+
+        winners = batch.get_match_winner_index()
+        for g, game in enumerate(games):
+            winner_id = game.get_match_winner_id()
+            expected = (NO_PLAYER if winner_id is None
+                        else game.player_order.index(winner_id))
+            assert winners[g] == expected
+        assert batch.is_match_over().tolist() == [g.is_match_over() for g in games]
+
+    def test_from_games_round_trips_initial_state(self):
+        catalog = make_catalog()
+        games = [make_game(catalog, seed) for seed in range(3)]
+
+        batch = BatchGame.from_games(games)
+
+        for g, game in enumerate(games):
+            assert batch.serialize_game(g) == game.serialize()
+
+    def test_invalid_play_raises_and_keeps_state(self):
+        catalog = make_catalog()
+        games = [make_game(catalog, seed) for seed in range(2)]
+        batch = BatchGame.from_games(games)
+        batch.start_match()
+        batch.draw(3)
+        batch.start_round()
+        before = [batch.serialize_game(g) for g in range(2)]
+
+        with pytest.raises(ValueError):
+            batch.play_card(np.array([0, 5]), 0)
+
+        assert [batch.serialize_game(g) for g in range(2)] == before
+
+    def test_draw_over_hand_capacity_changes_nothing(self):
+        batch = BatchGame(2, hand_capacity=4)
+        batch.deck_ids[:, :, :6] = np.arange(1, 7)
+        batch.deck_power[:, :, :6] = 1
+        batch.deck_count[0] = 6
+        batch.deck_count[1] = 2
+        batch.draw(2)
+        before = [array.copy() for array in (batch.hand_ids, batch.hand_count, batch.deck_count)]
+
+        # gra 0 przekroczyłaby limit dopiero przy trzeciej karcie
+        with pytest.raises(ValueError):
+            batch.draw(3)
+
+        after = (batch.hand_ids, batch.hand_count, batch.deck_count)
+        assert all((old == new).all() for old, new in zip(before, after))
+        batch.draw(2)
+        assert batch.hand_count.tolist() == [[4, 4], [2, 2]]
+
+    def test_play_before_round_start_raises(self):
+        catalog = make_catalog()
+        batch = BatchGame.from_games([make_game(catalog, 1)])
+        batch.draw(2)
+
+        with pytest.raises(ValueError):
+            batch.play_card(0, 0)
+        with pytest.raises(ValueError):
+            batch.pass_turn()
+
+    def test_round_winner_and_tie(self):
+        batch = BatchGame(3)
+        batch.row_power[0, 0, 0] = 10
+        batch.row_power[1, 1, 2] = 4
+        batch.row_power[2] = 5
+
+        assert batch.get_round_winner_index().tolist() == [0, 1, NO_PLAYER]
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from src.card_duel.benchmarks import (
+    Benchmark,
+    BenchmarkResult,
+    compare,
+    default_benchmarks,
+    format_report,
+    load_baseline,
+    run_benchmark,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+def result(name: str, ops_per_sec: float, alloc_bytes=None) -> BenchmarkResult:
+    """Pomocniczo: wynik z zadanym ops/s (1000 operacji)."""
+    return BenchmarkResult(name, 1000, int(1000 * 1e9 / ops_per_sec), 1e9 / ops_per_sec,
+                           alloc_bytes)
+
+
+class TestBenchmarks:
+
+    def test_default_cases_cover_engine_hot_paths(self):
+        names = [benchmark.name for benchmark in default_benchmarks(deck_sizes=(10,), row_sizes=(5,))]
+
+        assert names == [
+            "deck.shuffle[deck=10]", "deck.draw_many[deck=10]", "player.play_card[hand=10]",
+            "board.place_card[row=5]", "board.get_total_power[row=5]",
+            "rules.get_round_winner_id[row=5]", "game.serialize[row=5]",
+            "match.random[deck=10]", "match.greedy[deck=10]",
+        ]
+
+    def test_run_uses_fresh_state_per_sample(self):
+        setups = []
+
+        def setup():
+            state = []
+            setups.append(state)
+            return lambda: state.extend(range(100))
+
+        measured = run_benchmark(Benchmark("list.extend", setup, inner=100), samples=8)
+
+        assert measured.ops == 800
+        assert all(len(state) == 100 for state in setups)
+        assert measured.ops_per_sec > 0
+        assert measured.alloc_bytes > 0
+
+    def test_suite_runs_with_small_samples(self):
+        results = run_benchmarks(default_benchmarks(deck_sizes=(10,), row_sizes=(2,)),
+                                 samples=5, measure_allocations=False, name_filter="match")
+
+        assert [r.name for r in results] == ["match.random[deck=10]", "match.greedy[deck=10]"]
+        assert all(r.alloc_bytes is None for r in results)
+
+    def test_baseline_round_trip_and_regressions(self, tmp_path):
+        path = str(tmp_path / "baseline.json")
+        save_baseline(path, [result("a", 1000, 100), result("b", 1000, 100)])
+        baseline = load_baseline(path)
+
+        comparisons = compare([result("a", 800, 100), result("b", 950, 2000),
+                               result("new", 1)], baseline, tolerance=0.1)
+
+        assert [(c.name, c.slower, c.more_allocations) for c in comparisons] == [
+            ("a", True, False), ("b", False, True)]
+        assert all(c.regressed for c in comparisons)
+        assert "SLOWER" in format_report([result("a", 800, 100)], comparisons)
+
+    def test_unknown_baseline_version_is_rejected(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"version": 99, "results": {}}))
+
+        with pytest.raises(ValueError):
+            load_baseline(str(path))
@@ -1,6 +1,7 @@
 import pytest
 from src.card_duel.board import Board
 from src.card_duel.card import RowAffinity, Card
+from src.card_duel.modifiers import horn, weather
 from src.card_duel.row import Row
 
 
@@ -126,3 +127,55 @@ class TestBoard:
             for row in board.rows_by_player[player_id].values():
                 assert row.is_empty()
                 assert len(row) == 0
+
+    def test_total_power_follows_direct_row_changes(self, board_two_players):
+        board = board_two_players
+        card = make_card(1, 4)
+
+        board.get_row(0, RowAffinity.RANGED).add_card(card)
+        assert board.get_total_power(0) == 4
+
+        board.get_row(0, RowAffinity.RANGED).remove_card(card)
+        assert board.get_total_power(0) == 0
+        assert board.power_by_player == {0: 0, 1: 0}
+
+    def test_debug_mode_cross_checks_cache(self):
+        board = Board([0], debug=True)
+        board.place_card(0, make_card(1, 4), RowAffinity.MELEE)
+
+        assert board.get_total_power(0) == 4
+
+        board.get_row(0, RowAffinity.MELEE).cards.append(make_card(2, 3))
+
+        with pytest.raises(RuntimeError):
+            board.get_total_power(0)
+
+    def test_modifier_marks_player_total_for_lazy_recompute(self, board_two_players):
+        board = board_two_players
+        board.place_card(0, make_card(1, 6), RowAffinity.MELEE)
+        board.place_card(0, make_card(2, 5, RowAffinity.SIEGE), RowAffinity.SIEGE)
+        board.place_card(1, make_card(3, 7), RowAffinity.MELEE)
+
+        board.add_modifier(0, RowAffinity.MELEE, weather())
+        board.add_modifier(1, RowAffinity.MELEE, weather())
+        board.add_modifier(0, RowAffinity.SIEGE, horn())
+
+        assert board.get_total_power(0) == 1 + 10
+        assert board.get_total_power(1) == 1
+        board.place_card(0, make_card(4, 9), RowAffinity.MELEE)
+        assert board.get_total_power(0) == 2 + 10
+
+        board.remove_modifier(0, RowAffinity.MELEE, weather())
+        assert board.get_total_power(0) == 15 + 10
+        assert "modifiers" in board.serialize()
+
+    def test_clear_removes_modifiers(self, board_two_players):
+        board = board_two_players
+        board.add_modifier(0, RowAffinity.RANGED, weather())
+        board.place_card(0, make_card(1, 6, RowAffinity.RANGED), RowAffinity.RANGED)
+
+        board.clear()
+        board.place_card(0, make_card(2, 6, RowAffinity.RANGED), RowAffinity.RANGED)
+
+        assert board.get_total_power(0) == 6
+        assert "modifiers" not in board.serialize()
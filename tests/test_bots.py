@@ -0,0 +1,84 @@
+import pytest
+
+from src.card_duel.bots import RandomBot, GreedyBot, row_for_card
+from src.card_duel.board import Board
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.deck import Deck
+from src.card_duel.game import Game
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+
+
+def make_card(card_id: int,
+              power: int,
+              affinity: RowAffinity = RowAffinity.MELEE) -> Card:
+    """Prosta karta o zadanej sile i rzędzie."""
+    return Card(card_id, f"Card {card_id}", power, affinity, tags=[])
+
+
+@pytest.fixture
+def game_with_hands() -> Game:
+    cards_1 = [make_card(1, 3), make_card(2, 9, RowAffinity.SIEGE), make_card(3, 5)]
+    cards_2 = [make_card(11, 4), make_card(12, 6, RowAffinity.RANGED)]
+    player1 = Player(1, Deck("Deck 1", cards_1))
+    player2 = Player(2, Deck("Deck 2", cards_2))
+    player1.draw_from_deck(3)
+    player2.draw_from_deck(2)
+
+    game = Game([player1, player2], Board([1, 2]), Rules(rounds_to_win=2))
+    game.start_round()
+    return game
+
+
+class TestBots:
+
+    def test_row_for_card_maps_any_to_melee(self):
+        assert row_for_card(make_card(1, 5, RowAffinity.ANY)) is RowAffinity.MELEE
+        assert row_for_card(make_card(2, 5, RowAffinity.SIEGE)) is RowAffinity.SIEGE
+        assert row_for_card(None) is RowAffinity.MELEE
+
+    def test_random_bot_is_reproducible_for_same_seed(self, game_with_hands):
+        game = game_with_hands
+        player = game.players[1]
+
+        picks_a = [RandomBot(seed=7).choose_card_index(game, player) for _ in range(5)]
+        picks_b = [RandomBot(seed=7).choose_card_index(game, player) for _ in range(5)]
+
+        assert picks_a == picks_b
+        assert all(0 <= idx < player.hand_size() for idx in picks_a)
+
+    def test_random_bot_passes_with_empty_hand(self, game_with_hands):
+        game = game_with_hands
+        player = game.players[1]
+        player.hand.clear()
+
+        bot = RandomBot(seed=1, pass_probability=0.0)
+
+        assert bot.choose_action(game, player) == "pass"
+        with pytest.raises(ValueError):
+            bot.choose_card_index(game, player)
+
+    def test_greedy_bot_plays_strongest_card_in_its_row(self, game_with_hands):
+        game = game_with_hands
+        player = game.players[1]
+        bot = GreedyBot()
+
+        card_index = bot.choose_card_index(game, player)
+
+        assert player.hand[card_index].base_power == 9
+        assert bot.choose_row_affinity(game, player) is RowAffinity.SIEGE
+
+    def test_greedy_bot_passes_when_leading_and_opponent_passed(self, game_with_hands):
+        game = game_with_hands
+        bot = GreedyBot()
+
+        game.play_card(1, 1, RowAffinity.SIEGE)
+        game.pass_turn(2)
+
+        assert bot.choose_action(game, game.players[1]) == "pass"
+
+    def test_greedy_bot_keeps_playing_when_behind(self, game_with_hands):
+        game = game_with_hands
+        bot = GreedyBot()
+
+        assert bot.choose_action(game, game.players[1]) == "play"
@@ -17,11 +17,11 @@ class TestCard:
         assert card.name == 'Warrior'
         assert card.base_power == 10
         assert card.row_affinity is RowAffinity.MELEE
-        assert card.tags == ['Stun', 'Stress']
+        assert card.tags == ('Stun', 'Stress')
 
     def test_card_default_tags(self):
         card = Card(1, "Warrior", 10, RowAffinity.MELEE, tags=None)
-        assert card.tags == []
+        assert card.tags == ()
 
     def test_card_eq_and_hash(self):
         card1 = Card(1, "Warrior", 10, RowAffinity.MELEE, tags=[])
@@ -41,7 +41,7 @@ class TestCard:
         assert data["name"] == card.name
         assert data["base_power"] == card.base_power
         assert data["row_affinity"] == card.row_affinity.name
-        assert data["tags"] == card.tags
+        assert data["tags"] == list(card.tags)
 
     def test_card_serialize_to_json(self, warrior_card):
         card = warrior_card
@@ -52,7 +52,7 @@ class TestCard:
         assert data["name"] == card.name
         assert data["base_power"] == card.base_power
         assert data["row_affinity"] == card.row_affinity.name
-        assert data["tags"] == card.tags
+        assert data["tags"] == list(card.tags)
 
     def test_display_repr_and_repr(self, warrior_card):
         card = warrior_card
@@ -66,3 +66,50 @@ class TestCard:
         assert "['Stun', 'Stress']" in text
 
         assert card.display_repr() == "Warrior (10) | Row: MELEE"
+
+    def test_card_is_immutable(self, warrior_card):
+        card = warrior_card
+
+        with pytest.raises(AttributeError):
+            card.base_power = 99
+        with pytest.raises(AttributeError):
+            card.extra = 1
+        with pytest.raises(AttributeError):
+            card.tags.append("Spy")
+        assert not hasattr(card, "__dict__")
+
+    def test_card_to_dict_from_dict_round_trip(self, warrior_card):
+        card = warrior_card
+
+        restored = Card.from_dict(card.to_dict())
+
+        assert restored == card
+        assert restored.same_definition(card)
+
+    def test_card_clone_shares_definition(self, warrior_card):
+        assert warrior_card.clone() is warrior_card
+
+    def test_card_pickle_round_trip(self, warrior_card):
+        import pickle
+
+        restored = pickle.loads(pickle.dumps(warrior_card))
+
+        assert restored.same_definition(warrior_card)
+
+    def test_validate_accepts_valid_card(self, warrior_card):
+        warrior_card.validate()
+        Card(2, "Horn", 0, RowAffinity.ANY, []).validate()
+
+    @pytest.mark.parametrize("args", [
+        (0, "Warrior", 10, RowAffinity.MELEE, []),
+        ("1", "Warrior", 10, RowAffinity.MELEE, []),
+        (1, " ", 10, RowAffinity.MELEE, []),
+        (1, "Warrior", -1, RowAffinity.MELEE, []),
+        (1, "Warrior", True, RowAffinity.MELEE, []),
+        (1, "Warrior", 10, "MELEE", []),
+        (1, "Warrior", 10, RowAffinity.MELEE, ["Stun", ""]),
+        (1, "Warrior", 10, RowAffinity.MELEE, ["Stun", "Stun"]),
+    ])
+    def test_validate_rejects_invalid_card(self, args):
+        with pytest.raises(ValueError):
+            Card(*args).validate()
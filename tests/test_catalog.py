@@ -0,0 +1,86 @@
+import pytest
+
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.catalog import CardCatalog
+from src.card_duel.static_decks import make_static_decks
+
+
+@pytest.fixture
+def catalog() -> CardCatalog:
+    catalog = CardCatalog()
+    catalog.define(1, "Warrior", 10, RowAffinity.MELEE, ["Stun"])
+    catalog.define(2, "Archer", 6, RowAffinity.RANGED)
+    return catalog
+
+
+class TestCardCatalog:
+
+    def test_define_and_get(self, catalog):
+        card = catalog.get(1)
+
+        assert card.name == "Warrior"
+        assert len(catalog) == 2
+        assert 2 in catalog
+        assert 3 not in catalog
+
+    def test_get_unknown_id_raises_value_error(self, catalog):
+        with pytest.raises(ValueError):
+            catalog.get(999)
+
+    def test_register_interns_identical_definition(self, catalog):
+        duplicate = Card(1, "Warrior", 10, RowAffinity.MELEE, ["Stun"])
+
+        assert catalog.register(duplicate) is catalog.get(1)
+
+    def test_register_rejects_conflicting_definition(self, catalog):
+        with pytest.raises(ValueError):
+            catalog.register(Card(1, "Warrior", 11, RowAffinity.MELEE, ["Stun"]))
+
+    def test_build_deck_shares_card_instances(self, catalog):
+        deck_a = catalog.build_deck("A", [1, 2, 1])
+        deck_b = catalog.build_deck("B", [2, 1])
+
+        assert len(deck_a) == 3
+        assert deck_a.cards[0] is deck_b.cards[1] is catalog.get(1)
+
+    def test_from_dict_returns_catalog_instance(self, catalog):
+        card = Card.from_dict(catalog.get(2).to_dict(), catalog)
+
+        assert card is catalog.get(2)
+
+    def test_catalog_serialize_round_trip(self, catalog):
+        restored = CardCatalog.from_dict(catalog.serialize())
+
+        assert len(restored) == len(catalog)
+        for card in catalog:
+            assert restored.get(card.id).same_definition(card)
+
+    def test_static_decks_share_catalog_cards(self):
+        first_1, first_2 = make_static_decks()
+        second_1, second_2 = make_static_decks()
+
+        assert len(first_1) == 25
+        assert len(first_2) == 25
+        assert first_1.cards is not second_1.cards
+        assert all(a is b for a, b in zip(first_1.cards, second_1.cards))
+
+    def test_define_deck_and_build_fresh_decks(self, catalog):
+        catalog.define_deck("Mixed", [1, 2, 2], meta={"faction": "North"})
+
+        first, second = catalog.deck("Mixed"), catalog.deck("Mixed")
+
+        assert [card.id for card in first.cards] == [1, 2, 2]
+        assert first.meta == {"faction": "North"}
+        assert first.cards is not second.cards
+        assert catalog.deck_names() == ["Mixed"]
+        restored = CardCatalog.from_dict(catalog.serialize())
+        assert [card.id for card in restored.deck("Mixed").cards] == [1, 2, 2]
+
+    def test_define_deck_rejects_unknown_cards_and_duplicates(self, catalog):
+        with pytest.raises(ValueError):
+            catalog.define_deck("Broken", [1, 99])
+        catalog.define_deck("Mixed", [1])
+        with pytest.raises(ValueError):
+            catalog.define_deck("Mixed", [2])
+        with pytest.raises(ValueError):
+            catalog.deck("Missing")
@@ -0,0 +1,116 @@
+import json
+import os
+
+import pytest
+
+from src.card_duel import catalog_loader
+from src.card_duel.card import RowAffinity
+from src.card_duel.catalog_loader import load_catalog
+from src.card_duel.static_decks import STATIC_CATALOG_FILES
+
+
+CARDS_CSV = """id,name,base_power,row_affinity,tags
+1,Warrior,10,MELEE,Stun;Stress
+2,Archer,6,ranged,
+3,Horn,0,ANY,Horn
+"""
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Pomocniczo: karty w CSV, talie w CSV i JSON (z dodatkową kartą)."""
+    cards = tmp_path / "cards.csv"
+    cards.write_text(CARDS_CSV, encoding="utf-8")
+    decks = tmp_path / "decks.csv"
+    decks.write_text("deck,card_id,count\nNorth,1,2\nNorth,2,\n", encoding="utf-8")
+    extra = tmp_path / "extra.json"
+    extra.write_text(json.dumps({
+        "cards": [{"id": 4, "name": "Spy", "base_power": 1,
+                   "row_affinity": "MELEE", "tags": ["Draw"]}],
+        "decks": [{"name": "Spies", "cards": [4, 4, 3], "meta": {"faction": "Nilfgaard"}}],
+    }), encoding="utf-8")
+    return [str(cards), str(decks), str(extra)]
+
+
+def write(path, text: str) -> str:
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+    return str(path)
+
+
+class TestCatalogLoader:
+
+    def test_loads_cards_and_decks_from_csv_and_json(self, sources):
+        catalog = load_catalog(sources)
+
+        assert len(catalog) == 4
+        assert catalog.get(1).tags == ("Stun", "Stress")
+        assert catalog.get(2).row_affinity is RowAffinity.RANGED
+        assert [card.id for card in catalog.deck("North").cards] == [1, 1, 2]
+        assert catalog.deck("Spies").meta == {"faction": "Nilfgaard"}
+        assert catalog.deck_names() == ["North", "Spies"]
+
+    @pytest.mark.parametrize("row", [
+        "5,Broken,-2,MELEE,",
+        "5,Broken,x,MELEE,",
+        "5,Broken,2,AIR,",
+        "1,Warrior,11,MELEE,Stun;Stress",
+    ])
+    def test_invalid_card_rows_are_rejected(self, tmp_path, row):
+        path = write(tmp_path / "cards.csv", CARDS_CSV + row + "\n")
+
+        with pytest.raises(ValueError):
+            load_catalog([path])
+
+    @pytest.mark.parametrize("count", ["0", "-1", "x", "1.5"])
+    def test_invalid_deck_counts_are_rejected(self, sources, tmp_path, count):
+        path = write(tmp_path / "decks.csv", f"deck,card_id,count\nNorth,1,{count}\n")
+
+        with pytest.raises(ValueError):
+            load_catalog([sources[0], path])
+
+    def test_unknown_file_or_layout_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            load_catalog([write(tmp_path / "cards.txt", CARDS_CSV)])
+        with pytest.raises(ValueError):
+            load_catalog([write(tmp_path / "cards.csv", "a,b\n1,2\n")])
+        with pytest.raises(ValueError):
+            load_catalog([write(tmp_path / "decks.json", '{"decks": [{"name": "X"}]}')])
+
+    def test_cache_is_reused_while_sources_are_unchanged(self, sources, tmp_path, monkeypatch):
+        cache = str(tmp_path / "catalog.bin")
+        built = load_catalog(sources, cache_path=cache)
+
+        def fail(path):
+            raise AssertionError("catalog files parsed despite valid cache")
+
+        monkeypatch.setattr(catalog_loader, "read_catalog_file", fail)
+        cached = load_catalog(sources, cache_path=cache)
+
+        assert [card.serialize() for card in cached] == [card.serialize() for card in built]
+        assert cached.serialize() == built.serialize()
+
+    def test_cache_is_rebuilt_after_source_change(self, sources, tmp_path):
+        cache = str(tmp_path / "catalog.bin")
+        load_catalog(sources, cache_path=cache)
+        write(sources[0], CARDS_CSV.replace("Archer,6", "Archer,7"))
+        stat = os.stat(sources[0])
+        os.utime(sources[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_catalog(sources, cache_path=cache).get(2).base_power == 7
+
+    def test_corrupted_cache_is_ignored(self, sources, tmp_path):
+        cache = tmp_path / "catalog.bin"
+        cache.write_bytes(b"CDCAT\x00garbage")
+
+        catalog = load_catalog(sources, cache_path=str(cache))
+
+        assert len(catalog) == 4
+        assert cache.read_bytes() != b"CDCAT\x00garbage"
+
+    def test_static_catalog_files(self):
+        catalog = load_catalog(STATIC_CATALOG_FILES)
+
+        assert len(catalog) == 50
+        assert catalog.deck_names() == ["Northern Alliance", "Skellige Raiders"]
+        assert catalog.get(8).name == "Radovid’s Enforcer"
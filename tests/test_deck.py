@@ -126,3 +126,44 @@ class TestDeck:
 
         with pytest.raises(ValueError):
             deck.peek(-3)
+
+    def test_deck_shuffle_is_reproducible_with_seed(self):
+        deck_a = Deck("Diabelskie Nasienie", make_cards(20), rng=42)
+        deck_b = Deck("Diabelskie Nasienie", make_cards(20), rng=42)
+
+        deck_a.shuffle()
+        deck_b.shuffle()
+
+        assert deck_a.cards == deck_b.cards
+        assert deck_a.cards != make_cards(20)
+
+    def test_deck_accepts_shared_random_instance(self):
+        import random
+
+        rng = random.Random(7)
+        deck = Deck("Diabelskie Nasienie", make_cards(3), rng=rng)
+
+        assert deck.rng is rng
+
+    def test_deck_shuffle_with_permutation(self):
+        cards = make_cards(4)
+        deck = Deck("Diabelskie Nasienie", cards)
+
+        deck.shuffle([3, 1, 0, 2])
+
+        assert deck.cards == [cards[3], cards[1], cards[0], cards[2]]
+
+    def test_deck_shuffle_with_wrong_permutation_size_raises(self):
+        deck = Deck("Diabelskie Nasienie", make_cards(4))
+
+        with pytest.raises(ValueError):
+            deck.shuffle([0, 1])
+
+    @pytest.mark.parametrize("permutation", [[0, 0, 1, 2], [0, 1, 2, 4], [-1, 0, 1, 2]])
+    def test_deck_shuffle_with_invalid_permutation_raises(self, permutation):
+        cards = make_cards(4)
+        deck = Deck("Diabelskie Nasienie", cards)
+
+        with pytest.raises(ValueError):
+            deck.shuffle(permutation)
+        assert deck.cards == cards
@@ -0,0 +1,125 @@
+import pytest
+
+from src.card_duel.actions import play_action
+from src.card_duel.board import Board
+from src.card_duel.bots import RandomBot
+from src.card_duel.card import RowAffinity
+from src.card_duel.catalog import CardCatalog
+from src.card_duel.controller import GameController
+from src.card_duel.deltas import (
+    NO_CARD,
+    DeltaPatcher,
+    OP_DRAW,
+    OP_MODIFIER,
+    OP_PLAY,
+    OP_SNAPSHOT,
+    OP_ROUND_END,
+    decode_deltas,
+    encode_deltas,
+)
+from src.card_duel.game import Game
+from src.card_duel.modifiers import BUFF
+from src.card_duel.headless.renderer_null import RendererNull
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+
+
+@pytest.fixture
+def catalog() -> CardCatalog:
+    catalog = CardCatalog()
+    affinities = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+    for card_id in range(1, 21):
+        catalog.define(card_id, f"Card {card_id}", card_id % 8 + 1,
+                       affinities[card_id % 3])
+    return catalog
+
+
+@pytest.fixture
+def game(catalog) -> Game:
+    player1 = Player(1, catalog.build_deck("A", [1, 2, 3, 4, 5, 6, 7, 8, 9, 10,
+                                                 11, 12, 13, 14, 1, 2]))
+    player2 = Player(2, catalog.build_deck("B", range(5, 21)))
+    return Game([player1, player2], Board([1, 2]), Rules(rounds_to_win=2))
+
+
+def full_state(game: Game) -> dict:
+    state = game.serialize()
+    state["decks"] = [[card.id for card in game.players[pid].deck.cards]
+                      for pid in game.player_order]
+    return state
+
+
+class TestDeltas:
+
+    def test_patcher_follows_full_match_step_by_step(self, game, catalog):
+        client = DeltaPatcher(Game.from_snapshot(game.to_snapshot(), catalog),
+                              catalog)
+        deltas = []
+
+        def sink(delta):
+            deltas.append(delta)
+            client.apply(delta)
+            # draw_many zdejmuje całą porcję z talii przed dodaniem do ręki,
+            # więc stan porównujemy na deltach innych niż dobranie
+            if delta[0] != OP_DRAW:
+                assert full_state(client.game) == full_state(game)
+
+        game.delta_sink = sink
+        GameController(game, RandomBot(seed=3), RendererNull()).run_match()
+
+        assert full_state(client.game) == full_state(game)
+        assert client.game.zobrist_hash() == game.zobrist_hash()
+        assert any(delta[0] == OP_PLAY for delta in deltas)
+        assert any(delta[0] == OP_ROUND_END for delta in deltas)
+
+    def test_binary_encoding_round_trip(self, game, catalog):
+        deltas = []
+        game.delta_sink = deltas.append
+        GameController(game, RandomBot(seed=4), RendererNull()).run_match()
+
+        data = encode_deltas(deltas)
+
+        assert decode_deltas(data) == deltas
+        # akcja to kilka bajtów, a nie cały stan gry
+        assert max(len(encode_deltas([delta])) for delta in deltas) <= 12
+
+    def test_undo_sends_full_resync(self, game, catalog):
+        game.start_match()
+        for player in game.players.values():
+            player.draw_from_deck(5)
+        game.start_round()
+        client = DeltaPatcher(Game.from_snapshot(game.to_snapshot(), catalog),
+                              catalog)
+        deltas = []
+        game.delta_sink = deltas.append
+
+        row = game.players[game.active_player_id].hand[0].row_affinity
+        token = game.apply(play_action(0, row))
+        game.undo(token)
+        client.apply_all(decode_deltas(encode_deltas(deltas)))
+
+        assert deltas[-1][0] == OP_SNAPSHOT
+        assert full_state(client.game) == full_state(game)
+
+    def test_decode_rejects_unknown_opcode_and_truncation(self):
+        with pytest.raises(ValueError):
+            decode_deltas(b"\xff")
+        with pytest.raises(ValueError):
+            decode_deltas(encode_deltas([(OP_PLAY, 1, 0, 5, 1)])[:-2])
+
+    def test_modifier_amount_round_trips_as_int32(self):
+        delta = (OP_MODIFIER, 1, RowAffinity.MELEE.value, NO_CARD, BUFF, 100_000, 1)
+
+        assert decode_deltas(encode_deltas([delta])) == [delta]
+        with pytest.raises(ValueError):
+            encode_deltas([delta[:5] + (2 ** 31, 1)])
+
+    def test_patcher_detects_out_of_sync_play(self, game, catalog):
+        game.start_match()
+        game.players[1].draw_from_deck(3)
+        game.start_round()
+        client = DeltaPatcher(Game.from_snapshot(game.to_snapshot(), catalog),
+                              catalog)
+
+        with pytest.raises(ValueError):
+            client.apply((OP_PLAY, 1, 0, 999, RowAffinity.MELEE.value))
@@ -0,0 +1,303 @@
+import pytest
+
+from src.card_duel.actions import PASS_ACTION, play_action
+from src.card_duel.board import Board
+from src.card_duel.card import RowAffinity
+from src.card_duel.catalog import CardCatalog
+from src.card_duel.deltas import DeltaPatcher, OP_REMOVE
+from src.card_duel.effects import (
+    ON_ROUND_END,
+    ON_ROW_CHANGE,
+    Effect,
+    EffectBus,
+    EffectRegistry,
+    default_effects,
+)
+from src.card_duel.event_log import MatchLogWriter, replay_log
+from src.card_duel.game import Game
+from src.card_duel.modifiers import horn, weather
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+
+
+@pytest.fixture
+def catalog() -> CardCatalog:
+    catalog = CardCatalog()
+    for card_id in range(1, 11):
+        catalog.define(card_id, f"Soldier {card_id}", card_id, RowAffinity.MELEE)
+    catalog.define(20, "Spy", 1, RowAffinity.MELEE, ["Draw"])
+    catalog.define(21, "Villentretenmerth", 2, RowAffinity.MELEE, ["Scorch"])
+    catalog.define(22, "Reserve", 3, RowAffinity.RANGED, ["Reinforce"])
+    catalog.define(23, "Avenger", 4, RowAffinity.MELEE, ["Vengeance"])
+    catalog.define(24, "Biting Frost", 0, RowAffinity.ANY, ["Frost"])
+    catalog.define(25, "Commander's Horn", 0, RowAffinity.ANY, ["Horn"])
+    return catalog
+
+
+def make_game(catalog: CardCatalog, hand1, hand2, deck=range(1, 11)) -> Game:
+    """Pomocniczo: gra z zadanymi rękami (karty wg id), talie z deck."""
+    players = [Player(1, catalog.build_deck("A", deck)),
+               Player(2, catalog.build_deck("B", deck))]
+    game = Game(players, Board([1, 2]), Rules(rounds_to_win=2))
+    game.start_match()
+    players[0].hand = [catalog.get(card_id) for card_id in hand1]
+    players[1].hand = [catalog.get(card_id) for card_id in hand2]
+    game.rehash()
+    game.start_round()
+    return game
+
+
+def full_state(game: Game) -> dict:
+    state = game.serialize()
+    state["decks"] = [[card.id for card in game.players[pid].deck.cards]
+                      for pid in game.player_order]
+    return state
+
+
+class CountingEffect(Effect):
+    """Pomocniczo: zapisuje, które karty dostały zdarzenie."""
+
+    events = (ON_ROUND_END, ON_ROW_CHANGE)
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def on_round_end(self, bus, card, owner_id, row, winner_id):
+        self.calls.append((ON_ROUND_END, owner_id, row, card.id))
+
+    def on_row_change(self, bus, card, owner_id, row, changed, delta):
+        self.calls.append((ON_ROW_CHANGE, owner_id, row, changed.id, delta))
+
+
+class TestEffectBus:
+
+    def test_card_without_bus_has_no_effect(self, catalog):
+        game = make_game(catalog, [20], [1])
+
+        game.play_card(1, 0, RowAffinity.MELEE)
+
+        assert game.players[1].hand_size() == 0
+
+    def test_draw_effect_on_play(self, catalog):
+        game = make_game(catalog, [20], [1])
+        EffectBus(game, default_effects())
+
+        game.play_card(1, 0, RowAffinity.MELEE)
+
+        assert [card.id for card in game.players[1].hand] == [10]
+
+    def test_scorch_destroys_strongest_opponent_cards_in_row(self, catalog):
+        game = make_game(catalog, [21, 3, 2, 1], [5, 9, 9])
+        EffectBus(game, default_effects())
+        deltas = []
+        game.delta_sink = deltas.append
+        for index in (2, 1, 0):
+            game.play_card(1, index + 1, RowAffinity.MELEE)
+            game.play_card(2, index, RowAffinity.MELEE)
+
+        game.play_card(1, 0, RowAffinity.MELEE)
+
+        row = game.board.get_row(2, RowAffinity.MELEE)
+        assert [card.id for card in row.cards] == [5]
+        assert game.board.get_total_power(2) == 5
+        assert game.board.get_total_power(1) == 8
+        assert [d for d in deltas if d[0] == OP_REMOVE] == [
+            (OP_REMOVE, 2, RowAffinity.MELEE.value, 9)] * 2
+
+    def test_events_reach_only_subscribed_cards(self, catalog):
+        counting = CountingEffect()
+        registry = EffectRegistry()
+        registry.register("Watch", counting)
+        catalog.define(30, "Watcher", 1, RowAffinity.SIEGE, ["Watch"])
+        catalog.define(31, "Catapult", 1, RowAffinity.SIEGE)
+        game = make_game(catalog, [30, 31], [31, 3])
+        bus = EffectBus(game, registry)
+
+        game.play_card(1, 0, RowAffinity.SIEGE)
+        game.play_card(2, 0, RowAffinity.SIEGE)
+        game.play_card(1, 0, RowAffinity.SIEGE)
+        game.play_card(2, 0, RowAffinity.MELEE)
+        assert counting.calls == [(ON_ROW_CHANGE, 1, RowAffinity.SIEGE, 31, 1)]
+        assert bus.tagged("Watch") == [(1, RowAffinity.SIEGE, catalog.get(30))]
+        assert bus.tagged("Watch", player_id=2) == []
+
+        game.pass_turn(1)
+        game.pass_turn(2)
+
+        assert counting.calls[-1] == (ON_ROUND_END, 1, RowAffinity.SIEGE, 30)
+        game.start_round()
+        # czyszczenie planszy wypisuje kartę, ale nie wywołuje zdarzeń
+        assert len(counting.calls) == 2
+        assert list(bus.subscribers(ON_ROUND_END)) == []
+
+    def test_reinforce_draws_for_round_loser(self, catalog):
+        game = make_game(catalog, [22], [9])
+        EffectBus(game, default_effects())
+        game.play_card(1, 0, RowAffinity.RANGED)
+        game.play_card(2, 0, RowAffinity.MELEE)
+        game.pass_turn(1)
+
+        game.pass_turn(2)
+
+        assert game.last_round_winner_id == 2
+        assert [card.id for card in game.players[1].hand] == [10]
+
+    def test_scorch_triggers_vengeance_of_destroyed_neighbour(self, catalog):
+        game = make_game(catalog, [21, 2, 1], [9, 23])
+        EffectBus(game, default_effects())
+        game.play_card(1, 2, RowAffinity.MELEE)
+        game.play_card(2, 1, RowAffinity.MELEE)
+        game.play_card(1, 1, RowAffinity.MELEE)
+        game.play_card(2, 0, RowAffinity.MELEE)
+
+        game.play_card(1, 0, RowAffinity.MELEE)
+
+        assert [card.id for card in game.board.get_row(2, RowAffinity.MELEE).cards] == [23]
+        assert [card.id for card in game.players[2].hand] == [10]
+
+    def test_undo_reverts_effect_side_effects(self, catalog):
+        game = make_game(catalog, [21, 20, 22], [9, 9, 23])
+        EffectBus(game, default_effects())
+        game.play_card(1, 2, RowAffinity.RANGED)
+        game.play_card(2, 2, RowAffinity.MELEE)
+        game.play_card(1, 1, RowAffinity.MELEE)
+        game.play_card(2, 0, RowAffinity.MELEE)
+        before = full_state(game)
+        hash_before = game.zobrist_hash()
+
+        tokens = [game.apply(play_action(0, RowAffinity.MELEE))]
+        assert full_state(game) != before
+        tokens.append(game.apply(PASS_ACTION))
+        tokens.append(game.apply(PASS_ACTION))
+        assert not game.is_round_active
+        while tokens:
+            game.undo(tokens.pop())
+
+        assert full_state(game) == before
+        assert game.zobrist_hash() == hash_before
+        assert list(game.effects.subscribers(ON_ROW_CHANGE)) == [
+            (2, RowAffinity.MELEE, catalog.get(23), game.effects.registry.get("Vengeance"))]
+
+    def test_commit_drops_effect_journal(self, catalog):
+        game = make_game(catalog, [20, 21], [9, 23])
+        bus = EffectBus(game, default_effects())
+
+        # szpieg dobiera kartę – skutek trafia do dziennika
+        token = game.apply(play_action(0, RowAffinity.MELEE))
+        assert bus._journal
+        game.commit(token)
+        game.commit(game.apply(play_action(0, RowAffinity.MELEE)))
+
+        assert bus._marks == [] and bus._journal == []
+        token = game.apply(play_action(0, RowAffinity.MELEE))
+        assert len(bus._marks) == 1
+        game.undo(token)
+        assert bus._marks == [] and bus._journal == []
+
+    def test_effect_results_are_replayed_from_log(self, catalog, tmp_path):
+        path = str(tmp_path / "effects.log")
+        game = make_game(catalog, [21, 20, 22], [9, 23, 9])
+        EffectBus(game, default_effects())
+        with MatchLogWriter(path) as log:
+            log.begin_match(game)
+            for action in ((1, 2, RowAffinity.RANGED), (2, 1, RowAffinity.MELEE),
+                           (1, 1, RowAffinity.MELEE), (2, 0, RowAffinity.MELEE),
+                           (1, 0, RowAffinity.MELEE)):
+                game.play_card(*action)
+            game.pass_turn(2)
+            game.pass_turn(1)
+            log.end_match()
+
+        (replayed,) = replay_log(path, catalog)
+
+        assert replayed.effects is None
+        assert full_state(replayed) == full_state(game)
+
+    def test_weather_and_horn_change_effective_power(self, catalog):
+        game = make_game(catalog, [24, 25, 8], [9, 7])
+        EffectBus(game, default_effects())
+        game.play_card(1, 2, RowAffinity.MELEE)
+        game.play_card(2, 1, RowAffinity.MELEE)
+        game.play_card(1, 1, RowAffinity.MELEE)
+        assert game.board.get_total_power(1) == 16
+
+        game.play_card(2, 0, RowAffinity.MELEE)
+        hash_before = game.zobrist_hash()
+        token = game.apply(play_action(0, RowAffinity.SIEGE))
+
+        assert game.board.get_total_power(1) == 2
+        assert game.board.get_total_power(2) == 2
+        assert game.zobrist_hash() != hash_before
+        game.undo(token)
+        assert game.board.get_total_power(2) == 16
+        assert not game.board.get_row(2, RowAffinity.MELEE).has_modifiers()
+        assert game.zobrist_hash() == hash_before
+
+    def test_undo_with_duplicate_modifiers_restores_snapshot(self, catalog):
+        game = make_game(catalog, [25, 24, 25, 8], [9, 9, 9, 9])
+        EffectBus(game, default_effects())
+        hand = game.players[1].hand
+        for card_id in (25, 24):
+            game.play_card(1, [card.id for card in hand].index(card_id), RowAffinity.MELEE)
+            game.play_card(2, 0, RowAffinity.MELEE)
+        row = game.board.get_row(1, RowAffinity.MELEE)
+        snapshot = game.to_snapshot()
+
+        horn_index = [card.id for card in hand].index(25)
+        token = game.apply(play_action(horn_index, RowAffinity.MELEE))
+        assert row.modifiers == [horn(), weather(), horn()]
+        game.undo(token)
+
+        assert row.modifiers == [horn(), weather()]
+        assert game.to_snapshot() == snapshot
+
+    def test_modifier_deltas_are_replayed_and_patched(self, catalog, tmp_path):
+        path = str(tmp_path / "weather.log")
+        catalog.define(26, "Trebuchet", 7, RowAffinity.SIEGE)
+        game = make_game(catalog, [24, 25, 8], [9, 26, 6])
+        EffectBus(game, default_effects())
+        start = game.to_snapshot()
+        deltas = []
+        with MatchLogWriter(path) as log:
+            log.begin_match(game)
+            sink = game.delta_sink
+            game.delta_sink = lambda delta: (deltas.append(delta), sink(delta))
+            for action in ((1, 2, RowAffinity.MELEE), (2, 2, RowAffinity.MELEE),
+                           (1, 1, RowAffinity.MELEE), (2, 1, RowAffinity.SIEGE),
+                           (1, 0, RowAffinity.SIEGE)):
+                game.play_card(*action)
+            game.pass_turn(2)
+            game.pass_turn(1)
+            game.start_round()
+            log.end_match()
+        patcher = DeltaPatcher(Game.from_snapshot(start, catalog), catalog)
+        patcher.apply_all(deltas)
+
+        (replayed,) = replay_log(path, catalog)
+
+        assert full_state(replayed) == full_state(game)
+        assert full_state(patcher.game) == full_state(game)
+        assert game.last_round_winner_id == 2
+
+    def test_patcher_applies_remove_delta(self, catalog):
+        game = make_game(catalog, [1], [9, 5])
+        game.play_card(1, 0, RowAffinity.MELEE)
+        game.play_card(2, 0, RowAffinity.MELEE)
+        patcher = DeltaPatcher(game, catalog)
+
+        patcher.apply((OP_REMOVE, 2, RowAffinity.MELEE.value, 9))
+
+        assert game.board.get_total_power(2) == 0
+        with pytest.raises(ValueError):
+            patcher.apply((OP_REMOVE, 2, RowAffinity.MELEE.value, 9))
+
+    def test_registry_rejects_duplicate_tag_and_unknown_event(self):
+        registry = default_effects()
+
+        class Broken(Effect):
+            events = ("on_draw",)
+
+        with pytest.raises(ValueError):
+            registry.register("Draw", Effect())
+        with pytest.raises(ValueError):
+            registry.register("Broken", Broken())
@@ -0,0 +1,154 @@
+import pytest
+
+from src.card_duel.actions import PASS_ACTION
+from src.card_duel.board import Board
+from src.card_duel.bots import GreedyBot, RandomBot
+from src.card_duel.card import RowAffinity
+from src.card_duel.catalog import CardCatalog
+from src.card_duel.controller import GameController
+from src.card_duel.deltas import OP_PLAY, OP_SNAPSHOT
+from src.card_duel.event_log import MatchLogWriter, MatchReplayer, replay_log
+from src.card_duel.game import Game
+from src.card_duel.headless.renderer_null import RendererNull
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+
+
+@pytest.fixture
+def catalog() -> CardCatalog:
+    catalog = CardCatalog()
+    affinities = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+    for card_id in range(1, 21):
+        catalog.define(card_id, f"Card {card_id}", card_id % 8 + 1,
+                       affinities[card_id % 3])
+    return catalog
+
+
+def make_game(catalog: CardCatalog, seed: int) -> Game:
+    """Pomocniczo: mecz z potasowanymi taliami (różny układ dla seeda)."""
+    deck1 = catalog.build_deck("A", range(1, 17))
+    deck2 = catalog.build_deck("B", range(5, 21))
+    deck1.rng.seed(seed)
+    deck2.rng.seed(seed + 1)
+    deck1.shuffle()
+    deck2.shuffle()
+    players = [Player(1, deck1), Player(2, deck2)]
+    return Game(players, Board([1, 2]), Rules(rounds_to_win=2))
+
+
+def full_state(game: Game) -> dict:
+    state = game.serialize()
+    state["decks"] = [[card.id for card in game.players[pid].deck.cards]
+                      for pid in game.player_order]
+    state["last_round_winner_id"] = game.last_round_winner_id
+    return state
+
+
+class TestEventLog:
+
+    def test_replay_reproduces_logged_matches(self, catalog, tmp_path):
+        path = tmp_path / "matches.log"
+        played = []
+        with MatchLogWriter(str(path), buffer_size=256) as log:
+            for seed in range(5):
+                game = make_game(catalog, seed)
+                bot = GreedyBot(seed) if seed % 2 else RandomBot(seed)
+                GameController(game, bot, RendererNull(), event_log=log).run_match()
+                played.append(full_state(game))
+            assert log.matches_written == 5
+
+        replayed = [full_state(game) for game in replay_log(str(path), catalog)]
+
+        assert replayed == played
+
+    def test_writer_appends_to_existing_log(self, catalog, tmp_path):
+        path = str(tmp_path / "matches.log")
+        for seed in range(2):
+            with MatchLogWriter(path) as log:
+                game = make_game(catalog, seed)
+                GameController(game, RandomBot(seed), RendererNull(),
+                               event_log=log).run_match()
+
+        assert len(list(replay_log(path, catalog))) == 2
+
+    def test_unfinished_match_is_skipped(self, catalog, tmp_path):
+        path = str(tmp_path / "matches.log")
+        with MatchLogWriter(path) as log:
+            game = make_game(catalog, 0)
+            GameController(game, RandomBot(0), RendererNull(),
+                           event_log=log).run_match()
+
+            game = make_game(catalog, 1)
+            log.begin_match(game)
+            game.start_match()
+            game.players[1].draw_from_deck(3)
+
+        assert len(list(replay_log(path, catalog))) == 1
+        assert game.delta_sink is None
+
+    def test_truncated_tail_keeps_finished_matches(self, catalog, tmp_path):
+        path = tmp_path / "matches.log"
+        with MatchLogWriter(str(path)) as log:
+            for seed in range(2):
+                game = make_game(catalog, seed)
+                GameController(game, RandomBot(seed), RendererNull(),
+                               event_log=log).run_match()
+            log.flush()
+            finished = path.stat().st_size
+            game = make_game(catalog, 2)
+            log.begin_match(game)
+            game.start_match()
+        data = path.read_bytes()
+
+        # awaria w połowie rekordu (snapshot trzeciego meczu)
+        path.write_bytes(data[:finished + 3])
+        assert len(list(replay_log(str(path), catalog))) == 2
+        # uszkodzenie w środku pliku nadal jest błędem
+        path.write_bytes(data[:finished] + b"\xff" + data[finished + 1:])
+        with pytest.raises(ValueError):
+            list(replay_log(str(path), catalog))
+
+    def test_undo_resync_is_replayed(self, catalog, tmp_path):
+        path = str(tmp_path / "matches.log")
+        game = make_game(catalog, 0)
+        with MatchLogWriter(path) as log:
+            log.begin_match(game)
+            game.start_match()
+            for player in game.players.values():
+                player.draw_from_deck(5)
+            game.start_round()
+            game.play_card(1, 0, game.players[1].hand[0].row_affinity)
+            token = game.apply(PASS_ACTION)
+            game.undo(token)
+            game.play_card(2, 1, game.players[2].hand[1].row_affinity)
+            log.end_match()
+
+        (replayed,) = replay_log(path, catalog)
+        assert full_state(replayed) == full_state(game)
+
+    def test_verify_detects_tampered_log(self, catalog):
+        game = make_game(catalog, 0)
+        replayer = MatchReplayer(catalog)
+        replayer.apply((OP_SNAPSHOT, game.to_snapshot()))
+        replayer.game.start_match()
+        replayer.game.players[1].draw_from_deck(3)
+        replayer.game.start_round()
+        wrong_id = 999
+
+        with pytest.raises(ValueError):
+            replayer.apply((OP_PLAY, 1, 0, wrong_id, RowAffinity.MELEE.value))
+
+    def test_rejects_foreign_file(self, catalog, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a log at all")
+
+        with pytest.raises(ValueError):
+            list(replay_log(str(path), catalog))
+        with pytest.raises(ValueError):
+            MatchLogWriter(str(path))
+
+    def test_begin_match_twice_raises(self, catalog, tmp_path):
+        with MatchLogWriter(str(tmp_path / "matches.log")) as log:
+            log.begin_match(make_game(catalog, 0))
+            with pytest.raises(ValueError):
+                log.begin_match(make_game(catalog, 1))
@@ -0,0 +1,53 @@
+import io
+import subprocess
+import sys
+
+import pytest
+
+from src.card_duel.bots import RandomBot
+from src.card_duel.frontends import create_frontend, frontend_names, register_frontend
+
+
+class TestFrontends:
+
+    def test_builtin_frontends_are_registered(self):
+        assert frontend_names() == ["cli", "null", "pygame"]
+
+    def test_cli_frontend_passes_options_to_renderer(self):
+        stream = io.StringIO()
+
+        input_handler, renderer = create_frontend("cli", mode="quiet", stream=stream)
+
+        assert type(input_handler).__name__ == "InputHandlerCLI"
+        assert renderer.mode == "quiet"
+        assert renderer.stream is stream
+
+    def test_null_frontend_uses_given_input_handler(self):
+        bot = RandomBot(0)
+
+        input_handler, renderer = create_frontend("null", input_handler=bot)
+
+        assert input_handler is bot
+        assert type(renderer).__name__ == "RendererNull"
+        with pytest.raises(ValueError):
+            create_frontend("null")
+
+    def test_unknown_and_duplicate_frontends_are_rejected(self):
+        with pytest.raises(ValueError):
+            create_frontend("curses")
+        with pytest.raises(ValueError):
+            register_frontend("cli", lambda: (None, None))
+
+    def test_headless_modules_do_not_import_ui_backends(self):
+        # świeży interpreter – w procesie testów moduły mogą być już załadowane
+        code = ("import sys\n"
+                "import src.card_duel.simulation, src.card_duel.frontends\n"
+                "import src.card_duel.server.match_server\n"
+                "loaded = [name for name in sys.modules if name == 'pygame'\n"
+                "          or name.startswith(('src.card_duel.cli', 'src.card_duel.pygame_ui'))]\n"
+                "print(','.join(loaded))\n")
+
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                                text=True, check=True).stdout
+
+        assert output.strip() == ""
@@ -6,6 +6,7 @@ from src.card_duel.player import Player
 from src.card_duel.board import Board
 from src.card_duel.rules import Rules
 from src.card_duel.game import Game
+from src.card_duel.actions import play_action, PASS_ACTION
 
 
 # --- HELPERY -----------------------------------------------------------------
@@ -57,7 +58,7 @@ def test_game_init_requires_at_least_one_player(board=None, rules=None) -> None:
         Game(players=[], board=board, rules=rules)
 
 
-def test_game_init_requires_exactly_two_players() -> None:
+def test_game_init_requires_at_least_two_players() -> None:
     board = Board(player_ids=[1])
     rules = Rules(rounds_to_win=2)
 
@@ -196,6 +197,27 @@ def test_player_cannot_play_after_passing(game_two_players: Game) -> None:
         game.play_card(player_id, card_index=0, row_affinity=RowAffinity.MELEE)
 
 
+def test_card_can_only_be_played_to_its_row(game_two_players: Game) -> None:
+    game = game_two_players
+    game.start_round()
+    player_id = game.get_active_player_id()
+    player = game.players[player_id]
+    player.hand = [make_card(1), make_card(2, affinity=RowAffinity.ANY)]
+    game.rehash()
+    before = game.serialize()
+
+    with pytest.raises(ValueError):
+        game.play_card(player_id, card_index=0, row_affinity=RowAffinity.SIEGE)
+    with pytest.raises(ValueError):
+        game.apply(play_action(0, RowAffinity.RANGED))
+    assert game.serialize() == before
+
+    # karta ANY – do każdego rzędu, tak jak w legal_actions
+    assert play_action(1, RowAffinity.SIEGE) in game.legal_actions(player_id)
+    game.play_card(player_id, card_index=1, row_affinity=RowAffinity.SIEGE)
+    assert game.board.get_total_power(player_id) == 5
+
+
 def test_pass_turn_marks_player_passed_and_switches_active_player(game_two_players: Game, monkeypatch) -> None:
     game = game_two_players
     game.start_round()
@@ -275,3 +297,307 @@ def test_is_match_over_and_get_match_winner_id_use_rules(game_two_players: Game)
 
     assert game.is_match_over() is True
     assert game.get_match_winner_id() == winner_id
+
+
+# --- APPLY / UNDO ------------------------------------------------------------
+
+
+def test_apply_play_and_undo_restores_state(game_two_players: Game) -> None:
+    game = game_two_players
+    game.start_round()
+    before = game.serialize()
+    hand_before = list(game.players[game.active_player_id].hand)
+
+    token = game.apply(play_action(1, RowAffinity.MELEE))
+    assert game.serialize() != before
+
+    game.undo(token)
+
+    assert game.serialize() == before
+    assert game.players[game.active_player_id].hand == hand_before
+    assert game.board.get_total_power(game.active_player_id) == 0
+
+
+def test_apply_pass_and_undo_restores_round_end(game_two_players: Game) -> None:
+    game = game_two_players
+    game.start_round()
+    first_id = game.active_player_id
+
+    tokens = [game.apply(play_action(0, RowAffinity.MELEE)),
+              game.apply(PASS_ACTION)]
+    before = game.serialize()
+    tokens.append(game.apply(PASS_ACTION))
+
+    # oba pasy kończą rundę – gracz z kartą na planszy wygrywa
+    assert game.is_round_active is False
+    assert game.players[first_id].rounds_won == 1
+
+    game.undo(tokens.pop())
+    assert game.serialize() == before
+    assert game.players[first_id].rounds_won == 0
+
+    while tokens:
+        game.undo(tokens.pop())
+    assert game.board.get_total_power(first_id) == 0
+    assert game.active_player_id == first_id
+
+
+def test_undo_restores_hand_order_with_duplicate_ids(game_two_players: Game) -> None:
+    game = game_two_players
+    game.start_round()
+    player = game.players[game.active_player_id]
+    player.hand = [make_card(7), make_card(8), make_card(7)]
+    game.rehash()
+    hand_before = list(player.hand)
+
+    token = game.apply(play_action(2, RowAffinity.MELEE))
+    game.undo(token)
+
+    assert [id(card) for card in player.hand] == [id(card) for card in hand_before]
+
+
+def test_apply_invalid_action_raises(game_two_players: Game) -> None:
+    game = game_two_players
+
+    with pytest.raises(ValueError):
+        game.apply(PASS_ACTION)
+
+    game.start_round()
+    with pytest.raises(ValueError):
+        game.apply(play_action(99, RowAffinity.MELEE))
+
+
+# --- ZOBRIST -----------------------------------------------------------------
+
+
+def test_zobrist_hash_is_incremental_and_undo_safe(game_two_players: Game) -> None:
+    game = game_two_players
+    game.start_round()
+    start_hash = game.zobrist_hash()
+
+    token = game.apply(play_action(0, RowAffinity.MELEE))
+    played_hash = game.zobrist_hash()
+    game.rehash()
+
+    assert played_hash != start_hash
+    assert game.zobrist_hash() == played_hash
+
+    game.undo(token)
+    assert game.zobrist_hash() == start_hash
+
+
+def test_zobrist_hash_covers_flags(game_two_players: Game) -> None:
+    game = game_two_players
+    game.start_round()
+    start_hash = game.zobrist_hash()
+
+    game.pass_turn(game.active_player_id)
+    assert game.zobrist_hash() != start_hash
+
+    game.players[1].rounds_won = 1
+    hash_after_win = game.zobrist_hash()
+    game.players[1].rounds_won = 0
+    assert hash_after_win != game.zobrist_hash()
+
+
+def test_zobrist_flags_are_incremental(game_two_players: Game) -> None:
+    game = game_two_players
+    game.start_round()
+
+    def assert_matches_rehash() -> None:
+        value = game.zobrist_hash()
+        game.rehash()
+        assert game.zobrist_hash() == value
+
+    token = game.apply(PASS_ACTION)
+    assert_matches_rehash()
+    game.players[2].rounds_won = 2
+    game.is_round_active = False
+    assert_matches_rehash()
+    game.players[2].rounds_won = 0
+    game.is_round_active = True
+    game.undo(token)
+    assert_matches_rehash()
+    game.start_round()
+    assert_matches_rehash()
+
+
+def test_zobrist_hash_ignores_hand_order_but_not_duplicates(game_two_players: Game) -> None:
+    game = game_two_players
+    player = game.players[1]
+    player.hand = [make_card(1), make_card(2)]
+    game.rehash()
+    first = game.zobrist_hash()
+
+    player.hand = [make_card(2), make_card(1)]
+    game.rehash()
+    assert game.zobrist_hash() == first
+
+    player.hand = [make_card(2), make_card(1), make_card(1), make_card(1)]
+    game.rehash()
+    assert game.zobrist_hash() != first
+
+
+def test_same_position_hashes_equal_across_games() -> None:
+    games = []
+    for _ in range(2):
+        player1 = make_player(1)
+        player2 = make_player(2)
+        game = Game([player1, player2], Board([1, 2]), Rules(rounds_to_win=2))
+        game.start_round()
+        game.play_card(1, 0, RowAffinity.MELEE)
+        games.append(game)
+
+    assert games[0].zobrist_hash() == games[1].zobrist_hash()
+
+
+# --- LEGAL ACTIONS -----------------------------------------------------------
+
+
+def test_legal_actions_respect_turn_round_and_pass(game_two_players: Game) -> None:
+    game = game_two_players
+    assert game.legal_actions(1) == ()
+
+    game.start_round()
+    assert game.legal_actions(2) == ()
+    assert game.legal_actions(1)[0] == PASS_ACTION
+
+    game.players[1].has_passed = True
+    assert game.legal_actions(1) == (PASS_ACTION,)
+
+
+def test_legal_actions_follow_row_affinity(game_two_players: Game) -> None:
+    game = game_two_players
+    game.players[1].hand = [make_card(1, affinity=RowAffinity.SIEGE),
+                            make_card(2, affinity=RowAffinity.ANY)]
+    game.rehash()
+    game.start_round()
+
+    actions = game.legal_actions(1)
+
+    assert actions == (
+        PASS_ACTION,
+        play_action(0, RowAffinity.SIEGE),
+        play_action(1, RowAffinity.MELEE),
+        play_action(1, RowAffinity.RANGED),
+        play_action(1, RowAffinity.SIEGE),
+    )
+    for action in actions[1:]:
+        token = game.apply(action)
+        game.undo(token)
+
+
+def test_legal_actions_cache_is_invalidated_by_hand_changes(game_two_players: Game) -> None:
+    game = game_two_players
+    game.start_round()
+    first = game.legal_actions(1)
+    assert game.legal_actions(1) is first
+
+    token = game.apply(first[1])
+    game.undo(token)
+    assert game.legal_actions(1) == first
+
+    game.players[1].draw_from_deck(1)
+    assert len(game.legal_actions(1)) == len(first) + 1
+
+    game.play_card(1, 0, RowAffinity.MELEE)
+    game.pass_turn(2)
+    assert len(game.legal_actions(1)) == len(first)
+
+
+# --- WIELU GRACZY / DRUŻYNY --------------------------------------------------
+
+
+def make_table(n_players: int, teams=None) -> Game:
+    players = [make_player(pid) for pid in range(1, n_players + 1)]
+    board = Board(player_ids=[p.id for p in players])
+    return Game(players, board, Rules(rounds_to_win=2), teams=teams)
+
+
+def test_free_for_all_turn_ring_skips_passed_players() -> None:
+    game = make_table(4)
+    game.start_round()
+    assert game.get_active_player_id() == 1
+
+    game.play_card(1, 0, RowAffinity.MELEE)
+    assert game.get_active_player_id() == 2
+    game.pass_turn(2)
+    assert game.get_active_player_id() == 3
+    game.pass_turn(3)
+    game.play_card(4, 0, RowAffinity.MELEE)
+    # 2 i 3 spasowali – tura wraca do 1
+    assert game.get_active_player_id() == 1
+    assert game.next_player_id(1) == 4
+
+
+def test_two_player_turn_stays_when_opponent_passed(game_two_players: Game) -> None:
+    game = game_two_players
+    game.start_round()
+    game.pass_turn(1)
+
+    game.play_card(2, 0, RowAffinity.MELEE)
+
+    assert game.get_active_player_id() == 2
+
+
+def test_starting_player_rotates_through_seats() -> None:
+    game = make_table(3)
+    starters = []
+    for _ in range(4):
+        game.start_round()
+        starters.append(game.starting_player_id)
+
+    assert starters == [1, 2, 3, 1]
+
+
+def test_get_opponent_id_requires_single_opponent() -> None:
+    game = make_table(3)
+
+    assert game.get_opponent_ids(1) == (2, 3)
+    with pytest.raises(ValueError):
+        game.get_opponent_id(1)
+
+
+def test_undo_of_pass_restores_turn_ring() -> None:
+    game = make_table(3)
+    game.start_round()
+    game.play_card(1, 0, RowAffinity.MELEE)
+
+    token = game.apply(PASS_ACTION)
+    assert game.get_active_player_id() == 3
+    game.undo(token)
+
+    assert game.get_active_player_id() == 2
+    game.play_card(2, 0, RowAffinity.MELEE)
+    assert game.get_active_player_id() == 3
+    game.play_card(3, 0, RowAffinity.MELEE)
+    assert game.get_active_player_id() == 1
+
+
+def test_teams_win_rounds_and_match_together() -> None:
+    game = make_table(4, teams=[[1, 3], [2, 4]])
+    assert game.get_opponent_ids(1) == (2, 4)
+    assert game.get_team_ids(3) == (1, 3)
+
+    for _ in range(2):
+        game.start_round()
+        # gracz 1 zagrywa jedną kartę, pozostali tylko pasują
+        played = False
+        while game.is_round_active:
+            active_id = game.get_active_player_id()
+            if active_id == 1 and not played:
+                game.play_card(1, 0, RowAffinity.MELEE)
+                played = True
+            else:
+                game.pass_turn(active_id)
+
+    assert [game.players[pid].rounds_won for pid in (1, 2, 3, 4)] == [2, 0, 2, 0]
+    assert game.is_match_over() is True
+    assert game.get_match_winner_ids() == [1, 3]
+
+
+def test_teams_must_split_all_players() -> None:
+    with pytest.raises(ValueError):
+        make_table(4, teams=[[1, 2], [3]])
+    with pytest.raises(ValueError):
+        make_table(4, teams=[[1, 2, 3, 4]])
@@ -0,0 +1,154 @@
+import pickle
+import random
+
+import pytest
+
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.hand import Hand
+
+
+def make_card(card_id: int,
+              power: int = 5,
+              affinity: RowAffinity = RowAffinity.MELEE) -> Card:
+    """Prosta karta o zadanej sile i rzędzie."""
+    return Card(card_id, f"Card {card_id}", power, affinity, tags=[])
+
+
+def brute_strongest(cards, affinity=None):
+    """Pomocniczo: pierwszy indeks najsilniejszej karty (pełny skan)."""
+    best = None
+    for idx, card in enumerate(cards):
+        if affinity is not None and card.row_affinity is not affinity:
+            continue
+        if best is None or card.base_power > cards[best].base_power:
+            best = idx
+    return best
+
+
+def brute_weakest(cards, affinity=None):
+    best = None
+    for idx, card in enumerate(cards):
+        if affinity is not None and card.row_affinity is not affinity:
+            continue
+        if best is None or card.base_power < cards[best].base_power:
+            best = idx
+    return best
+
+
+class TestHand:
+
+    def test_remove_at_keeps_order_of_remaining_cards(self):
+        a, b, c, d = (make_card(i) for i in range(1, 5))
+        hand = Hand([a, b, c, d])
+
+        assert hand.remove_at(1) is b
+        assert hand == [a, c, d]
+        assert hand.remove_at(-1) is d
+        assert hand == [a, c]
+
+    def test_remove_at_takes_exact_duplicate(self):
+        first, second = make_card(7), make_card(7)
+        other = make_card(8)
+        hand = Hand([first, other, second])
+
+        assert hand.remove_at(2) is second
+        assert [id(card) for card in hand] == [id(first), id(other)]
+
+    def test_restore_at_reverts_remove_at(self):
+        cards = [make_card(i) for i in range(1, 6)]
+        hand = Hand(cards)
+
+        for index in range(len(cards)):
+            card = hand.remove_at(index)
+            hand.restore_at(index, card)
+            assert list(hand) == cards
+
+        with pytest.raises(IndexError):
+            hand.restore_at(10, cards[0])
+
+    def test_repeated_restores_in_one_gap_renumber_slots(self):
+        a, b = make_card(1, 2), make_card(2, 9)
+        hand = Hand([a, b])
+
+        for i in range(30):
+            hand.restore_at(1, make_card(100 + i, 5))
+
+        assert hand[0] is a and hand[-1] is b
+        assert [card.id for card in hand[1:-1]] == list(range(129, 99, -1))
+        assert hand.strongest() == len(hand) - 1
+        assert hand.weakest() == 0
+        assert hand.positions(RowAffinity.MELEE) == list(range(len(hand)))
+
+    def test_invalid_index_raises_index_error(self):
+        hand = Hand([make_card(1)])
+
+        with pytest.raises(IndexError):
+            hand.remove_at(3)
+
+    def test_strongest_and_weakest_by_affinity(self):
+        hand = Hand([make_card(1, 3, RowAffinity.MELEE),
+                     make_card(2, 9, RowAffinity.RANGED),
+                     make_card(3, 9, RowAffinity.SIEGE),
+                     make_card(4, 1, RowAffinity.RANGED)])
+
+        assert hand.strongest() == 1
+        assert hand.strongest(RowAffinity.SIEGE) == 2
+        assert hand.weakest() == 3
+        assert hand.weakest(RowAffinity.MELEE) == 0
+        assert hand.strongest(RowAffinity.ANY) is None
+        assert hand.positions(RowAffinity.RANGED) == [1, 3]
+        assert hand.count_affinity(RowAffinity.RANGED) == 2
+
+    def test_indexes_stay_consistent_under_random_operations(self):
+        rng = random.Random(0)
+        affinities = list(RowAffinity)
+        hand = Hand()
+        mirror = []
+        removed = []
+
+        for step in range(2000):
+            op = rng.random()
+            if op < 0.5 or not mirror:
+                card = make_card(step, rng.randint(1, 10), rng.choice(affinities))
+                hand.append(card)
+                mirror.append(card)
+            elif op < 0.8:
+                index = rng.randrange(len(mirror))
+                card = hand.remove_at(index)
+                mirror.pop(index)
+                removed.append((index, card))
+            else:
+                index, card = removed.pop() if removed else (len(mirror), make_card(-1))
+                if index > len(mirror):
+                    continue
+                hand.restore_at(index, card)
+                mirror.insert(index, card)
+
+            assert list(hand) == mirror
+            for affinity in [None] + affinities:
+                assert hand.strongest(affinity) == brute_strongest(mirror, affinity)
+                assert hand.weakest(affinity) == brute_weakest(mirror, affinity)
+            for affinity in affinities:
+                assert hand.count_affinity(affinity) == len(
+                    [c for c in mirror if c.row_affinity is affinity])
+
+    def test_hand_reads_like_a_list_but_blocks_other_mutations(self):
+        card = make_card(1)
+        hand = Hand([card])
+
+        assert hand == [card]
+        assert hand[0] is card and len(hand) == 1
+        with pytest.raises(TypeError):
+            hand.insert(0, card)
+        with pytest.raises(TypeError):
+            hand.remove(card)
+        with pytest.raises(TypeError):
+            hand[0] = card
+
+    def test_pickle_rebuilds_indexes(self):
+        hand = Hand([make_card(1, 2), make_card(2, 8, RowAffinity.SIEGE)])
+
+        restored = pickle.loads(pickle.dumps(hand))
+
+        assert restored == hand
+        assert restored.strongest() == 1
@@ -0,0 +1,228 @@
+import asyncio
+import json
+import sys
+
+import pytest
+
+from src.card_duel.bots import GreedyBot, RandomBot
+from src.card_duel.controller import GameController
+from src.card_duel.headless.renderer_null import RendererNull
+from src.card_duel.server.async_controller import AsyncBot, AsyncGameController, AsyncSeats
+from src.card_duel.server.match_server import MAX_INVALID_REPLIES, MatchServer, public_state
+from src.card_duel.timing import PhaseTimer
+
+
+async def send(writer: asyncio.StreamWriter, message: dict) -> None:
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+
+
+async def receive(reader: asyncio.StreamReader) -> dict:
+    return json.loads(await asyncio.wait_for(reader.readline(), 5))
+
+
+async def play_passing_client(reader, writer, join: dict) -> list:
+    """Pomocniczo: klient, który zawsze pasuje; zwraca odebrane wiadomości."""
+    await send(writer, join)
+    messages = []
+    while True:
+        message = await receive(reader)
+        messages.append(message)
+        if message["type"] == "turn":
+            await send(writer, {"type": "action", "turn": message["turn"], "action": "pass"})
+        if message["type"] == "result":
+            writer.close()
+            return messages
+
+
+class TestAsyncController:
+
+    def test_async_match_matches_sync_controller(self):
+        server = MatchServer(seed=5)
+        game_async = server.new_game()
+        game_sync = MatchServer(seed=5).new_game()
+
+        seats = AsyncSeats({1: AsyncBot(GreedyBot(1)), 2: AsyncBot(GreedyBot(1))})
+        asyncio.run(AsyncGameController(game_async, seats, RendererNull()).run_match_async())
+        GameController(game_sync, GreedyBot(1), RendererNull()).run_match()
+
+        assert game_async.serialize() == game_sync.serialize()
+
+    def test_async_controller_times_phases_like_sync_controller(self):
+        sync_timer, async_timer = PhaseTimer(), PhaseTimer()
+        seats = AsyncSeats({1: AsyncBot(GreedyBot(2)), 2: AsyncBot(GreedyBot(2))})
+
+        asyncio.run(AsyncGameController(MatchServer(seed=3).new_game(), seats, RendererNull(),
+                                        timer=async_timer).run_match_async())
+        GameController(MatchServer(seed=3).new_game(), GreedyBot(2), RendererNull(),
+                       timer=sync_timer).run_match()
+
+        def counts(timer):
+            return {phase: h.count for phase, h in timer.histograms.items()}
+
+        assert counts(async_timer) == counts(sync_timer)
+        assert counts(async_timer)["input.choose_action"] > 0
+
+
+class TestMatchServer:
+
+    def test_many_bot_matches_share_one_loop(self):
+        server = MatchServer(seed=1)
+
+        games = asyncio.run(server.play_bot_matches(500))
+
+        assert len(games) == 500
+        assert server.matches_played == 500
+        assert server.active_matches == 0
+        assert all(not game.is_round_active for game in games)
+
+    def test_tcp_client_plays_against_bot(self):
+        async def scenario():
+            server = MatchServer(bot_factory=RandomBot, seed=2)
+            listener = await server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            messages = await play_passing_client(reader, writer,
+                                                 {"type": "join", "opponent": "bot"})
+            await server.close()
+            return messages
+
+        messages = asyncio.run(scenario())
+
+        assert messages[0] == {"type": "start", "player_id": 1}
+        turn = next(m for m in messages if m["type"] == "turn")
+        opponent = next(p for p in turn["state"]["players"] if p["id"] == 2)
+        # ręka przeciwnika jest ukryta
+        assert "hand" not in opponent and opponent["hand_size"] == 10
+        assert messages[-1]["type"] == "result"
+        assert messages[-1]["winner_id"] == 2
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="requires Unix sockets")
+    def test_two_clients_are_paired_over_unix_socket(self, tmp_path):
+        path = str(tmp_path / "duel.sock")
+
+        async def scenario():
+            server = MatchServer(seed=3)
+            await server.start_unix(path)
+            first = await asyncio.open_unix_connection(path)
+            first_task = asyncio.create_task(
+                play_passing_client(*first, {"type": "join"}))
+            await asyncio.sleep(0.05)
+            second = await asyncio.open_unix_connection(path)
+            results = await asyncio.gather(
+                first_task, play_passing_client(*second, {"type": "join"}))
+            await server.close()
+            return results, server
+
+        (first_messages, second_messages), server = asyncio.run(scenario())
+
+        assert first_messages[0] == {"type": "waiting"}
+        assert {"type": "start", "player_id": 1} in first_messages
+        assert second_messages[0] == {"type": "start", "player_id": 2}
+        assert first_messages[-1]["winner_id"] == second_messages[-1]["winner_id"]
+        assert server.matches_played == 1
+
+    def test_silent_client_passes_after_timeout(self):
+        async def scenario():
+            server = MatchServer(seed=4, action_timeout=0.05)
+            listener = await server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await send(writer, {"type": "join", "opponent": "bot"})
+            types = []
+            while not types or types[-1] != "result":
+                types.append((await receive(reader))["type"])
+            writer.close()
+            await server.close()
+            return types
+
+        types = asyncio.run(scenario())
+
+        assert "timeout" in types
+        assert types[-1] == "result"
+
+    def test_invalid_action_is_rejected_and_asked_again(self):
+        async def scenario():
+            server = MatchServer(seed=6)
+            listener = await server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await send(writer, {"type": "join", "opponent": "bot"})
+            await receive(reader)  # start
+            turn = await receive(reader)
+            await send(writer, {"type": "action", "turn": turn["turn"],
+                                "action": "play", "card_index": 99})
+            error = await receive(reader)
+            await send(writer, {"type": "action", "turn": turn["turn"], "action": "pass"})
+            following = await receive(reader)
+            writer.close()
+            await server.close()
+            return turn, error, following
+
+        turn, error, following = asyncio.run(scenario())
+
+        assert error == {"type": "error", "message": "Invalid card index"}
+        # pas przyjęty w tej samej turze – bez ponownego pytania o nią
+        assert following["type"] == "turn"
+        assert following["turn"] == turn["turn"] + 1
+
+    def test_junk_replies_force_a_pass(self):
+        async def scenario():
+            server = MatchServer(seed=6, action_timeout=5.0)
+            listener = await server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await send(writer, {"type": "join", "opponent": "bot"})
+            await receive(reader)  # start
+            await receive(reader)  # turn
+            for _ in range(MAX_INVALID_REPLIES):
+                await send(writer, {"type": "action", "action": "dance"})
+            messages = [await receive(reader) for _ in range(MAX_INVALID_REPLIES + 2)]
+            writer.close()
+            await server.close()
+            return messages
+
+        messages = asyncio.run(scenario())
+
+        assert [m["type"] for m in messages] == ["error"] * (MAX_INVALID_REPLIES + 1) + ["turn"]
+        assert "passing" in messages[MAX_INVALID_REPLIES]["message"]
+
+    def test_late_reply_to_previous_turn_is_ignored(self):
+        async def scenario():
+            server = MatchServer(seed=7, action_timeout=0.05)
+            listener = await server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await send(writer, {"type": "join", "opponent": "bot"})
+            await receive(reader)  # start
+            first = await receive(reader)
+            assert (await receive(reader))["type"] == "timeout"
+            second = await receive(reader)
+            # spóźniona odpowiedź na pierwszą turę, potem właściwa
+            await send(writer, {"type": "action", "turn": first["turn"], "action": "pass"})
+            await send(writer, {"type": "action", "turn": second["turn"],
+                                "action": "play", "card_index": 0})
+            third = await receive(reader)
+            writer.close()
+            await server.close()
+            return first, second, third
+
+        first, second, third = asyncio.run(scenario())
+
+        assert second["turn"] == first["turn"] + 1
+        own = next(p for p in third["state"]["players"] if p["id"] == 1)
+        mine = next(p for p in second["state"]["players"] if p["id"] == 1)
+        # zagrana karta (a nie pas ze spóźnionej odpowiedzi)
+        assert len(own["hand"]) == len(mine["hand"]) - 1
+        assert own["has_passed"] is False
+
+    def test_public_state_hides_only_opponent_hand(self):
+        game = MatchServer(seed=0).new_game()
+        for player in game.players.values():
+            player.draw_from_deck(3)
+
+        state = public_state(game, 1)
+
+        own, opponent = state["players"]
+        assert len(own["hand"]) == 3
+        assert opponent["hand_size"] == 3
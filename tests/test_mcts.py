@@ -0,0 +1,199 @@
+import pytest
+
+from src.card_duel.actions import PASS_ACTION, PLAY
+from src.card_duel.board import Board
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.controller import GameController
+from src.card_duel.deck import Deck
+from src.card_duel.game import Game
+from src.card_duel.headless.renderer_null import RendererNull
+from src.card_duel.mcts import MCTSBot, legal_actions
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+
+
+def make_card(card_id: int,
+              power: int,
+              affinity: RowAffinity = RowAffinity.MELEE) -> Card:
+    """Prosta karta o zadanej sile i rzędzie."""
+    return Card(card_id, f"Card {card_id}", power, affinity, tags=[])
+
+
+def make_game(n_cards: int = 8) -> Game:
+    affinities = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+    players = []
+    for player_id in (1, 2):
+        cards = [make_card(player_id * 100 + i, 2 + i, affinities[i % 3])
+                 for i in range(n_cards)]
+        players.append(Player(player_id, Deck(f"Deck {player_id}", cards)))
+    return Game(players, Board([1, 2]), Rules(rounds_to_win=2))
+
+
+@pytest.fixture
+def started_game() -> Game:
+    game = make_game()
+    game.start_match()
+    for player in game.players.values():
+        player.draw_from_deck(5)
+    game.start_round()
+    return game
+
+
+class TestMCTSBot:
+
+    def test_legal_actions_dedupes_cards_and_includes_pass(self, started_game):
+        game = started_game
+        player = game.players[game.active_player_id]
+        player.hand.append(player.hand[0])
+
+        actions = legal_actions(game)
+
+        assert actions[0] == PASS_ACTION
+        assert len(actions) == 1 + 5
+        for action in actions[1:]:
+            card = player.hand[action.card_index]
+            assert action.row_affinity is card.row_affinity
+
+    def test_legal_actions_only_pass_after_passing(self, started_game):
+        game = started_game
+        game.players[game.active_player_id].has_passed = True
+
+        assert legal_actions(game) == [PASS_ACTION]
+
+    def test_search_leaves_game_unchanged(self, started_game):
+        game = started_game
+        before = game.serialize()
+        bot = MCTSBot(seed=1, iterations=200, time_budget_ms=None)
+
+        action = bot.search(game, game.active_player_id)
+
+        assert game.serialize() == before
+        assert action in legal_actions(game)
+        assert bot.last_iterations == 200
+
+    def test_search_is_reproducible_with_seed(self, started_game):
+        game = started_game
+        player_id = game.active_player_id
+
+        first = MCTSBot(seed=4, iterations=100, time_budget_ms=None,
+                        reuse_tree=False).search(game, player_id)
+        second = MCTSBot(seed=4, iterations=100, time_budget_ms=None,
+                         reuse_tree=False).search(game, player_id)
+
+        assert first == second
+
+    def test_prefers_winning_play_over_pass(self, started_game):
+        game = started_game
+        active_id = game.active_player_id
+        opponent_id = game.get_opponent_id(active_id)
+        game.board.place_card(opponent_id, make_card(999, 3), RowAffinity.MELEE)
+        game.players[opponent_id].has_passed = True
+
+        bot = MCTSBot(seed=2, iterations=300, time_budget_ms=None,
+                      rollout="greedy")
+        action = bot.search(game, active_id)
+
+        assert action.kind == PLAY
+
+    def test_tree_is_reused_after_opponent_move(self, started_game):
+        game = started_game
+        bot = MCTSBot(seed=3, iterations=300, time_budget_ms=None)
+        player_id = game.active_player_id
+
+        action = bot.search(game, player_id)
+        game.apply(action)
+        opponent_action = legal_actions(game)[1]
+        game.apply(opponent_action)
+        signature = game.zobrist_hash()
+
+        root = bot._reuse_root(game, player_id)
+
+        assert root.signature == signature
+        assert root.visits > 0
+
+    def test_time_budget_limits_search(self, started_game):
+        game = started_game
+        bot = MCTSBot(seed=5, time_budget_ms=20)
+
+        bot.search(game, game.active_player_id)
+
+        assert bot.last_iterations > 0
+        assert bot.last_search_ms < 500
+
+    def test_plays_full_match_through_controller(self):
+        game = make_game(n_cards=14)
+        bot = MCTSBot(seed=6, iterations=30, time_budget_ms=None)
+
+        GameController(game, bot, RendererNull()).run_match()
+
+        assert game.is_round_active is False
+        assert game.current_round >= 2
+
+    def test_failed_rollout_leaves_game_untouched(self, started_game):
+        game = started_game
+        snapshot, signature = game.to_snapshot(), game.zobrist_hash()
+        bot = MCTSBot(seed=8, iterations=5, time_budget_ms=None)
+        rollout = bot._rollout_action
+        calls = []
+
+        def failing_rollout(game):
+            calls.append(1)
+            if len(calls) == 3:
+                raise RuntimeError("rollout failed")
+            return rollout(game)
+
+        bot._rollout_action = failing_rollout
+        with pytest.raises(RuntimeError):
+            bot.search(game, game.active_player_id)
+
+        assert game.to_snapshot() == snapshot
+        assert game.zobrist_hash() == signature
+
+    def test_requires_some_budget(self):
+        with pytest.raises(ValueError):
+            MCTSBot(iterations=None, time_budget_ms=None)
+        with pytest.raises(ValueError):
+            MCTSBot(rollout="unknown")
+
+    def test_search_does_not_leak_speculative_deltas(self):
+        class Recorder:
+            """Zapisuje decyzje bota, żeby odtworzyć je w drugiej partii."""
+            def __init__(self, bot):
+                self.bot = bot
+                self.choices = []
+
+            def choose_action(self, game, player):
+                return self._record(self.bot.choose_action(game, player))
+
+            def choose_card_index(self, game, player):
+                return self._record(self.bot.choose_card_index(game, player))
+
+            def choose_row_affinity(self, game, player):
+                return self._record(self.bot.choose_row_affinity(game, player))
+
+            def _record(self, choice):
+                self.choices.append(choice)
+                return choice
+
+        class Replay:
+            def __init__(self, choices):
+                self.choices = list(choices)
+
+            def choose_action(self, game, player):
+                return self.choices.pop(0)
+
+            choose_card_index = choose_row_affinity = choose_action
+
+        searched = make_game(n_cards=14)
+        searched_deltas = []
+        searched.delta_sink = searched_deltas.append
+        recorder = Recorder(MCTSBot(seed=7, iterations=30, time_budget_ms=None))
+        GameController(searched, recorder, RendererNull()).run_match()
+
+        replayed = make_game(n_cards=14)
+        replayed_deltas = []
+        replayed.delta_sink = replayed_deltas.append
+        GameController(replayed, Replay(recorder.choices), RendererNull()).run_match()
+
+        assert searched.delta_sink == searched_deltas.append
+        assert searched_deltas == replayed_deltas
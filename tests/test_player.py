@@ -89,6 +89,14 @@ class TestPlayer:
         assert player.hand_size() == 0
         assert card_in_hand not in player.hand
 
+    def test_play_card_removes_exact_index_and_keeps_order(self) -> None:
+        player = Player(1, make_deck_with_n_cards(4))
+        player.draw_from_deck(4)
+        first, second, third, fourth = list(player.hand)
+
+        assert player.play_card(1) is second
+        assert player.hand == [first, third, fourth]
+
     def test_play_card_raises_if_index_out_of_range(self) -> None:
         deck = make_deck_with_n_cards(1)
         player = Player(0, deck)
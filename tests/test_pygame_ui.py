@@ -0,0 +1,197 @@
+import os
+
+import pytest
+
+# bez okna – testy działają także bez serwera wyświetlania
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+from src.card_duel.board import Board  # noqa: E402
+from src.card_duel.card import Card, RowAffinity  # noqa: E402
+from src.card_duel.deck import Deck  # noqa: E402
+from src.card_duel.game import Game  # noqa: E402
+from src.card_duel.player import Player  # noqa: E402
+from src.card_duel.pygame_ui import (  # noqa: E402
+    BOARD_TOP,
+    HAND_TILE_WIDTH,
+    ROW_HEIGHT,
+    TILE_CACHE_SIZE,
+    InputHandlerPygame,
+    LatencyStats,
+    RendererPygame,
+)
+from src.card_duel.rules import Rules  # noqa: E402
+
+
+WIDTH, HEIGHT = 1024, 768
+
+
+def make_game() -> Game:
+    affinities = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE, RowAffinity.ANY)
+    players = []
+    for player_id in (1, 2):
+        cards = [Card(player_id * 100 + i, f"Card {i}", 2 + i, affinities[i % 4], [])
+                 for i in range(8)]
+        players.append(Player(player_id, Deck(f"Deck {player_id}", cards)))
+    game = Game(players, Board([1, 2]), Rules(rounds_to_win=2))
+    game.start_match()
+    for player in players:
+        player.draw_from_deck(4)
+    game.start_round()
+    return game
+
+
+def hand_card_pos(index: int) -> tuple:
+    """Punkt wewnątrz kafelka karty o danym indeksie (układ RendererPygame)."""
+    return (10 + index * (HAND_TILE_WIDTH + 10) + 5, HEIGHT - 120 + 30)
+
+
+@pytest.fixture
+def renderer():
+    renderer = RendererPygame(WIDTH, HEIGHT)
+    yield renderer
+    pygame.quit()
+
+
+@pytest.fixture
+def drawn(renderer):
+    game = make_game()
+    renderer.render_player_turn_header(game.players[1])
+    renderer.render_game_state(game)
+    return game, renderer
+
+
+def post(event_type: int, **attributes) -> None:
+    pygame.event.post(pygame.event.Event(event_type, **attributes))
+
+
+class TestRendererPygame:
+
+    def test_hit_testing_uses_last_frame_layout(self, drawn):
+        game, renderer = drawn
+
+        assert renderer.card_index_at(hand_card_pos(0)) == 0
+        assert renderer.card_index_at(hand_card_pos(3)) == 3
+        assert renderer.card_index_at(hand_card_pos(4)) is None
+        assert renderer.card_index_at((5, 5)) is None
+        # górny gracz: etykieta sumy (25 px), potem MELEE, RANGED, SIEGE
+        first_row_y = BOARD_TOP + 25 + 5
+        assert renderer.row_at((500, first_row_y)) is RowAffinity.MELEE
+        assert renderer.row_at((500, first_row_y + ROW_HEIGHT)) is RowAffinity.RANGED
+        assert renderer.row_at((500, first_row_y + 2 * ROW_HEIGHT)) is RowAffinity.SIEGE
+        assert renderer.row_at((500, 5)) is None
+
+    def test_unchanged_frame_redraws_nothing(self, drawn):
+        game, renderer = drawn
+
+        renderer.render_game_state(game)
+
+        assert renderer._dirty == []
+
+    def test_changed_regions_are_redrawn(self, drawn):
+        game, renderer = drawn
+        game.play_card(1, 0, RowAffinity.MELEE)
+
+        renderer.render_game_state(game)
+
+        dirty_tops = sorted(rect.top for rect in renderer._dirty)
+        # nagłówek (rozmiar ręki), suma gracza 1, jego rząd MELEE i ręka
+        assert len(dirty_tops) == 4
+        assert dirty_tops[0] == 0 and dirty_tops[-1] == HEIGHT - 120
+        renderer.invalidate()
+        renderer.render_game_state(game)
+        assert renderer._full_redraw is False
+
+    def test_wait_for_exit_blocks_until_window_is_closed(self, renderer):
+        post(pygame.WINDOWEXPOSED)
+        post(pygame.QUIT)
+
+        renderer._wait_for_exit()
+
+        assert not pygame.display.get_init()
+
+    def test_tile_cache_is_bounded(self, renderer):
+        for power in range(TILE_CACHE_SIZE + 10):
+            renderer._board_tile(power, (0, 0, 0))
+
+        assert len(renderer._tile_cache) <= TILE_CACHE_SIZE
+
+
+class TestLatencyStats:
+
+    def test_summary_percentiles(self):
+        stats = LatencyStats()
+        for ms in range(1, 101):
+            stats.record(ms / 1000)
+
+        summary = stats.summary()
+
+        assert summary["count"] == 100
+        assert summary["mean_ms"] == pytest.approx(50.5)
+        assert summary["p95_ms"] == pytest.approx(96)
+        assert summary["max_ms"] == pytest.approx(100)
+
+    def test_keeps_only_recent_samples(self):
+        stats = LatencyStats(max_samples=3)
+        for seconds in (5.0, 0.001, 0.002, 0.003):
+            stats.record(seconds)
+
+        assert stats.summary()["count"] == 3
+        assert stats.summary()["max_ms"] == pytest.approx(3)
+        assert LatencyStats().summary()["count"] == 0
+
+
+class TestInputHandlerPygame:
+
+    def test_keyboard_decisions(self, drawn):
+        game, renderer = drawn
+        handler = InputHandlerPygame(renderer)
+        player = game.players[1]
+
+        post(pygame.KEYDOWN, key=pygame.K_s)
+        assert handler.choose_action(game, player) == "pass"
+
+        any_index = [card.row_affinity for card in player.hand].index(RowAffinity.ANY)
+        post(pygame.KEYDOWN, key=pygame.K_p)
+        assert handler.choose_action(game, player) == "play"
+        # 9 jest poza ręką – ignorowane
+        post(pygame.KEYDOWN, key=pygame.K_9)
+        post(pygame.KEYDOWN, key=pygame.K_0 + any_index)
+        assert handler.choose_card_index(game, player) == any_index
+        # karta ANY – rząd wybiera gracz
+        post(pygame.KEYDOWN, key=pygame.K_2)
+        assert handler.choose_row_affinity(game, player) is RowAffinity.RANGED
+
+    def test_input_latency_ends_at_next_frame(self, drawn):
+        game, renderer = drawn
+        handler = InputHandlerPygame(renderer)
+
+        post(pygame.KEYDOWN, key=pygame.K_s)
+        handler.choose_action(game, game.players[1])
+        assert handler.metrics()["input"]["count"] == 0
+
+        renderer.render_game_state(game)
+        renderer.render_game_state(game)
+
+        latency = handler.metrics()["input"]
+        assert latency["count"] == 1 and latency["max_ms"] >= 0
+
+    def test_mouse_click_plays_card_in_its_row(self, drawn):
+        game, renderer = drawn
+        handler = InputHandlerPygame(renderer)
+        player = game.players[1]
+
+        post(pygame.MOUSEBUTTONDOWN, button=1, pos=hand_card_pos(1))
+
+        assert handler.choose_action(game, player) == "play"
+        assert handler.choose_card_index(game, player) == 1
+        assert handler.choose_row_affinity(game, player) is player.hand[1].row_affinity
+
+    def test_window_close_stops_waiting(self, drawn):
+        game, renderer = drawn
+        handler = InputHandlerPygame(renderer)
+
+        post(pygame.QUIT)
+
+        with pytest.raises(SystemExit):
+            handler.choose_action(game, game.players[1])
@@ -0,0 +1,112 @@
+import io
+
+import pytest
+
+from src.card_duel.board import Board
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.cli.renderer_cli import MODE_DIFF, MODE_QUIET, RendererCLI
+from src.card_duel.deck import Deck
+from src.card_duel.game import Game
+from src.card_duel.modifiers import buff
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+
+
+def make_game() -> Game:
+    """Pomocniczo: dwóch graczy po 3 karty na ręce, runda rozpoczęta."""
+    players = [Player(pid, Deck(f"Deck {pid}", [
+        Card(card_id, f"Card {card_id}", card_id, RowAffinity.MELEE, set())
+        for card_id in range(1, 6)])) for pid in (1, 2)]
+    for player in players:
+        player.draw_from_deck(3)
+    game = Game(players, Board([1, 2]), Rules(rounds_to_win=2))
+    game.start_match()
+    game.start_round()
+    return game
+
+
+def render_turn(renderer: RendererCLI, game: Game) -> None:
+    """Pomocniczo: to samo, co GameController rysuje przed ruchem."""
+    player = game.players[game.active_player_id]
+    renderer.render_game_state(game)
+    renderer.render_player_turn_header(player)
+    renderer.render_player_hand(player)
+
+
+class TestRendererCLI:
+
+    def test_plain_mode_prints_like_before_in_one_write(self, capsys):
+        game = make_game()
+        renderer = RendererCLI()
+
+        renderer.render_game_state(game)
+
+        out = capsys.readouterr().out
+        assert out.startswith("\n=== GAME STATE ===\nPlayer 1:\n")
+        assert "============== BOARD ==============\nPlayer 2 (total: 0)\n" in out
+        assert out.endswith("===================================\n\n")
+        assert renderer.writes == 1
+
+    def test_board_shows_effective_power(self):
+        game = make_game()
+        stream = io.StringIO()
+        renderer = RendererCLI(stream=stream)
+        game.play_card(1, 0, RowAffinity.MELEE)
+        game.board.add_modifier(1, RowAffinity.MELEE, buff(2))
+
+        renderer.render_board(game)
+
+        card_power = game.board.get_total_power(1)
+        assert f"  MELEE : [ {card_power:2d} ] = {card_power}\n" in stream.getvalue()
+
+    def test_quiet_mode_writes_nothing(self):
+        game = make_game()
+        stream = io.StringIO()
+        renderer = RendererCLI(MODE_QUIET, stream)
+
+        render_turn(renderer, game)
+        renderer.render_round_end(game)
+        renderer.render_match_result(game)
+
+        assert stream.getvalue() == ""
+        assert renderer.writes == 0
+
+    def test_diff_mode_rewrites_only_changed_lines(self):
+        game = make_game()
+        stream = io.StringIO()
+        renderer = RendererCLI(MODE_DIFF, stream)
+        render_turn(renderer, game)
+        first = stream.getvalue()
+        assert first.startswith("\x1b[2J")
+
+        render_turn(renderer, game)
+        unchanged = stream.getvalue()[len(first):]
+        game.play_card(game.active_player_id, 0, RowAffinity.MELEE)
+        render_turn(renderer, game)
+        changed = stream.getvalue()[len(first) + len(unchanged):]
+
+        # bez zmian: tylko przesunięcie kursora pod ramkę
+        assert "=== GAME STATE ===" not in unchanged
+        assert unchanged.count("\x1b[J") == 3
+        assert "Board power: " in changed
+        assert "=== GAME STATE ===" not in changed
+        assert len(changed) < len(first) // 2
+        assert renderer.writes == 9
+
+    def test_invalidate_forces_full_redraw(self):
+        game = make_game()
+        stream = io.StringIO()
+        renderer = RendererCLI(MODE_DIFF, stream)
+        render_turn(renderer, game)
+        renderer.invalidate()
+        stream.seek(0)
+        stream.truncate()
+
+        renderer.render_game_state(game)
+
+        assert stream.getvalue().startswith("\x1b[2J")
+        assert "=== GAME STATE ===" in stream.getvalue()
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError):
+            RendererCLI("fancy")
@@ -1,6 +1,7 @@
 import pytest
 from src.card_duel.row import Row
 from src.card_duel.card import RowAffinity, Card
+from src.card_duel.modifiers import buff, horn, weather
 
 
 @pytest.fixture
@@ -93,3 +94,109 @@ class TestRow:
         assert deleted_card is None
         assert len(row) == 0
         assert row.total_power() == 0
+
+    def test_row_power_cache_tracks_changes(self, melee_row):
+        row = melee_row
+        card1 = make_card(1, power=10)
+        card2 = make_card(2, power=7)
+
+        row.add_card(card1)
+        row.add_card(card2)
+        row.remove_card(card1)
+
+        assert row.total_power() == row.recompute_power() == 7
+
+    def test_row_initial_cards_counted_in_cache(self):
+        row = Row(RowAffinity.MELEE, [make_card(1, 4), make_card(2, 6)])
+
+        assert row.total_power() == 10
+
+    def test_row_reports_power_deltas(self):
+        deltas = []
+        row = Row(RowAffinity.MELEE, on_power_change=deltas.append)
+
+        row.add_card(make_card(1, power=10))
+        row.add_card(make_card(2, power=3))
+        row.remove_card(make_card(1))
+        row.clear()
+
+        assert deltas == [10, 3, -10, -3]
+
+    def test_row_debug_mode_detects_stale_cache(self):
+        row = Row(RowAffinity.MELEE, debug=True)
+        row.add_card(make_card(1, power=10))
+        assert row.total_power() == 10
+
+        # modyfikacja listy z pominięciem add_card rozjeżdża cache
+        row.cards.append(make_card(2, power=5))
+
+        with pytest.raises(RuntimeError):
+            row.total_power()
+
+    def test_row_pop_card_removes_last_card(self, melee_row):
+        row = melee_row
+        card1 = make_card(1, power=10)
+        card2 = make_card(2, power=7)
+        row.add_card(card1)
+        row.add_card(card2)
+
+        assert row.pop_card() is card2
+        assert row.cards == [card1]
+        assert row.total_power() == 10
+
+    def test_row_pop_card_from_empty_returns_none(self, melee_row):
+        assert melee_row.pop_card() is None
+
+    def test_row_modifiers_change_effective_power(self, melee_row):
+        row = melee_row
+        strong = make_card(1, power=10)
+        row.add_card(strong)
+        row.add_card(make_card(2, power=4))
+
+        row.add_modifier(weather())
+        assert row.total_power() == 2
+        row.add_modifier(buff(2), strong)
+        assert row.card_power(strong) == 3
+        row.add_modifier(horn())
+        assert row.total_power() == (3 + 1) * 2
+
+        row.remove_modifier(weather())
+        assert row.total_power() == (12 + 4) * 2
+        assert row.total_power() == row.recompute_power()
+
+    def test_row_recomputes_lazily_once_per_change(self, melee_row):
+        row = melee_row
+        invalidations = []
+        row.on_invalidate = lambda: invalidations.append(1)
+        row.add_card(make_card(1, power=10))
+
+        row.add_modifier(horn())
+        row.add_modifier(buff(1))
+        assert len(invalidations) == 1
+        assert row.total_power() == 22
+
+        # dokładanie kart do czystego rzędu – przyrostowo, bez przeliczenia
+        row.add_card(make_card(2, power=3))
+        assert row._dirty is False
+        assert row.total_power() == 30
+        assert len(invalidations) == 1
+
+    def test_row_clear_drops_modifiers(self, melee_row):
+        row = melee_row
+        changes = []
+        row.on_modifier_change = lambda modifier, card_id, delta: changes.append(delta)
+        row.add_card(make_card(1, power=10))
+        row.add_modifier(weather())
+
+        row.clear()
+
+        assert row.modifiers == [] and not row.has_modifiers()
+        assert changes == [1, -1]
+        row.add_card(make_card(2, power=5))
+        assert row.total_power() == 5
+
+    def test_row_rejects_unknown_or_missing_modifier(self, melee_row):
+        with pytest.raises(ValueError):
+            melee_row.add_modifier((99, 0))
+        with pytest.raises(ValueError):
+            melee_row.remove_modifier(horn())
@@ -130,3 +130,34 @@ class TestRules:
         winner_id = rules.get_match_winner_id([player1, player2])
 
         assert winner_id is None
+
+    # --- drużyny ---
+
+    def test_team_round_winner_is_team_with_higher_combined_power(self):
+        rules = Rules()
+        board = Board(player_ids=[1, 2, 3, 4])
+        # drużyna (1, 3): 5 + 6 = 11, drużyna (2, 4): 10 + 0 = 10
+        for player_id, power in ((1, 5), (2, 10), (3, 6)):
+            board.place_card(player_id, make_card(player_id, power),
+                             row_affinity=RowAffinity.MELEE)
+
+        result = rules.get_team_round_winner_ids(board, [(1, 3), (2, 4)])
+
+        assert result == [1, 3]
+
+    def test_team_round_winner_is_empty_on_tie(self):
+        rules = Rules()
+        board = Board(player_ids=[1, 2, 3, 4])
+        board.place_card(1, make_card(1, 7), row_affinity=RowAffinity.MELEE)
+        board.place_card(4, make_card(2, 7), row_affinity=RowAffinity.MELEE)
+
+        assert rules.get_team_round_winner_ids(board, [(1, 3), (2, 4)]) == []
+
+    def test_team_match_winner_ids(self):
+        rules = Rules(rounds_to_win=2)
+        players = [make_player(1, rounds_won=2), make_player(2, rounds_won=1),
+                   make_player(3, rounds_won=2), make_player(4, rounds_won=1)]
+
+        assert rules.get_team_match_winner_ids(players, [(1, 3), (2, 4)]) == [1, 3]
+        players[1].rounds_won = 2
+        assert rules.get_team_match_winner_ids(players, [(1, 3), (2, 4)]) == []
@@ -0,0 +1,43 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.card_duel.shuffling import (  # noqa: E402
+    bulk_permutations,
+    match_permutation,
+    restrict_permutation,
+)
+
+
+class TestShuffling:
+
+    def test_bulk_rows_are_permutations(self):
+        perms = bulk_permutations(seed=1, start=0, count=50, n_cards=25)
+
+        assert perms.shape == (50, 25)
+        for row in perms:
+            assert sorted(row.tolist()) == list(range(25))
+        assert len({tuple(row) for row in perms.tolist()}) == 50
+
+    def test_bulk_matches_single_match_generation(self):
+        perms = bulk_permutations(seed=9, start=100, count=10, n_cards=13, stream=1)
+
+        for offset in range(10):
+            single = match_permutation(9, 100 + offset, 13, stream=1)
+            assert perms[offset].tolist() == single
+
+    def test_streams_and_seeds_differ(self):
+        base = match_permutation(3, 0, 30, stream=0)
+
+        assert match_permutation(3, 0, 30, stream=1) != base
+        assert match_permutation(4, 0, 30, stream=0) != base
+        assert match_permutation(3, 0, 30, stream=0) == base
+
+    def test_restrict_permutation_keeps_smaller_range(self):
+        perm = np.array([4, 0, 3, 1, 2])
+
+        assert restrict_permutation(perm, 3) == [0, 1, 2]
+
+    def test_negative_arguments_raise(self):
+        with pytest.raises(ValueError):
+            bulk_permutations(seed=0, start=-1, count=1, n_cards=5)
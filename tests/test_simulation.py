@@ -0,0 +1,138 @@
+import functools
+
+import pytest
+
+from src.card_duel.bots import RandomBot, GreedyBot
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.deck import Deck
+from src.card_duel.simulation import (
+    SimulationResult,
+    replay_match,
+    run_single_match,
+    simulate_matches,
+)
+
+
+def make_deck(name: str, first_id: int, n_cards: int = 12) -> Deck:
+    """Talia z kartami we wszystkich trzech rzędach."""
+    affinities = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+    cards = [
+        Card(first_id + i, f"{name} {i}", 3 + i % 6, affinities[i % 3], tags=[])
+        for i in range(n_cards)
+    ]
+    return Deck(name, cards)
+
+
+@pytest.fixture
+def deck_pairs():
+    deck_a = make_deck("Alpha", 1)
+    deck_b = make_deck("Beta", 101)
+    return [(deck_a, deck_b), (deck_b, deck_a)]
+
+
+class TestSimulation:
+
+    def test_run_single_match_finishes_and_keeps_source_decks(self, deck_pairs):
+        deck_a, deck_b = deck_pairs[0]
+
+        game = run_single_match(deck_a, deck_b, RandomBot, seed=3)
+
+        assert 1 <= game.current_round <= 3
+        assert game.is_round_active is False
+        # talie źródłowe nie są zużywane przez symulację
+        assert len(deck_a) == 12
+        assert len(deck_b) == 12
+
+    def test_simulate_matches_counts_every_match(self, deck_pairs):
+        result = simulate_matches(deck_pairs, seed=1, n_matches=50,
+                                  workers=1, chunk_size=7)
+
+        wins = sum(result.wins_by_deck.values())
+        assert result.matches == 50
+        assert wins + result.draws == 50
+        assert result.matches_by_deck == {"Alpha": 50, "Beta": 50}
+        assert result.rounds_played >= 50 * 2 - result.draws
+
+    def test_simulate_matches_does_not_depend_on_chunking(self, deck_pairs):
+        bot = functools.partial(RandomBot, pass_probability=0.2)
+
+        small = simulate_matches(deck_pairs, bot_factory=bot, seed=5,
+                                 n_matches=40, workers=1, chunk_size=3)
+        large = simulate_matches(deck_pairs, bot_factory=bot, seed=5,
+                                 n_matches=40, workers=1, chunk_size=100)
+
+        assert small.serialize() == large.serialize()
+
+    def test_simulate_matches_with_process_pool(self, deck_pairs):
+        inline = simulate_matches(deck_pairs, bot_factory=GreedyBot, seed=2,
+                                  n_matches=20, workers=1, chunk_size=5)
+        pooled = simulate_matches(deck_pairs, bot_factory=GreedyBot, seed=2,
+                                  n_matches=20, workers=2, chunk_size=5)
+
+        assert pooled.serialize() == inline.serialize()
+
+    def test_simulation_result_merge_and_rates(self):
+        first = SimulationResult()
+        first.matches = 2
+        first.matches_by_deck = {"Alpha": 2}
+        first.wins_by_deck = {"Alpha": 1}
+        first.final_power_by_deck = {"Alpha": 30}
+        second = SimulationResult()
+        second.matches = 2
+        second.draws = 1
+        second.matches_by_deck = {"Alpha": 2}
+        second.final_power_by_deck = {"Alpha": 10}
+
+        first.merge(second)
+
+        assert first.matches == 4
+        assert first.draws == 1
+        assert first.win_rate("Alpha") == 0.25
+        assert first.average_final_power("Alpha") == 10.0
+        assert first.win_rate("Unknown") == 0.0
+
+    def test_simulate_matches_validates_arguments(self, deck_pairs):
+        with pytest.raises(ValueError):
+            simulate_matches([], n_matches=1)
+        with pytest.raises(ValueError):
+            simulate_matches(deck_pairs, n_matches=-1)
+        with pytest.raises(ValueError):
+            simulate_matches(deck_pairs, n_matches=1, chunk_size=0)
+
+    def test_second_bot_factory_gives_each_seat_its_own_bot(self, deck_pairs):
+        deck_a, deck_b = deck_pairs[0]
+        seats = []
+
+        def tracking_bot(seed):
+            bot = GreedyBot(seed)
+            choose_action = bot.choose_action
+            bot.choose_action = lambda game, player: (seats.append(player.id),
+                                                      choose_action(game, player))[1]
+            return bot
+
+        run_single_match(deck_a, deck_b, tracking_bot, seed=5, second_bot_factory=RandomBot)
+
+        assert set(seats) == {1}
+
+    def test_replay_match_reproduces_recorded_match(self, deck_pairs):
+        for bulk_shuffle in (False, True):
+            if bulk_shuffle:
+                pytest.importorskip("numpy")
+            result = simulate_matches(deck_pairs, seed=8, n_matches=1,
+                                      workers=1, bulk_shuffle=bulk_shuffle)
+            game = replay_match(deck_pairs, RandomBot, seed=8, match_index=0,
+                                bulk_shuffle=bulk_shuffle)
+
+            expected = SimulationResult()
+            expected.record(game)
+            assert expected.serialize() == result.serialize()
+
+    def test_bulk_shuffle_does_not_depend_on_chunking(self, deck_pairs):
+        pytest.importorskip("numpy")
+
+        small = simulate_matches(deck_pairs, seed=5, n_matches=30, workers=1,
+                                 chunk_size=4, bulk_shuffle=True)
+        large = simulate_matches(deck_pairs, seed=5, n_matches=30, workers=1,
+                                 chunk_size=30, bulk_shuffle=True)
+
+        assert small.serialize() == large.serialize()
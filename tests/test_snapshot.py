@@ -0,0 +1,143 @@
+import json
+import struct
+
+import pytest
+
+from src.card_duel.board import Board
+from src.card_duel.card import RowAffinity
+from src.card_duel.catalog import CardCatalog
+from src.card_duel.game import Game
+from src.card_duel.modifiers import buff, weather
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+from src.card_duel.snapshot import SNAPSHOT_VERSION
+
+
+@pytest.fixture
+def catalog() -> CardCatalog:
+    catalog = CardCatalog()
+    affinities = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+    for card_id in range(1, 31):
+        catalog.define(card_id, f"Card {card_id}", card_id % 9 + 1,
+                       affinities[card_id % 3], ["tag"])
+    return catalog
+
+
+@pytest.fixture
+def game_mid_round(catalog) -> Game:
+    player1 = Player(1, catalog.build_deck("Północ", range(1, 16)))
+    player2 = Player(2, catalog.build_deck("Skellige", range(16, 31)))
+    game = Game([player1, player2], Board([1, 2]), Rules(rounds_to_win=2))
+    game.start_match()
+    for player in game.players.values():
+        player.draw_from_deck(10)
+
+    game.start_round()
+    game.play_card(1, 0, RowAffinity.MELEE)
+    game.play_card(2, 1, RowAffinity.SIEGE)
+    game.pass_turn(1)
+    game.play_card(2, 1, RowAffinity.RANGED)
+    return game
+
+
+def full_state(game: Game) -> dict:
+    state = game.serialize()
+    state["decks"] = [[card.id for card in game.players[pid].deck.cards]
+                      for pid in game.player_order]
+    state["last_round_winner_id"] = game.last_round_winner_id
+    return state
+
+
+class TestSnapshot:
+
+    def test_round_trip_restores_full_state(self, game_mid_round, catalog):
+        game = game_mid_round
+
+        restored = Game.from_snapshot(game.to_snapshot(), catalog)
+
+        assert full_state(restored) == full_state(game)
+        assert restored.zobrist_hash() == game.zobrist_hash()
+        for pid in game.player_order:
+            assert restored.board.get_total_power(pid) == game.board.get_total_power(pid)
+
+    def test_round_trip_keeps_row_modifiers(self, game_mid_round, catalog):
+        game = game_mid_round
+        game.board.add_modifier(1, RowAffinity.MELEE, weather())
+        game.board.add_modifier(2, RowAffinity.SIEGE, buff(3),
+                                game.board.get_row(2, RowAffinity.SIEGE).cards[0])
+
+        restored = Game.from_snapshot(game.to_snapshot(), catalog)
+
+        assert full_state(restored) == full_state(game)
+        assert restored.zobrist_hash() == game.zobrist_hash()
+        for pid in game.player_order:
+            assert restored.board.get_total_power(pid) == game.board.get_total_power(pid)
+
+    def test_restored_cards_come_from_catalog(self, game_mid_round, catalog):
+        restored = Game.from_snapshot(game_mid_round.to_snapshot(), catalog)
+
+        card = restored.players[1].hand[0]
+        assert card is catalog.get(card.id)
+
+    def test_restored_game_can_continue(self, game_mid_round, catalog):
+        game = game_mid_round
+        restored = Game.from_snapshot(game.to_snapshot(), catalog)
+
+        for current in (game, restored):
+            while current.is_round_active:
+                current.pass_turn(current.active_player_id)
+
+        assert full_state(restored) == full_state(game)
+        assert restored.is_round_active is False
+
+    def test_snapshot_is_much_smaller_than_json(self, game_mid_round):
+        game = game_mid_round
+
+        binary = game.to_snapshot()
+        text = json.dumps(game.serialize()).encode("utf-8")
+
+        assert len(binary) * 5 < len(text)
+
+    def test_round_trip_keeps_teams_and_turn_ring(self, catalog):
+        players = [Player(pid, catalog.build_deck(f"D{pid}", range(pid, pid + 8)))
+                   for pid in (1, 2, 3, 4)]
+        game = Game(players, Board([1, 2, 3, 4]), Rules(rounds_to_win=2),
+                    teams=[[1, 3], [2, 4]])
+        game.start_match()
+        for player in game.players.values():
+            player.draw_from_deck(4)
+        game.start_round()
+        game.play_card(1, 2, RowAffinity.MELEE)
+        game.pass_turn(2)
+
+        restored = Game.from_snapshot(game.to_snapshot(), catalog)
+
+        assert full_state(restored) == full_state(game)
+        assert restored.teams == game.teams
+        assert restored.next_player_id(1) == game.next_player_id(1) == 3
+
+    def test_rejects_bad_magic_version_and_truncation(self, game_mid_round, catalog):
+        data = game_mid_round.to_snapshot()
+
+        with pytest.raises(ValueError):
+            Game.from_snapshot(b"XXXX" + data[4:], catalog)
+        with pytest.raises(ValueError):
+            Game.from_snapshot(data[:4] + struct.pack("<B", SNAPSHOT_VERSION + 1)
+                               + data[5:], catalog)
+        with pytest.raises(ValueError):
+            Game.from_snapshot(data[:-3], catalog)
+        with pytest.raises(ValueError):
+            Game.from_snapshot(data + b"\x00", catalog)
+
+    def test_corrupted_player_index_raises(self, game_mid_round, catalog):
+        data = game_mid_round.to_snapshot()
+
+        # bajty 8, 9 i 12 nagłówka: aktywny, rozpoczynający, zwycięzca rundy
+        for offset, index in ((8, 2), (9, 5), (9, -1), (12, -7)):
+            corrupted = data[:offset] + struct.pack("<b", index) + data[offset + 1:]
+            with pytest.raises(ValueError, match="Invalid player"):
+                Game.from_snapshot(corrupted, catalog)
+
+    def test_unknown_card_id_raises(self, game_mid_round):
+        with pytest.raises(ValueError):
+            Game.from_snapshot(game_mid_round.to_snapshot(), CardCatalog())
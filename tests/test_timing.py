@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from src.card_duel.board import Board
+from src.card_duel.bots import RandomBot
+from src.card_duel.controller import GameController
+from src.card_duel.game import Game
+from src.card_duel.headless.renderer_null import RendererNull
+from src.card_duel.player import Player
+from src.card_duel.rules import Rules
+from src.card_duel.static_decks import make_static_decks
+from src.card_duel.timing import Histogram, PhaseTimer
+
+
+def make_game() -> Game:
+    """Pomocniczo: mecz na statycznych taliach (bez tasowania)."""
+    deck1, deck2 = make_static_decks()
+    return Game([Player(1, deck1), Player(2, deck2)], Board([1, 2]), Rules(rounds_to_win=2))
+
+
+class TestHistogram:
+
+    def test_record_and_percentiles(self):
+        histogram = Histogram()
+        for ns in (1, 2, 3, 1000, 1500):
+            histogram.record(ns)
+
+        assert histogram.count == 5
+        assert histogram.total_ns == 2506
+        assert (histogram.min_ns, histogram.max_ns) == (1, 1500)
+        # percentyl = górna granica kubełka potęgi dwójki
+        assert histogram.percentile_ns(50) == 3
+        assert histogram.percentile_ns(100) == 1500
+        assert histogram.serialize()["buckets"] == [[1, 1], [3, 2], [1023, 1], [2047, 1]]
+
+    def test_merge(self):
+        first, second = Histogram(), Histogram()
+        first.record(10)
+        second.record(5)
+        second.record(40)
+
+        first.merge(second)
+        first.merge(Histogram())
+
+        assert (first.count, first.min_ns, first.max_ns) == (3, 5, 40)
+
+
+class TestPhaseTimer:
+
+    def test_timed_records_even_when_call_raises(self):
+        timer = PhaseTimer()
+
+        def fail():
+            raise ValueError("boom")
+
+        timed = timer.timed(fail, "engine.fail")
+        with pytest.raises(ValueError):
+            timed()
+
+        assert timer.histograms["engine.fail"].count == 1
+
+    def test_controller_times_phases_and_exports_json(self, tmp_path):
+        game = make_game()
+        timer = PhaseTimer()
+        controller = GameController(game, RandomBot(seed=1), RendererNull(), timer=timer)
+
+        controller.run_match()
+
+        counts = {phase: h.count for phase, h in timer.histograms.items()}
+        assert counts["match"] == 1
+        assert counts["engine.start_round"] == game.current_round
+        assert counts["render.render_game_state"] == counts["input.choose_action"]
+        assert counts["engine.play_card"] + counts["engine.pass_turn"] >= counts["input.choose_action"]
+        assert counts["rules.is_round_over"] > counts["input.choose_action"]
+        assert timer.histograms["match"].total_ns >= timer.histograms["engine.play_card"].total_ns
+
+        path = tmp_path / "timings.json"
+        timer.write_json(str(path))
+        exported = json.loads(path.read_text())
+        assert exported["phases"]["match"]["count"] == 1
+
+    def test_timed_match_plays_like_untimed_and_resets_per_match(self):
+        timed_game, plain_game = make_game(), make_game()
+        timer = PhaseTimer()
+        GameController(timed_game, RandomBot(seed=7), RendererNull(), timer=timer).run_match()
+        GameController(plain_game, RandomBot(seed=7), RendererNull()).run_match()
+        total = PhaseTimer()
+        total.merge(timer)
+
+        GameController(make_game(), RandomBot(seed=7), RendererNull(), timer=timer).run_match()
+        total.merge(timer)
+
+        assert timed_game.serialize() == plain_game.serialize()
+        assert timer.histograms["match"].count == 1
+        assert total.histograms["match"].count == 2
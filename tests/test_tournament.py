@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from src.card_duel.bots import GreedyBot, RandomBot
+from src.card_duel.card import Card, RowAffinity
+from src.card_duel.deck import Deck
+from src.card_duel.tournament import (
+    SWISS,
+    EloRatings,
+    Entrant,
+    GlickoRatings,
+    Tournament,
+    format_table,
+    round_robin_pairings,
+    swiss_pairings,
+)
+
+
+def make_deck(name: str, first_id: int, power: int, n_cards: int = 12) -> Deck:
+    """Talia z kartami o stałej sile we wszystkich trzech rzędach."""
+    affinities = (RowAffinity.MELEE, RowAffinity.RANGED, RowAffinity.SIEGE)
+    return Deck(name, [Card(first_id + i, f"{name} {i}", power, affinities[i % 3], [])
+                       for i in range(n_cards)])
+
+
+def make_entrants(n: int = 3):
+    return [Entrant(f"Deck {i}", make_deck(f"Deck {i}", i * 100, 3 + i), GreedyBot)
+            for i in range(n)]
+
+
+class TestRatings:
+
+    def test_elo_is_zero_sum_and_rewards_winner(self):
+        elo = EloRatings(k=16)
+
+        elo.record("a", "b", [1.0, 1.0, 0.5])
+
+        assert elo.rating("a") > 1500 > elo.rating("b")
+        assert elo.rating("a") + elo.rating("b") == pytest.approx(3000)
+        assert elo.expected("a", "b") > 0.5
+
+    def test_glicko_moves_ratings_and_shrinks_deviation(self):
+        glicko = GlickoRatings()
+
+        glicko.record("a", "b", [1.0] * 8 + [0.0] * 2)
+
+        rating_a, rd_a = glicko.rating("a")
+        rating_b, rd_b = glicko.rating("b")
+        assert rating_a > 1500 > rating_b
+        assert rd_a < 350 and rd_b < 350
+        glicko.record("a", "b", [])
+        assert glicko.rating("a") == (rating_a, rd_a)
+
+
+class TestPairings:
+
+    def test_round_robin_pairs_everyone_once(self):
+        pairings = round_robin_pairings(["a", "b", "c", "d"])
+
+        assert len(pairings) == 6
+        assert len({frozenset(pair) for pair in pairings}) == 6
+
+    def test_swiss_avoids_rematches_and_rotates_byes(self):
+        played = {frozenset(("a", "b"))}
+
+        pairings = swiss_pairings(["a", "b", "c", "d", "e"], played, byes={"e"})
+
+        assert pairings == [("a", "c"), ("b", "e")]
+
+
+class TestTournament:
+
+    def test_round_robin_standings_add_up(self):
+        tournament = Tournament(make_entrants(), games_per_pairing=10, chunk_size=4, workers=1)
+
+        chunks = list(tournament.results())
+        table = tournament.table()
+
+        assert len(chunks) == 3 * 3
+        assert [row["games"] for row in table] == [20, 20, 20]
+        assert sum(row["wins"] for row in table) == sum(row["losses"] for row in table)
+        # najsilniejsza talia (stała siła kart) wygrywa turniej
+        assert table[0]["name"] == "Deck 2"
+        assert table[0]["elo"] > 1500 > table[-1]["elo"]
+        assert "Deck 2" in format_table(table)
+
+    def test_results_do_not_depend_on_chunking(self):
+        entrants = [Entrant("Random", make_deck("A", 0, 5), RandomBot),
+                    Entrant("Greedy", make_deck("B", 100, 5), GreedyBot)]
+
+        small = Tournament(entrants, games_per_pairing=12, chunk_size=5, workers=1, seed=3)
+        large = Tournament(entrants, games_per_pairing=12, chunk_size=12, workers=1, seed=3)
+        outcomes_small = b"".join(chunk.outcomes for chunk in small.results())
+        outcomes_large = b"".join(chunk.outcomes for chunk in large.results())
+
+        assert outcomes_small == outcomes_large
+
+    def test_swiss_with_process_pool_streams_results(self, tmp_path):
+        path = str(tmp_path / "results.jsonl")
+        tournament = Tournament(make_entrants(4), games_per_pairing=4, mode=SWISS,
+                                rounds=2, workers=2, results_path=path)
+
+        table = tournament.run()
+
+        with open(path, encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+        assert len(records) == tournament.chunks_done == 4
+        assert all(row["games"] == 8 for row in table)
+        assert len(tournament.played) == 4
+        assert set(records[0]["elo"]) == {records[0]["a"], records[0]["b"]}
+
+    def test_invalid_setup_is_rejected(self):
+        entrants = make_entrants(2)
+
+        with pytest.raises(ValueError):
+            Tournament(entrants[:1])
+        with pytest.raises(ValueError):
+            Tournament([entrants[0], entrants[0]])
+        with pytest.raises(ValueError):
+            Tournament(entrants, mode="knockout")
+        with pytest.raises(ValueError):
+            Tournament(entrants, games_per_pairing=0)